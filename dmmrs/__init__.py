@@ -0,0 +1,74 @@
+# Solvers for finite games in strategic form.
+#
+# Everything is exported lazily: `import dmmrs` loads no submodule, numpy is imported with the
+# first solver that is used, and scipy (LP-based solvers), nashpy (method='support') and Z3 (the
+# SMT backend) only by the functions that need them. This keeps short-lived worker processes
+# cheap to start.
+from importlib import import_module
+
+_EXPORTS = {
+    'StrategicFormGame': 'game',
+    'GameAnalysis': 'dominance',
+    'DominanceResult': 'dominance',
+    'BatchAnalysis': 'dominance',
+    'analyze_game_batch': 'dominance',
+    'dominance_relation': 'dominance',
+    'security_strategy': 'dominance',
+    'ReducedGame': 'elimination',
+    'eliminate_dominated_strategies': 'elimination',
+    'iter_pure_nash': 'pure',
+    'find_pure_nash': 'pure',
+    'is_constant_sum': 'bimatrix',
+    'solve_zero_sum': 'bimatrix',
+    'lemke_howson': 'bimatrix',
+    'vertex_enumeration': 'bimatrix',
+    'find_mixed_nash': 'bimatrix',
+    'iter_vertex_enumeration': 'bimatrix',
+    'iter_mixed_nash': 'bimatrix',
+    'expected_payoff_table': 'support',
+    'batch_expected_payoff_table': 'support',
+    'batch_regrets': 'support',
+    'iter_support_profiles': 'support',
+    'EquilibriumStore': 'store',
+    'GraphicalGame': 'graphical',
+    'PolymatrixGame': 'graphical',
+    'SymmetricGame': 'symmetric',
+    'SMTNashSolver': 'smt',
+    'iter_exact_equilibria': 'exact',
+    'is_exact_nash': 'exact',
+    'integer_payoffs': 'exact',
+    'bareiss_solve': 'exact',
+    'MutableGame': 'mutable',
+    'EquilibriumTracker': 'tracking',
+    'TrackingResult': 'tracking',
+    'CorrelatedEquilibrium': 'correlated',
+    'correlated_equilibrium': 'correlated',
+    'incentive_constraints': 'correlated',
+    'SolverStats': 'instrumentation',
+    'instrument': 'instrumentation',
+    'LearningResult': 'learning',
+    'GENERATORS': 'generators',
+    'run_benchmark': 'benchmark',
+    'fictitious_play': 'learning',
+    'regret_matching': 'learning',
+    'replicator_dynamics': 'learning',
+    'AnalysisCache': 'cache',
+    'CanonicalGame': 'cache',
+    'iter_games': 'stream',
+    'iter_solutions': 'stream',
+    'solve_game': 'stream',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
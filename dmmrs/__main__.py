@@ -0,0 +1,132 @@
+import argparse
+import sys
+
+
+def _solve(args):
+    import json
+    from .stream import iter_games, iter_solutions
+
+    def games():
+        for path in args.paths:
+            yield from iter_games(path, args.format)
+
+    cache = None
+    if args.cache_size or args.cache_dir:
+        from .cache import AnalysisCache
+        cache = AnalysisCache(args.cache_size, args.cache_dir)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        for record in iter_solutions(games(), args.analyses, args.jobs, args.window, args.ordered, cache):
+            # Flush every record so downstream consumers see results as soon as they exist
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if cache is not None:
+        print('cache: ' + json.dumps(cache.stats()), file=sys.stderr)
+
+
+def _bench(args):
+    from .benchmark import run_benchmark
+
+    def progress(entry):
+        outcome = entry.get('skipped') or entry.get('error') or f"{entry['seconds']:.4f}s  {entry['peak_bytes'] / 1024:.0f} KiB"
+        print(f"{entry['generator']:>18} {entry['n_players']}p x {entry['n_actions']}a  {entry['analysis']:<18} {outcome}",
+              file=sys.stderr)
+
+    run_benchmark(args.output, progress, generators=args.generators, players=args.players, actions=args.actions,
+                  analyses=args.analyses, repeat=args.repeat, seed=args.seed)
+
+
+def _compare(args):
+    import json
+    from .benchmark import compare
+
+    with open(args.baseline) as stream:
+        baseline = json.load(stream)
+    with open(args.current) as stream:
+        current = json.load(stream)
+    regressions = compare(baseline, current, args.threshold, args.min_seconds)
+    for regression in regressions:
+        print(json.dumps(regression))
+    # A non-zero exit status lets CI fail on regressions
+    return 1 if regressions else 0
+
+
+def _names(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def _integers(value):
+    return [int(name) for name in _names(value)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dmmrs', description='Strategic form game solvers')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    examples = commands.add_parser('examples', help='run the example games from the assignments')
+    examples.add_argument('names', nargs='*', help='examples to run (default: all)')
+
+    solve = commands.add_parser('solve', help='solve every game in .nfg/.npz/.npy/.jsonl files, one JSONL record per game')
+    solve.add_argument('paths', nargs='+', help="game files; '-' reads JSONL from standard input")
+    solve.add_argument('-f', '--format', choices=['nfg', 'npz', 'npy', 'jsonl'], help='input format (default: from the file suffix)')
+    solve.add_argument('-a', '--analyses', default='dominance,maxmin,pure,mixed',
+                       help='comma-separated analyses out of dominance, maxmin, pure, mixed (default: all)')
+    solve.add_argument('-j', '--jobs', type=int, default=1, help='worker processes, 0 for one per core (default: 1)')
+    solve.add_argument('--window', type=int, help='games read ahead of the slowest unfinished one (default: 4 per worker)')
+    solve.add_argument('--ordered', action='store_true', help='write records in input order instead of as they finish')
+    solve.add_argument('--cache-size', type=int, default=0,
+                       help='remember results of this many distinct games in memory, so repeats and relabelled copies are not re-solved')
+    solve.add_argument('--cache-dir', help='also keep results on disk in this directory, shared across runs and processes')
+    solve.add_argument('-o', '--output', default='-', help='output JSONL file (default: standard output)')
+
+    bench = commands.add_parser('bench', help='time every analysis on generated games and record peak memory')
+    bench.add_argument('-g', '--generators', type=_names, help='comma-separated game generators (default: all)')
+    bench.add_argument('-p', '--players', type=_integers, default=[2, 3], help='comma-separated player counts (default: 2,3)')
+    bench.add_argument('-n', '--actions', type=_integers, default=[2, 3, 4], help='comma-separated action counts (default: 2,3,4)')
+    bench.add_argument('-a', '--analyses', type=_names, help='comma-separated analyses (default: all)')
+    bench.add_argument('-r', '--repeat', type=int, default=3, help='timed runs per entry, the fastest is kept (default: 3)')
+    bench.add_argument('--seed', type=int, default=0, help='seed of the generated games (default: 0)')
+    bench.add_argument('-o', '--output', default='benchmark.json', help='result file (default: benchmark.json)')
+
+    regressions = commands.add_parser('compare', help='list regressions between two bench result files')
+    regressions.add_argument('baseline', help='earlier bench result file')
+    regressions.add_argument('current', help='later bench result file')
+    regressions.add_argument('-t', '--threshold', type=float, default=0.25,
+                             help='relative slowdown or memory growth that counts as a regression (default: 0.25)')
+    regressions.add_argument('--min-seconds', type=float, default=1e-3,
+                             help='timings below this are treated as noise (default: 0.001)')
+
+    args = parser.parse_args(argv)
+    if args.command == 'examples':
+        # Imported here so that `python -m dmmrs --help` does not load numpy
+        from .examples import EXAMPLES
+        for name in args.names or list(EXAMPLES):
+            if name not in EXAMPLES:
+                parser.error(f"unknown example {name!r}, choose from {', '.join(EXAMPLES)}")
+            EXAMPLES[name]()
+    elif args.command == 'solve':
+        args.analyses = [name.strip() for name in args.analyses.split(',') if name.strip()]
+        unknown = set(args.analyses) - {'dominance', 'maxmin', 'pure', 'mixed'}
+        if unknown:
+            parser.error(f"unknown analyses {', '.join(sorted(unknown))}")
+        args.jobs = None if args.jobs == 0 else args.jobs
+        _solve(args)
+    elif args.command == 'bench':
+        from .benchmark import ANALYSES
+        from .generators import GENERATORS
+        args.generators = args.generators or list(GENERATORS)
+        args.analyses = args.analyses or list(ANALYSES)
+        unknown = (set(args.generators) - set(GENERATORS)) | (set(args.analyses) - set(ANALYSES))
+        if unknown:
+            parser.error(f"unknown generators or analyses {', '.join(sorted(unknown))}")
+        _bench(args)
+    elif args.command == 'compare':
+        return _compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .generators import GENERATORS
+
+# Format of the result files; compare() refuses files of another version
+BENCHMARK_VERSION = 1
+
+
+def _analyses() -> Dict[str, Callable[[List[np.ndarray]], object]]:
+    # Every benchmarked analysis on a fresh game, so that nothing is served from a cache
+    from .bimatrix import find_mixed_nash
+    from .game import StrategicFormGame
+    from .smt import SMTNashSolver
+
+    def nashpy(payoffs):
+        import nashpy as nash
+        return list(nash.Game(*payoffs).support_enumeration())
+
+    return {
+        'dominance': lambda payoffs: StrategicFormGame(payoffs).analysis().dominance,
+        'maxmin': lambda payoffs: StrategicFormGame(payoffs).analysis().maxmin_values,
+        'mixed-maxmin': lambda payoffs: StrategicFormGame(payoffs).analysis().mixed_maxmin_values,
+        'elimination': lambda payoffs: StrategicFormGame(payoffs).reduce(),
+        'pure': lambda payoffs: StrategicFormGame(payoffs).find_pure_nash_equilibria(reduce=False),
+        'mixed-support': lambda payoffs: StrategicFormGame(payoffs).find_all_mixed_nash_equilibria(reduce=False),
+        'mixed-vertex': lambda payoffs: find_mixed_nash(payoffs, method='all'),
+        'mixed-lemke-howson': lambda payoffs: find_mixed_nash(payoffs, method='one'),
+        'mixed-nashpy': nashpy,
+        'mixed-smt': lambda payoffs: StrategicFormGame(payoffs).find_all_mixed_nash_equilibria(reduce=False, backend='smt'),
+        'mixed-smt-support': lambda payoffs: SMTNashSolver(payoffs).find_all_equilibria(mode='support'),
+        'mixed-exact': lambda payoffs: StrategicFormGame(payoffs).find_all_mixed_nash_equilibria(reduce=False, backend='exact'),
+        'correlated': lambda payoffs: StrategicFormGame(payoffs).find_correlated_equilibrium(),
+    }
+
+
+ANALYSES = ('dominance', 'maxmin', 'mixed-maxmin', 'elimination', 'pure', 'mixed-support', 'mixed-vertex',
+            'mixed-lemke-howson', 'mixed-nashpy', 'mixed-smt', 'mixed-smt-support', 'mixed-exact',
+            'correlated')
+
+# Analyses restricted to two-player games, and the largest games (in pure profiles) each analysis
+# is run on: exact enumeration grows exponentially and would dominate a sweep
+TWO_PLAYER_ANALYSES = {'mixed-vertex', 'mixed-lemke-howson', 'mixed-nashpy'}
+# The SMT entries are capped lower: with three players they solve polynomial systems exactly,
+# which takes minutes on 3x3x3 games with float payoffs
+MAX_PROFILES = {'mixed-support': 256, 'mixed-vertex': 400, 'mixed-nashpy': 100, 'mixed-smt': 16,
+                'mixed-smt-support': 16, 'mixed-exact': 256}
+
+
+def _result_size(result) -> Optional[int]:
+    return len(result) if isinstance(result, (list, tuple)) else None
+
+
+def _measure(analysis: Callable, payoffs: List[np.ndarray], repeat: int) -> dict:
+    # Wall time over repeat runs, then peak Python heap (numpy buffers included) in one separate
+    # run: tracemalloc slows allocation down and would distort the timings
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = analysis(payoffs)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        analysis(payoffs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times), 'median_seconds': float(np.median(times)), 'peak_bytes': peak,
+            'result_size': _result_size(result)}
+
+
+def iter_benchmark(generators: Sequence[str] = tuple(GENERATORS), players: Sequence[int] = (2, 3),
+                   actions: Sequence[int] = (2, 3, 4), analyses: Sequence[str] = ANALYSES,
+                   repeat: int = 3, seed: int = 0) -> Iterator[dict]:
+    # One record per (generator, players, actions, analysis). Games are seeded by their position in
+    # the sweep, so every run benchmarks the same games. Analyses that do not apply are recorded as
+    # skipped and failures as errors, so a sweep always runs to the end.
+    table = _analyses()
+    for generator in generators:
+        for n_players in players:
+            for n_actions in actions:
+                shape = [n_actions] * n_players
+                record = {'generator': generator, 'n_players': n_players, 'n_actions': n_actions}
+                try:
+                    payoffs = GENERATORS[generator](shape, np.random.default_rng([seed, n_players, n_actions]))
+                except ValueError as error:
+                    for analysis in analyses:
+                        yield dict(record, analysis=analysis, skipped=str(error))
+                    continue
+                for analysis in analyses:
+                    entry = dict(record, analysis=analysis)
+                    if analysis in TWO_PLAYER_ANALYSES and n_players != 2:
+                        entry['skipped'] = 'two-player games only'
+                    elif n_actions ** n_players > MAX_PROFILES.get(analysis, np.inf):
+                        entry['skipped'] = f'more than {MAX_PROFILES[analysis]} profiles'
+                    else:
+                        try:
+                            entry.update(_measure(table[analysis], payoffs, repeat))
+                        except ImportError as error:
+                            entry['skipped'] = str(error)
+                        except Exception as error:
+                            entry['error'] = f'{type(error).__name__}: {error}'
+                    yield entry
+
+
+def run_benchmark(path: Optional[str] = None, progress: Optional[Callable[[dict], None]] = None, **options) -> dict:
+    # Runs the sweep and, with a path, writes it as JSON; progress(entry) sees each record
+    results = []
+    for entry in iter_benchmark(**options):
+        results.append(entry)
+        if progress is not None:
+            progress(entry)
+    report = {
+        'version': BENCHMARK_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'options': options,
+        'results': results,
+    }
+    if path is not None:
+        with open(path, 'w') as stream:
+            json.dump(report, stream, indent=1)
+    return report
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25, min_seconds: float = 1e-3) -> List[dict]:
+    # Entries of current that got slower or needed more memory than baseline by more than
+    # threshold (0.25 = 25%), or that newly fail. Timings below min_seconds are noise and ignored.
+    for report in (baseline, current):
+        if report.get('version') != BENCHMARK_VERSION:
+            raise ValueError(f"Unsupported benchmark file version {report.get('version')!r}")
+
+    fields = ('generator', 'n_players', 'n_actions', 'analysis')
+    previous = {tuple(entry[field] for field in fields): entry for entry in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        identity = {field: entry[field] for field in fields}
+        old = previous.get(tuple(identity.values()))
+        if old is None or 'skipped' in entry or 'skipped' in old:
+            continue
+        if 'error' in entry:
+            if 'error' not in old:
+                regressions.append(dict(identity, metric='error', baseline=None, current=entry['error']))
+            continue
+        if 'error' in old:
+            continue
+        for metric, floor in (('seconds', min_seconds), ('peak_bytes', 0)):
+            if entry[metric] > max(old[metric], floor) * (1.0 + threshold):
+                regressions.append(dict(identity, metric=metric, baseline=old[metric], current=entry[metric],
+                                        ratio=entry[metric] / old[metric] if old[metric] else None))
+    return regressions
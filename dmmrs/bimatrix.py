@@ -0,0 +1,319 @@
+import numpy as np
+from collections import deque
+from fractions import Fraction
+
+from .instrumentation import active_stats, phase
+from .limits import bounded, stop_requested
+from .pure import find_pure_nash
+
+
+def is_constant_sum(payoff_matrices, tolerance=1e-9):
+    # Two-player games whose payoffs add up to the same constant in every cell
+    if len(payoff_matrices) != 2:
+        return False
+    total = np.asarray(payoff_matrices[0]) + np.asarray(payoff_matrices[1])
+    return bool(np.ptp(total) <= tolerance)
+
+
+def solve_zero_sum(payoff_matrix):
+    # One LP for the row player's maxmin strategy: maximize v s.t. x . A[:, j] >= v for all j.
+    # Its dual multipliers are the column player's minmax strategy, so both come from one solve.
+    from scipy.optimize import linprog
+
+    payoffs = np.asarray(payoff_matrix, dtype=float)
+    n_rows, n_cols = payoffs.shape
+
+    objective = np.zeros(n_rows + 1)
+    objective[-1] = -1.0
+    A_ub = np.hstack([-payoffs.T, np.ones((n_cols, 1))])
+    A_eq = np.append(np.ones(n_rows), 0.0)[None, :]
+    bounds = [(0, None)] * n_rows + [(None, None)]
+
+    result = linprog(objective, A_ub=A_ub, b_ub=np.zeros(n_cols), A_eq=A_eq, b_eq=[1.0], bounds=bounds, method='highs')
+    stats = active_stats()
+    if stats is not None:
+        stats.count('linear_programs_solved')
+    if not result.success:
+        raise RuntimeError(f"Zero-sum LP failed: {result.message}")
+
+    row_strategy = np.clip(result.x[:n_rows], 0, None)
+    col_strategy = np.clip(-result.ineqlin.marginals, 0, None)
+    return result.x[-1] + 0.0, row_strategy / row_strategy.sum(), col_strategy / col_strategy.sum()
+
+
+def _positive_payoffs(payoff_matrix, exact):
+    # Shift payoffs so every entry is at least 1; equilibria are invariant under this shift
+    payoffs = np.asarray(payoff_matrix)
+    if exact:
+        if not np.array_equal(payoffs, np.round(payoffs)):
+            raise ValueError("Exact pivoting needs integer payoffs")
+        payoffs = np.round(payoffs).astype(np.int64)
+        return (payoffs - payoffs.min() + 1).astype(object)
+    payoffs = payoffs.astype(float)
+    return payoffs - payoffs.min() + 1.0
+
+
+def _make_tableau(constraints, exact):
+    # [constraints | I | 1]: one row per inequality constraints @ z <= 1, slacks start basic
+    n_rows = constraints.shape[0]
+    identity = np.eye(n_rows, dtype=np.int64).astype(object) if exact else np.eye(n_rows)
+    ones = np.ones((n_rows, 1), dtype=np.int64).astype(object) if exact else np.ones((n_rows, 1))
+    return np.hstack([constraints, identity, ones])
+
+
+def _min_ratio_row(tableau, column, slack_columns, exact, tolerance=1e-12):
+    # Lexicographic minimum ratio test: ties on the right-hand side are broken on the slack
+    # columns, which keeps Lemke-Howson from cycling on degenerate games
+    candidates = np.flatnonzero(tableau[:, column] > (0 if exact else tolerance))
+    for ratio_column in [-1] + list(slack_columns):
+        if exact:
+            ratios = [Fraction(int(tableau[row, ratio_column]), int(tableau[row, column])) for row in candidates]
+            best = min(ratios)
+            candidates = candidates[[ratio == best for ratio in ratios]]
+        else:
+            ratios = tableau[candidates, ratio_column] / tableau[candidates, column]
+            candidates = candidates[ratios <= ratios.min() + tolerance]
+        if len(candidates) == 1:
+            break
+    return candidates[0]
+
+
+def _pivot(tableau, row, column, exact, determinant):
+    # Float tableaux are normalized on the pivot row; integer tableaux use fraction-free
+    # pivoting, where dividing by the previous pivot element is always exact
+    if exact:
+        pivot_element = tableau[row, column]
+        pivoted = (tableau * pivot_element - np.multiply.outer(tableau[:, column], tableau[row])) // determinant
+        pivoted[row] = tableau[row]
+        tableau[:] = pivoted
+        return pivot_element
+    tableau[row] /= tableau[row, column]
+    pivot_row = tableau[row].copy()
+    tableau -= np.outer(tableau[:, column], pivot_row)
+    tableau[row] = pivot_row
+    return determinant
+
+
+def _basic_values(tableau, basis, n_variables, exact):
+    # Values of the first n_variables columns at the tableau's current vertex
+    values = np.zeros(n_variables)
+    for row, column in enumerate(basis):
+        if column < n_variables:
+            values[column] = float(Fraction(int(tableau[row, -1]), int(tableau[row, column]))) if exact else tableau[row, -1]
+    return values
+
+
+def lemke_howson(payoff_matrices, initial_dropped_label=0, exact=False):
+    # Complementary pivoting on the best-response polytopes
+    #   P = {x >= 0 : B^T x <= 1}   labels: x_i = 0 -> i,  (B^T x)_j = 1 -> m + j
+    #   Q = {y >= 0 : A y <= 1}     labels: (A y)_i = 1 -> i,  y_j = 0 -> m + j
+    # starting from the artificial equilibrium (0, 0) and dropping initial_dropped_label.
+    # exact=True pivots on integer tableaux (integer payoffs only) instead of floats.
+    A = _positive_payoffs(payoff_matrices[0], exact)
+    B = _positive_payoffs(payoff_matrices[1], exact)
+    n_rows, n_cols = A.shape
+    if not 0 <= initial_dropped_label < n_rows + n_cols:
+        raise ValueError(f"initial_dropped_label must be in [0, {n_rows + n_cols})")
+
+    # Tableau columns are indexed so that column == label in P; in Q, y_j is column j and the
+    # slack of row i is column n_cols + i
+    row_tableau = _make_tableau(B.T, exact)
+    col_tableau = _make_tableau(A, exact)
+    tableaux = {
+        'P': {'tableau': row_tableau, 'basis': list(range(n_rows, n_rows + n_cols)), 'determinant': 1,
+              'column': lambda label: label, 'label': lambda column: column,
+              'slacks': range(n_rows, n_rows + n_cols)},
+        'Q': {'tableau': col_tableau, 'basis': list(range(n_cols, n_cols + n_rows)), 'determinant': 1,
+              'column': lambda label: label - n_rows if label >= n_rows else n_cols + label,
+              'label': lambda column: column + n_rows if column < n_cols else column - n_cols,
+              'slacks': range(n_cols, n_cols + n_rows)},
+    }
+
+    entering = initial_dropped_label
+    side = 'P' if entering < n_rows else 'Q'
+    stats = active_stats()
+    while True:
+        if stats is not None:
+            stats.count('pivots')
+        state = tableaux[side]
+        column = state['column'](entering)
+        row = _min_ratio_row(state['tableau'], column, state['slacks'], exact)
+        leaving = state['label'](state['basis'][row])
+        state['determinant'] = _pivot(state['tableau'], row, column, exact, state['determinant'])
+        state['basis'][row] = column
+        if leaving == initial_dropped_label:
+            break
+        # The leaving label is now duplicated, so it enters the other polytope next
+        entering = leaving
+        side = 'Q' if side == 'P' else 'P'
+
+    x = _basic_values(row_tableau, tableaux['P']['basis'], n_rows, exact)
+    y = _basic_values(col_tableau, tableaux['Q']['basis'], n_cols, exact)
+    return x / x.sum(), y / y.sum()
+
+
+def _iter_polytope_vertices(constraints, tolerance=1e-9, deadline=None, cancel=None):
+    # All vertices of {z >= 0 : constraints @ z <= 1}, by a breadth-first walk over feasible bases
+    # from the origin. Yields (vertex, tight-constraint mask) pairs as they are first reached, where
+    # bit k of the mask is set when z_k = 0 for k < n_variables and when row k - n_variables is
+    # tight otherwise. deadline and cancel are checked before every basis.
+    n_constraints, n_variables = constraints.shape
+    system = np.hstack([constraints, np.eye(n_constraints)])
+    rhs = np.ones(n_constraints)
+
+    start = tuple(range(n_variables, n_variables + n_constraints))
+    seen = {start}
+    queue = deque([start])
+    vertices = set()
+    stats = active_stats()
+    while queue:
+        if stop_requested(deadline, cancel):
+            return
+        basis = queue.popleft()
+        if stats is not None:
+            stats.count('bases_visited')
+        basis_matrix = system[:, basis]
+        tableau = np.linalg.solve(basis_matrix, np.hstack([system, rhs[:, None]]))
+        values = np.zeros(n_variables + n_constraints)
+        values[list(basis)] = tableau[:, -1]
+
+        key = tuple(np.round(values[:n_variables] / tolerance).astype(np.int64))
+        if key not in vertices:
+            vertices.add(key)
+            mask = 0
+            for k in np.flatnonzero(np.abs(values) <= tolerance):
+                mask |= 1 << int(k)
+            yield np.clip(values[:n_variables], 0, None), mask
+
+        # Neighbouring bases: every entering column and every row tied in the ratio test
+        for column in range(n_variables + n_constraints):
+            if column in basis:
+                continue
+            positive = np.flatnonzero(tableau[:, column] > tolerance)
+            if not len(positive):
+                continue
+            ratios = tableau[positive, -1] / tableau[positive, column]
+            for row in positive[ratios <= ratios.min() + tolerance]:
+                neighbour = list(basis)
+                neighbour[row] = column
+                neighbour = tuple(sorted(neighbour))
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+
+
+def iter_vertex_enumeration(payoff_matrices, limit=None, deadline=None, cancel=None):
+    # Every extreme equilibrium: a pair of non-zero vertices x of P and y of Q is an equilibrium
+    # exactly when together they carry all m + n labels. Q's vertices are collected first, grouped
+    # by labels; P is then walked lazily and the equilibria of each of its vertices are yielded
+    # right away, in the same order as vertex_enumeration. See dmmrs.limits for the keywords.
+    A = _positive_payoffs(payoff_matrices[0], exact=False)
+    B = _positive_payoffs(payoff_matrices[1], exact=False)
+    n_rows, n_cols = A.shape
+    all_labels = (1 << (n_rows + n_cols)) - 1
+    if limit is not None and limit <= 0:
+        return
+
+    # Re-express both polytopes' tight-constraint masks in the shared label numbering
+    col_vertices = {}
+    for y, mask in _iter_polytope_vertices(A, deadline=deadline, cancel=cancel):
+        if y.sum() > 0:
+            # In Q, y_j = 0 is label m + j and a tight row i is label i
+            labels = ((mask & ((1 << n_cols) - 1)) << n_rows) | (mask >> n_cols)
+            col_vertices.setdefault(labels, []).append(y)
+    if stop_requested(deadline, cancel):
+        return
+    n_col_vertices = sum(len(ys) for ys in col_vertices.values())
+
+    stats = active_stats()
+    found = 0
+    for x, labels in _iter_polytope_vertices(B.T, deadline=deadline, cancel=cancel):
+        if x.sum() == 0:
+            continue
+        if stats is not None:
+            stats.count('vertex_pairs_checked', n_col_vertices)
+        missing = all_labels & ~labels
+        for col_labels, ys in col_vertices.items():
+            if col_labels & missing == missing:
+                for y in ys:
+                    yield x / x.sum(), y / y.sum()
+                    found += 1
+                    if found == limit:
+                        return
+
+
+def vertex_enumeration(payoff_matrices):
+    return list(iter_vertex_enumeration(payoff_matrices))
+
+
+def find_mixed_nash(payoff_matrices, method='all', initial_dropped_label=0):
+    # method='all': every extreme equilibrium by vertex enumeration
+    # method='one': a single equilibrium by Lemke-Howson from initial_dropped_label
+    # method='support': nashpy support enumeration (needs nashpy installed)
+    if len(payoff_matrices) != 2:
+        raise ValueError("find_mixed_nash supports two-player games only")
+
+    if method == 'one':
+        # Constant-sum games: every equilibrium is a pair of security strategies, so one LP gives
+        # one. Not for 'all': degenerate zero-sum games have several extreme equilibria.
+        if is_constant_sum(payoff_matrices):
+            with phase('zero-sum-lp'):
+                _, row_strategy, col_strategy = solve_zero_sum(payoff_matrices[0])
+            return [(row_strategy, col_strategy)]
+        with phase('lemke-howson'):
+            return [lemke_howson(payoff_matrices, initial_dropped_label)]
+    if method == 'all':
+        with phase('vertex-enumeration'):
+            return vertex_enumeration(payoff_matrices)
+    if method == 'support':
+        import nashpy as nash
+        return list(nash.Game(*payoff_matrices).support_enumeration())
+    raise ValueError(f"Unknown method {method!r}")
+
+
+def iter_mixed_nash(payoff_matrices, method='all', initial_dropped_label=0, limit=None, deadline=None, cancel=None):
+    # Lazy find_mixed_nash: the same methods, yielding each equilibrium as soon as it is found.
+    # next(iter_mixed_nash(game), None) stops after the first one. See dmmrs.limits for limit,
+    # deadline and cancel; method='support' applies them between nashpy's equilibria.
+    if len(payoff_matrices) != 2:
+        raise ValueError("iter_mixed_nash supports two-player games only")
+    if method not in ('one', 'all', 'support'):
+        raise ValueError(f"Unknown method {method!r}")
+
+    def single():
+        # Constant-sum games: every equilibrium is a pair of security strategies, found by one LP
+        if is_constant_sum(payoff_matrices):
+            yield tuple(solve_zero_sum(payoff_matrices[0])[1:])
+        else:
+            yield lemke_howson(payoff_matrices, initial_dropped_label)
+
+    if method == 'one':
+        yield from bounded(single(), limit, deadline, cancel)
+    elif method == 'all':
+        yield from iter_vertex_enumeration(payoff_matrices, limit, deadline, cancel)
+    else:
+        import nashpy as nash
+        yield from bounded(nash.Game(*payoff_matrices).support_enumeration(), limit, deadline, cancel)
+
+
+def analyze_game(payoff_matrices):
+    print("Analyzing game...")
+    print(f"Number of players: {len(payoff_matrices)}")
+    
+    # Find pure Nash equilibria
+    pure_nash = find_pure_nash(payoff_matrices)
+    print("\nPure Strategy Nash Equilibria:")
+    if pure_nash:
+        for i, eq in enumerate(pure_nash, 1):
+            print(f"{i}. {eq}")
+    else:
+        print("No pure strategy Nash equilibrium found.")
+    
+    # Find mixed Nash equilibria
+    mixed_nash = find_mixed_nash(payoff_matrices)
+    print("\nMixed Strategy Nash Equilibria:")
+    if mixed_nash:
+        for i, eq in enumerate(mixed_nash, 1):
+            print(f"{i}. " + " | ".join([f"Player {p+1}: {strategy.round(3)}" for p, strategy in enumerate(eq)]))
+    else:
+        print("No mixed strategy Nash equilibrium found.")
@@ -0,0 +1,224 @@
+import hashlib
+import itertools
+import json
+import math
+import os
+import tempfile
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Bump when solver output changes so that stale on-disk entries stop matching
+CACHE_VERSION = 1
+
+
+def _action_colours(stack: np.ndarray, axis: int, colours: List[np.ndarray]) -> np.ndarray:
+    # One refinement step for the actions on one axis: an action's signature is the sorted list of
+    # (payoff vector, colours of the other players' actions) over every profile it appears in
+    n_players = stack.shape[0]
+    n_actions = stack.shape[axis + 1]
+    columns = [np.moveaxis(stack[p], axis, 0).reshape(n_actions, -1) for p in range(n_players)]
+    for other in range(n_players):
+        if other != axis:
+            shape = [1] * n_players
+            shape[other] = len(colours[other])
+            grid = np.broadcast_to(colours[other].reshape(shape), stack.shape[1:])
+            columns.append(np.moveaxis(grid, axis, 0).reshape(n_actions, -1).astype(float))
+    rows = np.stack(columns, axis=2)
+
+    signatures = []
+    for action in range(n_actions):
+        profiles = rows[action]
+        order = np.lexsort(profiles.T[::-1])
+        signatures.append(profiles[order].tobytes())
+    # Colour = rank of the signature, so colours are comparable across games
+    ranks = {signature: rank for rank, signature in enumerate(sorted(set(signatures)))}
+    return np.array([ranks[signature] for signature in signatures])
+
+
+def _refine(stack: np.ndarray) -> List[np.ndarray]:
+    # Colour refinement until the number of action colours stops growing
+    n_players = stack.shape[0]
+    colours = [np.zeros(n, dtype=np.int64) for n in stack.shape[1:]]
+    n_colours = n_players
+    for _ in range(max(stack.shape[1:]) + 1):
+        colours = [_action_colours(stack, axis, colours) for axis in range(n_players)]
+        refined = sum(len(np.unique(c)) for c in colours)
+        if refined == n_colours:
+            break
+        n_colours = refined
+    return colours
+
+
+def _tie_orders(keys: list, limit: int) -> List[List[int]]:
+    # Every order of range(len(keys)) sorted by key, with tied items in all their arrangements;
+    # only the stable order once there would be more than limit of them
+    order = sorted(range(len(keys)), key=lambda i: keys[i])
+    groups = [list(group) for _, group in itertools.groupby(order, key=lambda i: keys[i])]
+    if np.prod([math.factorial(len(group)) for group in groups], dtype=float) > limit:
+        return [order]
+    return [[i for arrangement in arrangements for i in arrangement]
+            for arrangements in itertools.product(*[itertools.permutations(group) for group in groups])]
+
+
+class CanonicalGame:
+    # A game with its players and actions put in a canonical order, and the maps back:
+    # canonical player k is original player players[k], and its canonical action j is original
+    # action actions[k][j]. Players are sorted by their payoff multisets and actions by colour
+    # refinement on the payoffs. Ties that remain are broken by trying every arrangement of the
+    # tied items and keeping the smallest tensor, up to MAX_TIE_ORDERS arrangements; beyond that
+    # ties keep their input order, so relabelled copies of a very symmetric game may get
+    # different canonical forms (a cache miss, never a wrong hit).
+    MAX_TIE_ORDERS = 720
+
+    def __init__(self, payoff_matrices: List[np.ndarray]):
+        payoffs = [np.asarray(matrix) for matrix in payoff_matrices]
+        n_players = len(payoffs)
+        shape = payoffs[0].shape
+
+        player_keys = [(shape[p], np.sort(payoffs[p].astype(float), axis=None).tobytes()) for p in range(n_players)]
+        player_orders = _tie_orders(player_keys, self.MAX_TIE_ORDERS)
+        best = None
+        for players in player_orders:
+            stack = np.stack([np.transpose(payoffs[p], players) for p in players]).astype(float) + 0.0
+            colours = _refine(stack)
+            limit = self.MAX_TIE_ORDERS // len(player_orders)
+            action_orders = [_tie_orders(c.tolist(), limit) for c in colours]
+            if np.prod([len(orders) for orders in action_orders], dtype=float) > limit:
+                action_orders = [orders[:1] for orders in action_orders]
+            for actions in itertools.product(*action_orders):
+                candidate = stack[(slice(None),) + np.ix_(*actions)].tobytes()
+                if best is None or candidate < best[0]:
+                    best = (candidate, players, [np.asarray(order) for order in actions])
+
+        _, self.players, self.actions = best
+        self.payoff_matrices = [np.transpose(payoffs[p], self.players)[np.ix_(*self.actions)] for p in self.players]
+
+    def key(self, options=None) -> str:
+        # Content hash of the canonical payoffs and the analysis options
+        digest = hashlib.sha256()
+        digest.update(json.dumps([CACHE_VERSION, options], sort_keys=True, default=str).encode())
+        digest.update(json.dumps([list(self.payoff_matrices[0].shape), np.result_type(*self.payoff_matrices).str]).encode())
+        for matrix in self.payoff_matrices:
+            digest.update(np.ascontiguousarray(matrix, dtype=float).tobytes())
+        return digest.hexdigest()
+
+    def to_original_actions(self, player: int, actions) -> List[int]:
+        return sorted(int(self.actions[player][a]) for a in actions)
+
+    def to_original_profile(self, profile) -> Tuple[int, ...]:
+        original = [0] * len(self.players)
+        for k, action in enumerate(profile):
+            original[self.players[k]] = int(self.actions[k][action])
+        return tuple(original)
+
+    def to_original_strategy(self, player: int, strategy) -> np.ndarray:
+        original = np.zeros(len(self.actions[player]))
+        original[self.actions[player]] = strategy
+        return original
+
+    def _per_player(self, values) -> list:
+        original = [None] * len(self.players)
+        for k, value in enumerate(values):
+            original[self.players[k]] = value
+        return original
+
+    def to_original_record(self, record: dict) -> dict:
+        # Map a solve_game record computed on the canonical game back to the original game
+        mapped = dict(record)
+        for field in ('actions', 'maxmin_values', 'mixed_maxmin_values'):
+            if field in record:
+                mapped[field] = self._per_player(record[field])
+        for field in ('strong_dominant', 'weak_dominant', 'maxmin_strategies'):
+            if field in record:
+                mapped[field] = self._per_player([self.to_original_actions(k, a) for k, a in enumerate(record[field])])
+        for field in ('strong_equilibria', 'weak_equilibria', 'pure_nash'):
+            if field in record:
+                mapped[field] = sorted(list(self.to_original_profile(profile)) for profile in record[field])
+        if 'mixed_maxmin_strategies' in record:
+            mapped['mixed_maxmin_strategies'] = self._per_player(
+                [self.to_original_strategy(k, s).tolist() for k, s in enumerate(record['mixed_maxmin_strategies'])])
+        if 'mixed_nash' in record:
+            mapped['mixed_nash'] = [self._per_player([self.to_original_strategy(k, s).tolist() for k, s in enumerate(eq)])
+                                    for eq in record['mixed_nash']]
+        return mapped
+
+
+class AnalysisCache:
+    # Memoizes solve_game records by content: a bounded in-memory LRU tier in front of an optional
+    # on-disk tier (one JSON file per entry, shared safely between processes). Records are stored
+    # for the canonical form of a game, so games that differ only by a relabelling of actions or
+    # players share one entry; lookups map the record back to the caller's labelling.
+    def __init__(self, max_entries: int = 1024, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: 'OrderedDict[str, dict]' = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key: str) -> Optional[dict]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.directory is not None:
+            try:
+                with open(self._path(key)) as stream:
+                    record = json.load(stream)
+            except (OSError, ValueError):
+                pass
+            else:
+                self.disk_hits += 1
+                self._remember(key, record)
+                return record
+        self.misses += 1
+        return None
+
+    def _remember(self, key: str, record: dict):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = record
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key: str, record: dict):
+        self._remember(key, record)
+        if self.directory is not None:
+            # Write to a temporary file and rename, so readers never see a partial entry
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(descriptor, 'w') as stream:
+                json.dump(record, stream)
+            os.replace(temporary, path)
+
+    def prepare(self, payoff_matrices: List[np.ndarray], analyses: Sequence[str]) -> Tuple[str, CanonicalGame]:
+        canonical = CanonicalGame(payoff_matrices)
+        return canonical.key({'analyses': sorted(analyses)}), canonical
+
+    def solve(self, payoff_matrices: List[np.ndarray], analyses: Optional[Sequence[str]] = None) -> dict:
+        from .stream import ANALYSES, solve_game
+
+        analyses = ANALYSES if analyses is None else analyses
+        key, canonical = self.prepare(payoff_matrices, analyses)
+        record = self.get(key)
+        if record is None:
+            record = solve_game(canonical.payoff_matrices, analyses)
+            self.put(key, record)
+        return canonical.to_original_record(record)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses, 'entries': len(self._entries),
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0}
@@ -0,0 +1,90 @@
+import numpy as np
+from collections import namedtuple
+from typing import List, Union
+
+from .instrumentation import active_stats, phase
+
+# distribution: probability of each pure profile, shaped like the payoff tensors
+# payoffs: expected payoff of each player under the distribution, welfare: their sum
+CorrelatedEquilibrium = namedtuple('CorrelatedEquilibrium', ['distribution', 'payoffs', 'welfare'])
+
+
+def incentive_constraints(payoff_matrices: List[np.ndarray]):
+    # Sparse matrix A with one row per (player, recommended action a, deviation b != a) and one
+    # column per pure profile (C order), such that a distribution p is a correlated equilibrium iff
+    # A @ p >= 0: row (i, a, b) holds u_i(a, s_-i) - u_i(b, s_-i) at the profiles (a, s_-i).
+    # The CSR arrays are filled directly from whole payoff slices, one recommended action at a
+    # time, so peak memory stays near the sum_i (n_i - 1) * prod(n) stored entries.
+    from scipy.sparse import csr_matrix
+
+    payoffs = [np.asarray(matrix, dtype=float) for matrix in payoff_matrices]
+    shape = payoffs[0].shape
+    n_profiles = int(np.prod(shape))
+    index_type = np.int32 if n_profiles < np.iinfo(np.int32).max else np.int64
+    index = np.arange(n_profiles, dtype=index_type).reshape(shape)
+
+    capacity = sum((n - 1) * n_profiles for n in shape)
+    values = np.empty(capacity)
+    columns = np.empty(capacity, dtype=index_type)
+    row_starts = [0]
+    filled = 0
+    for player, matrix in enumerate(payoffs):
+        n_actions = shape[player]
+        slices = np.moveaxis(matrix, player, 0).reshape(n_actions, -1)
+        profiles = np.moveaxis(index, player, 0).reshape(n_actions, -1)
+        for recommended in range(n_actions):
+            # Profiles with the player's axis fixed keep C order, so each row's columns are sorted
+            deviations = np.delete(np.arange(n_actions), recommended)
+            gains = slices[recommended] - slices[deviations]
+            for gain in gains:
+                nonzero = np.flatnonzero(gain)
+                values[filled:filled + len(nonzero)] = gain[nonzero]
+                columns[filled:filled + len(nonzero)] = profiles[recommended, nonzero]
+                filled += len(nonzero)
+                row_starts.append(filled)
+
+    return csr_matrix((values[:filled], columns[:filled], np.array(row_starts, dtype=np.int64)),
+                      shape=(len(row_starts) - 1, n_profiles))
+
+
+def correlated_equilibrium(payoff_matrices: List[np.ndarray], objective: Union[str, np.ndarray] = 'welfare') -> CorrelatedEquilibrium:
+    # One LP over the distribution on pure profiles, polynomial in the size of the game.
+    # objective: 'welfare' maximizes the sum of expected payoffs, 'feasible' returns any correlated
+    # equilibrium, and an array shaped like the game is a linear objective to maximize.
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix
+
+    payoffs = [np.asarray(matrix, dtype=float) for matrix in payoff_matrices]
+    shape = payoffs[0].shape
+    n_profiles = int(np.prod(shape))
+
+    if isinstance(objective, str):
+        if objective == 'welfare':
+            weights = np.sum(payoffs, axis=0).ravel()
+        elif objective == 'feasible':
+            weights = np.zeros(n_profiles)
+        else:
+            raise ValueError(f"Unknown objective {objective!r}, expected 'welfare', 'feasible' or an array")
+    else:
+        weights = np.asarray(objective, dtype=float).ravel()
+        if weights.shape != (n_profiles,):
+            raise ValueError(f"Objective has incorrect shape. Expected {shape}, got {np.shape(objective)}")
+
+    # linprog minimizes and takes A_ub @ x <= b_ub, so both signs flip (in place, the matrix is ours)
+    with phase('correlated-constraints'):
+        constraints = incentive_constraints(payoffs)
+        constraints.data *= -1.0
+    stats = active_stats()
+    if stats is not None:
+        stats.count('constraint_nonzeros', constraints.nnz)
+        stats.count('linear_programs_solved')
+    with phase('correlated-lp'):
+        result = linprog(-weights, A_ub=constraints, b_ub=np.zeros(constraints.shape[0]),
+                         A_eq=csr_matrix(np.ones((1, n_profiles))), b_eq=[1.0], bounds=(0, None), method='highs')
+    if not result.success:
+        raise RuntimeError(f"Correlated equilibrium LP failed: {result.message}")
+
+    distribution = np.clip(result.x, 0.0, None)
+    distribution /= distribution.sum()
+    expected = np.array([float(matrix.ravel() @ distribution) for matrix in payoffs])
+    return CorrelatedEquilibrium(distribution.reshape(shape), expected, float(expected.sum()))
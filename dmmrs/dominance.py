@@ -0,0 +1,267 @@
+import numpy as np
+from collections import namedtuple
+from functools import cached_property
+from itertools import product
+
+from .elimination import eliminate_dominated_strategies
+from .instrumentation import active_stats, phase
+
+# Upper bound on the number of comparisons held in memory at once
+DOMINANCE_CHUNK_ELEMENTS = 1 << 22
+
+# strong/weak: dominant strategies per player
+# strict_relations/weak_relations: per player boolean matrices where [i, j] means
+# strategy i strictly (resp. weakly, i.e. >= everywhere) dominates strategy j
+DominanceResult = namedtuple('DominanceResult', ['strong', 'weak', 'strict_relations', 'weak_relations'])
+
+
+def dominance_relation(payoff_matrix, player, chunk_elements=DOMINANCE_CHUNK_ELEMENTS):
+    # Move the player's axis to the front so every row is one strategy against all opponent profiles
+    payoffs = np.moveaxis(np.asarray(payoff_matrix), player, 0)
+    n_strategies = payoffs.shape[0]
+    payoffs = payoffs.reshape(n_strategies, -1)
+
+    strict = np.ones((n_strategies, n_strategies), dtype=bool)
+    weak = np.ones((n_strategies, n_strategies), dtype=bool)
+    stats = active_stats()
+    if stats is not None:
+        stats.count('dominance_comparisons', n_strategies * n_strategies * payoffs.shape[1])
+
+    # Compare whole slices with broadcasting, a bounded block of opponent profiles at a time
+    step = max(1, chunk_elements // (n_strategies * n_strategies))
+    for start in range(0, payoffs.shape[1], step):
+        block = payoffs[:, start:start + step]
+        rows = block[:, None, :]
+        cols = block[None, :, :]
+        strict &= (rows > cols).all(axis=2)
+        weak &= (rows >= cols).all(axis=2)
+
+    # A strategy never strictly dominates itself
+    np.fill_diagonal(strict, False)
+    return strict, weak
+
+
+def security_strategy(payoff_matrix, player):
+    # Mixed maxmin as one LP: maximize v s.t. x . U[:, s] >= v for every opponent profile s.
+    # The inner minimum over (possibly mixed) opponents is always attained at a pure profile.
+    from scipy.optimize import linprog
+
+    payoffs = np.moveaxis(np.asarray(payoff_matrix, dtype=float), player, 0)
+    n_strategies = payoffs.shape[0]
+    opponent_shape = payoffs.shape[1:]
+    payoffs = payoffs.reshape(n_strategies, -1)
+    n_profiles = payoffs.shape[1]
+
+    # Variables are (x_1, ..., x_n, v); linprog minimizes, so the objective is -v
+    objective = np.zeros(n_strategies + 1)
+    objective[-1] = -1.0
+    A_ub = np.hstack([-payoffs.T, np.ones((n_profiles, 1))])
+    b_ub = np.zeros(n_profiles)
+    A_eq = np.append(np.ones(n_strategies), 0.0)[None, :]
+    bounds = [(0, None)] * n_strategies + [(None, None)]
+
+    result = linprog(objective, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1.0], bounds=bounds, method='highs')
+    stats = active_stats()
+    if stats is not None:
+        stats.count('linear_programs_solved')
+    if not result.success:
+        raise RuntimeError(f"Security strategy LP failed for player {player}: {result.message}")
+
+    strategy = np.clip(result.x[:n_strategies], 0, None)
+    strategy /= strategy.sum()
+
+    # The LP dual is the opponents' minmax problem: its multipliers are a (jointly mixed)
+    # punishment distribution over opponent profiles holding the player to the same value
+    punishment = np.clip(-result.ineqlin.marginals, 0, None)
+    punishment = (punishment / punishment.sum()).reshape(opponent_shape)
+    return result.x[-1] + 0.0, strategy, punishment
+
+
+# Results of analyze_game_batch; every field carries the batch as its leading axis.
+# pure_nash/strong_equilibria/weak_equilibria: (B, *actions) boolean profile masks
+# strong_dominant/weak_dominant/maxmin_strategies: per player (B, n_actions) boolean masks
+# maxmin_values: per player (B,) arrays
+# strict_relations/weak_relations: per player (B, n_actions, n_actions) as in dominance_relation
+BatchAnalysis = namedtuple('BatchAnalysis', ['pure_nash', 'strong_dominant', 'weak_dominant', 'maxmin_values',
+                                             'maxmin_strategies', 'strict_relations', 'weak_relations',
+                                             'strong_equilibria', 'weak_equilibria'])
+
+
+def analyze_game_batch(payoff_matrices, chunk_elements=DOMINANCE_CHUNK_ELEMENTS):
+    # Analyze B games of the same shape at once: payoff_matrices[p] has shape (B, n_1, ..., n_k),
+    # e.g. two (B, n, m) arrays for a batch of bimatrix games. A bounded block of games is
+    # processed at a time with the batch moved to the last axis, so every max/min/all over
+    # actions or opponent profiles is an elementwise operation on contiguous batch vectors.
+    payoff_matrices = [np.asarray(payoffs) for payoffs in payoff_matrices]
+    n_games = payoff_matrices[0].shape[0]
+    shape = payoff_matrices[0].shape[1:]
+    n_players = len(payoff_matrices)
+    n_profiles = int(np.prod(shape))
+
+    pure_nash = np.ones((n_games,) + shape, dtype=bool)
+    strong_dominant = [np.zeros((n_games, n), dtype=bool) for n in shape]
+    weak_dominant = [np.zeros((n_games, n), dtype=bool) for n in shape]
+    maxmin_values = [np.zeros(n_games, dtype=payoffs.dtype) for payoffs in payoff_matrices]
+    maxmin_strategies = [np.zeros((n_games, n), dtype=bool) for n in shape]
+    strict_relations = [np.zeros((n_games, n, n), dtype=bool) for n in shape]
+    weak_relations = [np.zeros((n_games, n, n), dtype=bool) for n in shape]
+
+    # The pairwise gaps dominate the temporaries: n_p * n_p * (opponent profiles) per game
+    largest = max(n * n_profiles for n in shape)
+    step = max(1, chunk_elements // max(1, largest))
+    for start in range(0, n_games, step):
+        games = slice(start, start + step)
+        for player, payoffs in enumerate(payoff_matrices):
+            # (own action, opponent profile, game)
+            rows = np.moveaxis(payoffs[games], (player + 1, 0), (0, -1))
+            opponent_shape = rows.shape[1:-1]
+            rows = np.ascontiguousarray(rows).reshape(shape[player], -1, rows.shape[-1])
+
+            best = rows == rows.max(axis=0)
+            unique = best & (best.sum(axis=0) == 1)
+            weak_dominant[player][games] = best.all(axis=1).T
+            strong_dominant[player][games] = unique.all(axis=1).T
+
+            minima = rows.min(axis=1)
+            maxmin_values[player][games] = minima.max(axis=0)
+            maxmin_strategies[player][games] = (minima == minima.max(axis=0)).T
+
+            # [i, j] = worst margin of action i over action j; > 0 is strict, >= 0 weak dominance
+            gap = (rows[:, None] - rows[None, :]).min(axis=2)
+            strict = gap > 0
+            strict[np.arange(shape[player]), np.arange(shape[player])] = False
+            strict_relations[player][games] = np.moveaxis(strict, -1, 0)
+            weak_relations[player][games] = np.moveaxis(gap >= 0, -1, 0)
+
+            # Back to profile layout so the masks of all players can be intersected
+            best = best.reshape((shape[player],) + opponent_shape + (-1,))
+            pure_nash[games] &= np.moveaxis(best, (0, -1), (player + 1, 0))
+
+    # Dominant-strategy equilibria are the profiles made of dominant actions only
+    def equilibria(dominant):
+        mask = np.ones((n_games,) + shape, dtype=bool)
+        for player in range(n_players):
+            index = [slice(None)] + [None] * n_players
+            index[player + 1] = slice(None)
+            mask = mask & dominant[player][tuple(index)]
+        return mask
+
+    return BatchAnalysis(pure_nash, strong_dominant, weak_dominant, maxmin_values, maxmin_strategies,
+                         strict_relations, weak_relations, equilibria(strong_dominant), equilibria(weak_dominant))
+
+
+class GameAnalysis:
+    # Shared intermediates are computed once on first use and every result is derived from them
+    def __init__(self, game):
+        self.game = game
+
+    @cached_property
+    def best_response_tables(self):
+        # [player][profile] is True when the player's action in profile is a best response to the rest
+        tables = []
+        for player, payoffs in enumerate(self.game.payoff_matrices):
+            payoffs = np.asarray(payoffs)
+            tables.append(payoffs == payoffs.max(axis=player, keepdims=True))
+        return tables
+
+    @cached_property
+    def strategy_minima(self):
+        # [player][strategy] is the worst payoff of that strategy over all opponent profiles
+        minima = []
+        for player, payoffs in enumerate(self.game.payoff_matrices):
+            payoffs = np.moveaxis(np.asarray(payoffs), player, 0)
+            minima.append(payoffs.reshape(payoffs.shape[0], -1).min(axis=1))
+        return minima
+
+    @cached_property
+    def dominance(self):
+        strict_relations = []
+        weak_relations = []
+        with phase('dominance'):
+            for player, payoffs in enumerate(self.game.payoff_matrices):
+                strict, weak = dominance_relation(payoffs, player)
+                strict_relations.append(strict)
+                weak_relations.append(weak)
+        return DominanceResult(self.strong_dominant, self.weak_dominant, strict_relations, weak_relations)
+
+    @cached_property
+    def strong_dominant(self):
+        # Strongly dominant: the unique best response against every opponent profile
+        dominant = []
+        for player, table in enumerate(self.best_response_tables):
+            unique = table & (table.sum(axis=player, keepdims=True) == 1)
+            unique = np.moveaxis(unique, player, 0).reshape(table.shape[player], -1)
+            dominant.append(np.flatnonzero(unique.all(axis=1)).tolist())
+        return dominant
+
+    @cached_property
+    def weak_dominant(self):
+        # Weakly dominant: a best response against every opponent profile
+        dominant = []
+        for player, table in enumerate(self.best_response_tables):
+            table = np.moveaxis(table, player, 0).reshape(table.shape[player], -1)
+            dominant.append(np.flatnonzero(table.all(axis=1)).tolist())
+        return dominant
+
+    @cached_property
+    def maxmin_values(self):
+        return [minima.max() for minima in self.strategy_minima]
+
+    @cached_property
+    def maxmin_strategies(self):
+        return [np.flatnonzero(minima == value).tolist()
+                for minima, value in zip(self.strategy_minima, self.maxmin_values)]
+
+    @cached_property
+    def security_strategies(self):
+        # (value, maxmin mixed strategy, minmax punishment over opponent profiles) per player.
+        # Only the player's own dominated actions may be dropped first: removing an opponent's
+        # actions would change what the player has to guard against.
+        strategies = []
+        with phase('mixed-maxmin'):
+            for player, payoffs in enumerate(self.game.payoff_matrices):
+                reduced = eliminate_dominated_strategies(self.game.payoff_matrices, players=[player])
+                value, strategy, punishment = security_strategy(reduced.payoff_matrices[player], player)
+                full_strategy = np.zeros(self.game.n_actions[player])
+                full_strategy[reduced.action_maps[player]] = strategy
+                strategies.append((value, full_strategy, punishment))
+        return strategies
+
+    @cached_property
+    def mixed_maxmin_values(self):
+        return [value for value, _, _ in self.security_strategies]
+
+    @cached_property
+    def mixed_maxmin_strategies(self):
+        return [strategy for _, strategy, _ in self.security_strategies]
+
+    @cached_property
+    def minmax_strategies(self):
+        return [punishment for _, _, punishment in self.security_strategies]
+
+    @cached_property
+    def strong_equilibria(self):
+        return self._dominant_strategy_equilibria(self.strong_dominant)
+
+    @cached_property
+    def weak_equilibria(self):
+        return self._dominant_strategy_equilibria(self.weak_dominant)
+
+    def _dominant_strategy_equilibria(self, dominant_strategies):
+        # Check if each player has at least one dominant strategy
+        if not all(dominant_strategies):
+            return []
+
+        # All combinations of dominant strategies form the equilibrium
+        return list(product(*dominant_strategies))
+
+    def to_dict(self):
+        return {
+            'n_players': self.game.n_players,
+            'strong_dominant': self.strong_dominant,
+            'weak_dominant': self.weak_dominant,
+            'maxmin_values': [value.item() for value in self.maxmin_values],
+            'maxmin_strategies': self.maxmin_strategies,
+            'strong_equilibria': self.strong_equilibria,
+            'weak_equilibria': self.weak_equilibria,
+        }
@@ -0,0 +1,134 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .instrumentation import active_stats, phase
+
+# Upper bound on the number of pairwise comparisons held in memory at once
+ELIMINATION_CHUNK_ELEMENTS = 1 << 22
+
+
+class ReducedGame:
+    # View of a game restricted to surviving actions, with maps back to the original action indices
+    def __init__(self, payoff_matrices: List[np.ndarray], action_maps: List[np.ndarray]):
+        self.original_actions = [np.shape(payoff_matrices[0])[p] for p in range(len(action_maps))]
+        self.action_maps = action_maps
+        self.payoff_matrices = [np.asarray(payoffs)[np.ix_(*action_maps)] for payoffs in payoff_matrices]
+        self.player_actions = [len(actions) for actions in action_maps]
+    
+    def is_reduced(self) -> bool:
+        return self.player_actions != self.original_actions
+    
+    def to_original_profile(self, profile: Tuple[int, ...]) -> Tuple[int, ...]:
+        return tuple(int(actions[a]) for actions, a in zip(self.action_maps, profile))
+    
+    def to_original_strategies(self, strategies: List[np.ndarray]) -> List[np.ndarray]:
+        expanded = []
+        for actions, n_actions, strategy in zip(self.action_maps, self.original_actions, strategies):
+            full = np.zeros(n_actions)
+            full[actions] = strategy
+            expanded.append(full)
+        return expanded
+
+
+def _weak_comparison_counts(rows: np.ndarray, chunk_elements: int = ELIMINATION_CHUNK_ELEMENTS) -> np.ndarray:
+    # [i, j] = number of columns where rows[i] <= rows[j], i.e. where i fails to strictly beat j
+    n_rows = rows.shape[0]
+    counts = np.zeros((n_rows, n_rows), dtype=np.int64)
+    step = max(1, chunk_elements // max(1, n_rows * n_rows))
+    for start in range(0, rows.shape[1], step):
+        block = rows[:, start:start + step]
+        counts += (block[:, None, :] <= block[None, :, :]).sum(axis=2)
+    return counts
+
+
+def _player_rows(payoffs: np.ndarray, player: int, index: List[np.ndarray]) -> np.ndarray:
+    # The player's payoffs on the given index sets, one row per own action
+    payoffs = np.moveaxis(np.asarray(payoffs)[np.ix_(*index)], player, 0)
+    return payoffs.reshape(payoffs.shape[0], -1)
+
+
+def _is_mixed_dominated(rows: np.ndarray, action: int, others: np.ndarray, tolerance: float = 1e-9) -> bool:
+    # LP: maximize eps s.t. sum_i sigma_i rows[i, s] >= rows[action, s] + eps for every column s
+    from scipy.optimize import linprog
+
+    if not len(others):
+        return False
+    dominators = rows[others]
+    n_others = len(others)
+    objective = np.zeros(n_others + 1)
+    objective[-1] = -1.0
+    A_ub = np.hstack([-dominators.T, np.ones((rows.shape[1], 1))])
+    A_eq = np.append(np.ones(n_others), 0.0)[None, :]
+    bounds = [(0, None)] * n_others + [(None, None)]
+    result = linprog(objective, A_ub=A_ub, b_ub=-rows[action], A_eq=A_eq, b_eq=[1.0], bounds=bounds, method='highs')
+    stats = active_stats()
+    if stats is not None:
+        stats.count('linear_programs_solved')
+    return bool(result.success and -result.fun > tolerance)
+
+
+def eliminate_dominated_strategies(payoff_matrices: List[np.ndarray], mixed: bool = True,
+                                   players: Optional[List[int]] = None) -> ReducedGame:
+    with phase('elimination'):
+        return _eliminate_dominated_strategies(payoff_matrices, mixed, players)
+
+
+def _eliminate_dominated_strategies(payoff_matrices: List[np.ndarray], mixed: bool,
+                                    players: Optional[List[int]]) -> ReducedGame:
+    # Iterated elimination of strictly dominated actions (by pure actions, and by mixed strategies
+    # via LP when mixed=True). For every player we keep counts[p][i, j] = number of surviving
+    # opponent profiles where i fails to strictly beat j, so i dominates j once it reaches 0.
+    # Removing an opponent action only subtracts the counts of the slice that disappears.
+    n_players = len(payoff_matrices)
+    shape = np.shape(payoff_matrices[0])
+    players = list(range(n_players)) if players is None else list(players)
+    active = [np.ones(n, dtype=bool) for n in shape]
+    
+    def surviving(exclude):
+        return [np.arange(shape[q]) if q == exclude else np.flatnonzero(active[q]) for q in range(n_players)]
+    
+    counts = {p: _weak_comparison_counts(_player_rows(payoff_matrices[p], p, surviving(p))) for p in players}
+    
+    stats = active_stats()
+    
+    def remove(player, action):
+        # Subtract the profiles where player plays action from every other player's counts
+        if stats is not None:
+            stats.count('actions_eliminated')
+        active[player][action] = False
+        for p in players:
+            if p == player:
+                continue
+            index = surviving(p)
+            index[player] = np.array([action])
+            counts[p] -= _weak_comparison_counts(_player_rows(payoff_matrices[p], p, index))
+    
+    while True:
+        removed = False
+        for p in players:
+            alive = np.flatnonzero(active[p])
+            relation = counts[p][np.ix_(alive, alive)] == 0
+            np.fill_diagonal(relation, False)
+            for action in alive[relation.any(axis=0)]:
+                remove(p, action)
+                removed = True
+        if removed:
+            continue
+        
+        if mixed:
+            # Only once pure dominance is exhausted, look for dominance by mixed strategies
+            for p in players:
+                alive = np.flatnonzero(active[p])
+                if len(alive) < 3:
+                    continue
+                rows = _player_rows(payoff_matrices[p], p, surviving(p))
+                for action in alive:
+                    others = np.flatnonzero(active[p])
+                    others = others[others != action]
+                    if _is_mixed_dominated(rows, action, others):
+                        remove(p, action)
+                        removed = True
+        if not removed:
+            break
+    
+    return ReducedGame(payoff_matrices, [np.flatnonzero(mask) for mask in active])
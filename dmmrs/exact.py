@@ -0,0 +1,295 @@
+import numpy as np
+import math
+from fractions import Fraction
+from typing import Iterator, List, Optional, Tuple
+
+from .instrumentation import active_stats
+from .limits import stop_requested
+from .support import iter_support_profiles
+
+# Exact equilibria of games with integer or rational payoffs. Each player's payoffs are scaled to
+# integers (a positive scaling leaves best responses unchanged), indifference systems are solved
+# by fraction-free (Bareiss) elimination and strategies are kept as integer numerators over one
+# positive denominator per player, so equilibrium checks and comparisons are integer comparisons.
+# Arithmetic stays in int64 while a bound on every intermediate value allows it and only falls
+# back to Python integers (object arrays) beyond that; no Fraction objects are created until the
+# results are returned.
+#
+# A rational profile is a list of (numerators, denominator) pairs, one per player.
+RationalProfile = List[Tuple[np.ndarray, int]]
+
+_INT64_LIMIT = 1 << 62
+
+
+def integer_payoffs(payoff_matrices: List[np.ndarray], max_denominator: int = 1 << 20) -> Optional[List[np.ndarray]]:
+    # Each player's payoffs times the lcm of their denominators, as int64 (object arrays of Python
+    # ints if they do not fit), or None when some payoff is infinite or nan. Accepts ints, floats
+    # and Fractions. A float is read as the simplest rational with denominator up to max_denominator
+    # that rounds to it (so 1/3 is recognized from its nearest float), or else as the binary
+    # fraction it is exactly, whose large denominator sends the arithmetic to Python integers.
+    scaled = []
+    for payoffs in payoff_matrices:
+        payoffs = np.asarray(payoffs)
+        if payoffs.dtype.kind in 'iu':
+            scaled.append(payoffs.astype(np.int64))
+            continue
+        if payoffs.dtype.kind == 'f':
+            if not np.isfinite(payoffs).all():
+                return None
+            if (payoffs == np.round(payoffs)).all() and np.abs(payoffs).max() < _INT64_LIMIT:
+                scaled.append(payoffs.astype(np.int64))
+                continue
+
+        values, inverse = np.unique(payoffs, return_inverse=True)
+        fractions = []
+        for value in values:
+            if isinstance(value, (float, np.floating)):
+                fraction = Fraction(float(value)).limit_denominator(max_denominator)
+                if float(fraction) != value:
+                    fraction = Fraction(float(value))
+            else:
+                fraction = Fraction(value)
+            fractions.append(fraction)
+        denominator = math.lcm(*(fraction.denominator for fraction in fractions))
+        numerators = [fraction.numerator * (denominator // fraction.denominator) for fraction in fractions]
+        dtype = np.int64 if max(abs(n) for n in numerators) < _INT64_LIMIT else object
+        scaled.append(np.array(numerators, dtype=dtype)[inverse].reshape(payoffs.shape))
+    return scaled
+
+
+def _fits_int64(bound: float) -> bool:
+    return bound < _INT64_LIMIT
+
+
+def bareiss_solve(matrix: np.ndarray, rhs: np.ndarray) -> Optional[Tuple[List[int], int, int]]:
+    # One solution of matrix @ z = rhs for an integer matrix of any shape, with free variables set
+    # to 0, as (numerators, denominator, rank) with a positive denominator; None if inconsistent.
+    # The solution is the only one when rank equals the number of unknowns.
+    # Bareiss elimination: every entry stays a minor of the augmented matrix, and each update
+    #   M[i, j] = (M[k, k] M[i, j] - M[i, k] M[k, j]) / (previous pivot)
+    # divides exactly. Intermediate products are at most twice the square of the Hadamard bound of
+    # the augmented matrix, which decides between int64 and Python integers up front.
+    n_rows, n_columns = matrix.shape
+    augmented = np.hstack([np.asarray(matrix), np.asarray(rhs).reshape(-1, 1)])
+    # In logarithms, as the bound itself can exceed the float range for bigint payoffs
+    norms = np.sqrt((augmented.astype(float) ** 2).sum(axis=1))
+    log_hadamard = float(np.log2(np.maximum(norms, 1.0)).sum())
+    use_int64 = math.log2(2 * (n_columns + 1)) + 2 * log_hadamard < math.log2(_INT64_LIMIT)
+    augmented = augmented.astype(np.int64) if use_int64 else np.vectorize(int, otypes=[object])(augmented)
+    stats = active_stats()
+    if stats is not None:
+        stats.count('exact_systems_solved')
+        if not use_int64:
+            stats.count('exact_bigint_systems')
+
+    pivots = []
+    previous = 1
+    row = 0
+    for column in range(n_columns):
+        candidates = np.flatnonzero(augmented[row:, column] != 0)
+        if not len(candidates):
+            continue
+        pivot_row = row + int(candidates[0])
+        if pivot_row != row:
+            augmented[[row, pivot_row]] = augmented[[pivot_row, row]]
+        pivot = augmented[row, column]
+        below = augmented[row + 1:]
+        below[:, column + 1:] = (pivot * below[:, column + 1:]
+                                 - below[:, column:column + 1] * augmented[row, column + 1:]) // previous
+        below[:, column] = 0
+        previous = pivot
+        pivots.append(column)
+        row += 1
+        if row == n_rows:
+            break
+
+    # Rows without a pivot must read 0 = 0
+    if np.any(augmented[row:, -1] != 0):
+        return None
+
+    # The last pivot is the determinant of the pivot submatrix (up to sign), so by Cramer's rule
+    # it times every pivot variable is an integer; back-substitution in Python integers keeps it so
+    denominator = int(previous)
+    numerators = [0] * n_columns
+    for i in reversed(range(len(pivots))):
+        column = pivots[i]
+        total = denominator * int(augmented[i, -1])
+        for j in pivots[i + 1:]:
+            total -= int(augmented[i, j]) * numerators[j]
+        numerators[column] = total // int(augmented[i, column])
+    if denominator < 0:
+        denominator = -denominator
+        numerators = [-n for n in numerators]
+    divisor = math.gcd(denominator, *numerators)
+    return [n // divisor for n in numerators], denominator // divisor, len(pivots)
+
+
+def _expected_numerators(payoffs: np.ndarray, player: int, profile: RationalProfile) -> np.ndarray:
+    # Expected payoff of each of player's actions times the other players' denominators (all
+    # positive, so comparisons are unaffected), contracting one opponent axis at a time
+    bound = float(np.abs(payoffs).max()) if payoffs.size else 0.0
+    for other, (numerators, _) in enumerate(profile):
+        if other != player:
+            bound *= float(np.abs(np.asarray(numerators, dtype=float)).sum())
+    dtype = np.int64 if _fits_int64(bound) and payoffs.dtype != object else object
+    table = payoffs.astype(dtype)
+    for other in reversed(range(len(profile))):
+        if other != player:
+            table = np.tensordot(table, np.asarray(profile[other][0]).astype(dtype), axes=([other], [0]))
+    return table
+
+
+def is_exact_nash(payoff_matrices: List[np.ndarray], profile: RationalProfile) -> bool:
+    # Every action a player uses is an exact best response; payoff_matrices from integer_payoffs
+    for player, (numerators, _) in enumerate(profile):
+        expected = _expected_numerators(payoff_matrices[player], player, profile)
+        best = expected.max()
+        if any(expected[a] != best for a in np.flatnonzero(np.asarray(numerators) != 0)):
+            return False
+    return True
+
+
+def _solve_linear_support(payoff_matrices: List[np.ndarray],
+                          supports: Tuple[Tuple[int, ...], ...]) -> Tuple[Optional[RationalProfile], bool]:
+    # Support profiles in which at most two players mix: the pure players' actions are fixed, so
+    # the indifference conditions of each mixing player are linear in the other one's strategy.
+    # Unknowns are the mixed strategies and values (x_p on S_p, v_p); equations, for every mixing p,
+    #   E_p(a) - v_p = 0 for a in S_p   and   sum(x_p) = 1
+    # Returns (profile or None, determined): the solution with free variables at 0 if it is a
+    # probability profile, and whether it is the only solution. Weights of exactly 0 are allowed;
+    # in degenerate games such solutions are the ends of equilibrium segments, found nowhere else.
+    # When the system is underdetermined the caller looks for further solutions.
+    n_players = len(payoff_matrices)
+    mixed = [p for p in range(n_players) if len(supports[p]) > 1]
+    offsets = {}
+    n_unknowns = 0
+    for p in mixed:
+        offsets[p] = n_unknowns
+        n_unknowns += len(supports[p]) + 1
+
+    rows, rhs = [], []
+    for p in mixed:
+        others = [q for q in mixed if q != p]
+        index = [np.asarray(support) for support in supports]
+        sub = np.moveaxis(payoff_matrices[p][np.ix_(*index)], p, 0).reshape(len(supports[p]), -1)
+        for a in range(len(supports[p])):
+            row = [0] * n_unknowns
+            row[offsets[p] + len(supports[p])] = -1
+            if others:
+                q = others[0]
+                for j, value in enumerate(sub[a]):
+                    row[offsets[q] + j] = int(value)
+                rhs.append(0)
+            else:
+                rhs.append(-int(sub[a, 0]))
+            rows.append(row)
+        row = [0] * n_unknowns
+        for j in range(len(supports[p])):
+            row[offsets[p] + j] = 1
+        rows.append(row)
+        rhs.append(1)
+
+    if mixed:
+        solution = bareiss_solve(np.array(rows, dtype=object), np.array(rhs, dtype=object))
+        if solution is None:
+            return None, True
+        numerators, denominator, rank = solution
+        determined = rank == n_unknowns
+
+    profile = []
+    for p, support in enumerate(supports):
+        strategy = [0] * payoff_matrices[p].shape[p]
+        if p in offsets:
+            weights = numerators[offsets[p]:offsets[p] + len(support)]
+            if min(weights) < 0:
+                return None, determined
+            for action, weight in zip(support, weights):
+                strategy[action] = weight
+            profile.append((np.array(strategy, dtype=object), denominator))
+        else:
+            strategy[support[0]] = 1
+            profile.append((np.array(strategy, dtype=object), 1))
+    return profile, not mixed or determined
+
+
+def _rationalize(strategies: List[np.ndarray], max_denominator: int) -> Optional[RationalProfile]:
+    # Nearest rational profile to a numeric one, or None if it is not a probability profile
+    profile = []
+    for strategy in strategies:
+        fractions = [Fraction(float(value)).limit_denominator(max_denominator) for value in np.clip(strategy, 0, None)]
+        denominator = math.lcm(*(fraction.denominator for fraction in fractions))
+        numerators = [fraction.numerator * (denominator // fraction.denominator) for fraction in fractions]
+        if sum(numerators) != denominator:
+            return None
+        profile.append((np.array(numerators, dtype=object), denominator))
+    return profile
+
+
+def _key(profile: RationalProfile) -> tuple:
+    # Exact identity of a rational profile (numerators and denominators are kept in lowest terms)
+    keys = []
+    for numerators, denominator in profile:
+        divisor = math.gcd(denominator, *(int(n) for n in numerators))
+        keys.append((tuple(int(n) // divisor for n in numerators), denominator // divisor))
+    return tuple(keys)
+
+
+def to_fractions(profile: RationalProfile) -> List[np.ndarray]:
+    return [np.array([Fraction(int(n), denominator) for n in numerators], dtype=object)
+            for numerators, denominator in profile]
+
+
+def to_floats(profile: RationalProfile) -> List[np.ndarray]:
+    return [np.array([int(n) / denominator for n in numerators]) for numerators, denominator in profile]
+
+
+def iter_exact_equilibria(payoff_matrices: List[np.ndarray], limit: Optional[int] = None,
+                          deadline: Optional[float] = None, cancel=None, max_denominator: int = 1 << 20,
+                          inexact: Optional[list] = None) -> Iterator[List[np.ndarray]]:
+    # Support enumeration in exact arithmetic, yielding each equilibrium as Fraction arrays. Support
+    # profiles with at most two mixing players (all of them in two-player games) are solved exactly.
+    # Where that system has no unique solution (degenerate games), and for three or more mixing
+    # players (whose system is multilinear), the numeric solutions are also rounded to the nearest
+    # rationals (denominators up to max_denominator) and kept only if they verify exactly. Those
+    # that do not (irrational, or beyond max_denominator) are appended, as floats, to inexact if
+    # given.
+    # limit, deadline and cancel as in dmmrs.limits, checked between support profiles.
+    scaled = integer_payoffs(payoff_matrices, max_denominator)
+    if scaled is None:
+        raise ValueError("Exact equilibria need finite payoffs")
+    if limit is not None and limit <= 0:
+        return
+    player_actions = list(scaled[0].shape)
+    game = None
+    seen = set()
+    found = 0
+    for supports in iter_support_profiles(player_actions):
+        if stop_requested(deadline, cancel):
+            return
+        candidates = []
+        determined = False
+        if sum(len(support) > 1 for support in supports) <= 2:
+            profile, determined = _solve_linear_support(scaled, supports)
+            if profile is not None and is_exact_nash(scaled, profile):
+                candidates.append(profile)
+        if not determined:
+            if game is None:
+                from .game import StrategicFormGame
+                # The original payoffs: the numeric tolerances are absolute, scaled ones can be huge
+                game = StrategicFormGame([np.asarray(payoffs, dtype=float) for payoffs in payoff_matrices])
+            for strategies in game._check_support(supports):
+                profile = _rationalize(strategies, max_denominator)
+                if profile is not None and is_exact_nash(scaled, profile):
+                    candidates.append(profile)
+                elif inexact is not None:
+                    inexact.append(strategies)
+
+        for profile in candidates:
+            key = _key(profile)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield to_fractions(profile)
+            found += 1
+            if found == limit:
+                return
@@ -0,0 +1,184 @@
+import numpy as np
+
+from .bimatrix import analyze_game
+from .game import StrategicFormGame
+
+# The example games from the assignments; run them with `python -m dmmrs examples [name ...]`
+
+
+def dominance_examples():
+    # Assignment 1: dominant strategies, maxmin values and dominant-strategy equilibria
+    # BOS
+    print("-------------------------------------------------------------")
+    print("\nBOS:")
+    payoff_matrices_bos = [
+        np.array([[2, 0], [0, 1]]),  # Player 1
+        np.array([[1, 0], [0, 2]])   # Player 2
+    ]
+    game_bos = StrategicFormGame(payoff_matrices_bos)
+    game_bos.analyze_game()
+    print("-------------------------------------------------------------")
+
+    # Prisoner's Dilemma
+    print("-------------------------------------------------------------")
+    print("\nPrisoner's Dilemma:")
+    payoff_matrices_pd = [
+        np.array([[-2, -10], [-1, -5]]),  # Player 1
+        np.array([[-2, -1], [-10, -5]])   # Player 2
+    ]
+    game_pd = StrategicFormGame(payoff_matrices_pd)
+    game_pd.analyze_game()
+    print("-------------------------------------------------------------")
+
+    # Matching Pennies
+    print("-------------------------------------------------------------")
+    print("\nMatching Pennies:")
+    payoff_matrices_mp = [
+        np.array([[1, -1], [-1, 1]]),  # Player 1
+        np.array([[-1, 1], [1, -1]])   # Player 2
+    ]
+    game_mp = StrategicFormGame(payoff_matrices_mp)
+    game_mp.analyze_game()
+    print("-------------------------------------------------------------")
+
+    # Pigous Network Game
+    print("-------------------------------------------------------------")
+    print("\nPigous Network Game:")
+    payoff_matrices_pn = [
+        np.array([[-1, -0.5], [-1, -1]]),  # Player 1
+        np.array([[-1, -1], [-0.5, -1]])   # Player 2
+    ]
+    game_mp = StrategicFormGame(payoff_matrices_pn)
+    game_mp.analyze_game()
+    print("-------------------------------------------------------------")
+
+    # Rock Paper Scissor
+    print("-------------------------------------------------------------")
+    print("\nRock Paper Scissor Game:")
+    payoff_matrices_rps = [
+        np.array([[0, -1, 1],   # Player 1's payoffs
+                  [1, 0, -1],
+                  [-1, 1, 0]]),
+        np.array([[0, 1, -1],   # Player 2's payoffs
+                  [-1, 0, 1],
+                  [1, -1, 0]])
+    ]
+    game_rps = StrategicFormGame(payoff_matrices_rps)
+    game_rps.analyze_game()
+    print("-------------------------------------------------------------")
+
+    # 3-Player Bar Crowding Game
+    print("-------------------------------------------------------------")
+    print("\n3-Player Bar Crowding Game:")
+    payoff_matrices_3ps = [
+        np.array([
+            [[-1, 2], [2, 0]],  # Gus's payoffs
+            [[1, 1], [1, 1]]
+        ]),
+        np.array([
+            [[-1, 2], [1, 1]],  # Yelnic's payoffs
+            [[2, 1], [1, 1]]
+        ]),
+        np.array([
+            [[-1, 1], [2, 1]],  # Tolbert's payoffs
+            [[2, 1], [0, 1]]
+        ])
+    ]
+    game_3ps = StrategicFormGame(payoff_matrices_3ps)
+    game_3ps.analyze_game()
+    print("-------------------------------------------------------------")
+
+
+def nash_examples():
+    # Assignment 2: pure and mixed Nash equilibria of the two-player games
+    # 1. BOS
+    print("-------------------------------------------------------------")
+    print("\nBOS:")
+    payoff_matrices_bos = [
+        np.array([[2, 0], [0, 1]]),  # Player 1
+        np.array([[1, 0], [0, 2]])   # Player 2
+    ]
+    analyze_game(payoff_matrices_bos)
+    print("-------------------------------------------------------------")
+
+    # 2. Prisoner's Dilemma (2-player game)
+    print("---------------------------------------------------")
+    print("\nPrisoner's Dilemma:")
+    payoff_matrices_pd = [
+        np.array([[-2, -10], [-1, -5]]),  # Player 1
+        np.array([[-2, -1], [-10, -5]])   # Player 2
+    ]
+    analyze_game(payoff_matrices_pd)
+    print("---------------------------------------------------")
+
+    # 3. Matching Pennies (2-player game)
+    print("---------------------------------------------------")
+    print("\nMatching Pennies:")
+    payoff_matrices_mp = [
+        np.array([[1, -1], [-1, 1]]),  # Player 1
+        np.array([[-1, 1], [1, -1]])   # Player 2
+    ]
+    analyze_game(payoff_matrices_mp)
+    print("---------------------------------------------------")
+
+    # 4. Pigous Network Game
+    print("-------------------------------------------------------------")
+    print("\nPigous Network Game:")
+    payoff_matrices_pn = [
+        np.array([[-1, -0.5], [-1, -1]]),  # Player 1
+        np.array([[-1, -1], [-0.5, -1]])   # Player 2
+    ]
+    analyze_game(payoff_matrices_pn)
+    print("-------------------------------------------------------------")
+
+    # 5. Rock Paper Scissor
+    print("-------------------------------------------------------------")
+    print("\nRock Paper Scissor Game:")
+    payoff_matrices_rps = [
+        np.array([[0, -1, 1],   # Player 1's payoffs
+                  [1, 0, -1],
+                  [-1, 1, 0]]),
+        np.array([[0, 1, -1],   # Player 2's payoffs
+                  [-1, 0, 1],
+                  [1, -1, 0]])
+    ]
+    analyze_game(payoff_matrices_rps)
+    print("-------------------------------------------------------------")
+
+
+def bar_crowding_example():
+    # Assignment 2 bonus: every Nash equilibrium of the 3-player bar crowding game
+    coord_game = StrategicFormGame(
+    [   np.array([
+            [[-1, 2], [2, 0]],  # Gus's payoffs
+            [[1, 1], [1, 1]]
+        ]),
+        np.array([
+            [[-1, 2], [1, 1]],  # Yelnic's payoffs
+            [[2, 1], [1, 1]]
+        ]),
+        np.array([
+            [[-1, 1], [2, 1]],  # Tolbert's payoffs
+            [[2, 1], [0, 1]]
+        ])
+    ], 
+    [2, 2, 2])
+    
+    # Find pure Nash equilibria
+    pure_ne = coord_game.find_pure_nash_equilibria()
+    print("Pure Strategy Nash Equilibria:")
+    for ne in pure_ne:
+        print(f"  {ne}")
+    
+    # Find a mixed Nash equilibrium
+    mixed_ne = coord_game.find_all_mixed_nash_equilibria()
+    print("Mixed Strategy Nash Equilibrium:")
+    for i, strategy in enumerate(mixed_ne):
+        print(f"Eq-{i+1}: {strategy}")
+
+
+EXAMPLES = {
+    'dominance': dominance_examples,
+    'nash': nash_examples,
+    'bar-crowding': bar_crowding_example,
+}
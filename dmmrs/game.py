@@ -0,0 +1,557 @@
+import numpy as np
+import os
+import warnings
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .dominance import DominanceResult, GameAnalysis
+from .elimination import ReducedGame, eliminate_dominated_strategies
+from .instrumentation import active_stats, phase
+from .learning import LEARNING_METHODS, LearningResult
+from .limits import stop_requested
+from .pure import PURE_NASH_CHUNK_ELEMENTS, iter_pure_nash
+from .store import EquilibriumStore
+from .support import batch_regrets, expected_payoff_table, iter_support_profiles
+
+# Searches with fewer support profiles run serially: starting a process pool and sharing the
+# payoffs costs more than checking them
+PARALLEL_MIN_SUPPORTS = 256
+
+
+class StrategicFormGame:
+    # One payoff tensor per player, indexed by the action profile. player_actions defaults to the
+    # tensors' shape. Dominance and maxmin results come from analysis(), equilibria from the find_* methods.
+    def __init__(self, payoff_matrices: List[np.ndarray], player_actions: Optional[List[int]] = None):
+        if player_actions is None:
+            player_actions = list(np.shape(payoff_matrices[0]))
+        self.n_players = len(player_actions)
+        self.player_actions = player_actions
+        self.n_actions = list(player_actions)
+        self.payoff_matrices = payoff_matrices
+        
+        # Validate dimensions
+        for i, payoff_matrix in enumerate(payoff_matrices):
+            if np.shape(payoff_matrix) != tuple(player_actions):
+                raise ValueError(f"Payoff matrix for player {i} has incorrect shape. Expected {tuple(player_actions)}, got {np.shape(payoff_matrix)}")
+        
+        self._analysis = None
+        self._reduced_game = None
+        self._scales = None
+    
+    def _payoff_scales(self) -> List[float]:
+        # Range of each player's payoffs (1 if constant): the unit of the payoff tolerances in the
+        # numeric mixed search, so that scaling a game by a constant does not change its equilibria
+        if self._scales is None:
+            self._scales = [float(np.ptp(np.asarray(payoffs, dtype=float))) or 1.0 for payoffs in self.payoff_matrices]
+        return self._scales
+    
+    def analysis(self) -> GameAnalysis:
+        if self._analysis is None:
+            self._analysis = GameAnalysis(self)
+        return self._analysis
+    
+    def reduce(self) -> ReducedGame:
+        # Strictly dominated actions never appear in any Nash equilibrium, so with reduce=True the
+        # solvers work on the IESDS-reduced view and map their results back; computed once per game.
+        # Opt-in: mixed dominance costs one LP per action and round, far more than a pure-NE pass
+        if self._reduced_game is None:
+            self._reduced_game = eliminate_dominated_strategies(self.payoff_matrices)
+        return self._reduced_game
+    
+    def eliminate_dominated_strategies(self, mixed: bool = True) -> ReducedGame:
+        return eliminate_dominated_strategies(self.payoff_matrices, mixed)
+    
+    def dominance_relations(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        dominance = self.analysis().dominance
+        return list(zip(dominance.strict_relations, dominance.weak_relations))
+    
+    def find_dominance(self) -> DominanceResult:
+        return self.analysis().dominance
+    
+    def find_dominant_strategies(self, dominance_type: str = 'strong') -> List[List[int]]:
+        if dominance_type == 'strong':
+            return self.analysis().strong_dominant
+        return self.analysis().weak_dominant
+    
+    def find_maxmin_values_and_strategies(self) -> Tuple[List, List[List[int]]]:
+        analysis = self.analysis()
+        return analysis.maxmin_values, analysis.maxmin_strategies
+    
+    def find_mixed_maxmin_values_and_strategies(self) -> Tuple[List[float], List[np.ndarray]]:
+        analysis = self.analysis()
+        return analysis.mixed_maxmin_values, analysis.mixed_maxmin_strategies
+    
+    def find_dominant_strategy_equilibria(self, dominance_type: str = 'strong') -> List[Tuple[int, ...]]:
+        if dominance_type == 'strong':
+            return self.analysis().strong_equilibria
+        return self.analysis().weak_equilibria
+    
+    def analyze_game(self) -> GameAnalysis:
+        analysis = self.analysis()
+        print(f"Analyzing {self.n_players}-player strategic form game")
+    
+        # Strongly dominant strategies
+        print("\nStrongly dominant strategies:")
+        for i, strategies in enumerate(analysis.strong_dominant, 1):
+            print(f"Player {i}: {strategies if strategies else 'None'}")
+    
+        # Weakly dominant strategies
+        print("\nWeakly dominant strategies:")
+        for i, strategies in enumerate(analysis.weak_dominant, 1):
+            print(f"Player {i}: {strategies if strategies else 'None'}")
+    
+        # Maxmin values and strategies
+        print("\nMaxmin values and strategies:")
+        for i in range(self.n_players):
+            print(f"Player {i+1}: Value = {analysis.maxmin_values[i]}, Strategies = {analysis.maxmin_strategies[i]}")
+    
+        # Strongly dominant strategy equilibrium
+        strong_eq = analysis.strong_equilibria
+        print("\nStrongly dominant strategy equilibria:", strong_eq if strong_eq else "None")
+    
+        # Weakly dominant strategy equilibria
+        weak_eq = analysis.weak_equilibria
+        print("Weakly dominant strategy equilibria:", weak_eq if weak_eq else "None")
+        return analysis
+    
+    def find_pure_nash_equilibria(self, chunk_elements: int = PURE_NASH_CHUNK_ELEMENTS, reduce: bool = False) -> List[Tuple]:
+        if reduce and self.reduce().is_reduced():
+            reduced = self.reduce()
+            with phase('pure-nash'):
+                return [reduced.to_original_profile(profile) for profile in iter_pure_nash(reduced.payoff_matrices, chunk_elements)]
+        with phase('pure-nash'):
+            return list(iter_pure_nash(self.payoff_matrices, chunk_elements))
+    
+    def iter_pure_nash_equilibria(self, chunk_elements: int = PURE_NASH_CHUNK_ELEMENTS, reduce: bool = False,
+                                  limit: Optional[int] = None, deadline: Optional[float] = None,
+                                  cancel=None) -> Iterator[Tuple]:
+        # Lazy find_pure_nash_equilibria; see dmmrs.limits for limit, deadline and cancel
+        if reduce and self.reduce().is_reduced():
+            reduced = self.reduce()
+            for profile in iter_pure_nash(reduced.payoff_matrices, chunk_elements, limit, deadline, cancel):
+                yield reduced.to_original_profile(profile)
+        else:
+            yield from iter_pure_nash(self.payoff_matrices, chunk_elements, limit, deadline, cancel)
+    
+    def find_approximate_nash(self, method: str = 'fictitious-play', **options) -> LearningResult:
+        # Anytime epsilon-equilibrium by learning dynamics ('fictitious-play', 'regret-matching' or
+        # 'replicator'), for games too large for exact enumeration. Options such as epsilon,
+        # time_budget and callback go to the method; see dmmrs.learning.
+        if method not in LEARNING_METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {sorted(LEARNING_METHODS)}")
+        return LEARNING_METHODS[method](self.payoff_matrices, **options)
+    
+    def find_correlated_equilibrium(self, objective='welfare'):
+        # Welfare-maximizing ('welfare'), any ('feasible') or objective-maximizing correlated
+        # equilibrium by one sparse LP; see dmmrs.correlated
+        from .correlated import correlated_equilibrium
+        return correlated_equilibrium(self.payoff_matrices, objective)
+    
+    def find_all_mixed_nash_equilibria(self, reduce: bool = False, store: Optional['EquilibriumStore'] = None,
+                                       n_jobs: Optional[int] = 1, chunk_size: int = 64,
+                                       backend: str = 'numeric') -> List[List[np.ndarray]]:
+        # Pass a store to keep the deduplication state, e.g. for store.components() afterwards.
+        # n_jobs > 1 (or None for every core) checks support profiles in a process pool; the
+        # result order is the same as with n_jobs=1. n_jobs is capped at the CPU count and the
+        # number of chunks, and small searches run serially. Under dmmrs.instrument() the search records
+        # supports tried and pruned, linear systems solved and duplicates rejected.
+        # The numeric backend is complete when at most two players mix (linear supports); with
+        # three or more mixing players it is a multistart heuristic (see _check_support_profile).
+        # backend='smt' solves exactly with Z3 instead and finds every isolated equilibrium (see
+        # dmmrs.smt; n_jobs does not apply).
+        # backend='exact' enumerates supports in rational arithmetic (see dmmrs.exact; n_jobs does
+        # not apply) and returns floats of the exact equilibria, then the irrational ones it could
+        # only find numerically.
+        if backend not in ('numeric', 'smt', 'exact'):
+            raise ValueError(f"Unknown backend {backend!r}, expected 'numeric', 'smt' or 'exact'")
+        with phase('mixed-nash'):
+            return self._find_all_mixed_nash_equilibria(reduce, store, n_jobs, chunk_size, backend)
+    
+    def iter_mixed_nash_equilibria(self, reduce: bool = False, limit: Optional[int] = None,
+                                   deadline: Optional[float] = None, cancel=None,
+                                   store: Optional['EquilibriumStore'] = None) -> Iterator[List[np.ndarray]]:
+        # Lazy support enumeration: each new equilibrium is yielded as soon as its support profile
+        # has been solved, so next(game.iter_mixed_nash_equilibria(), None) costs only the supports
+        # up to the first one. The search state is the position in iter_support_profiles; the store
+        # keeps just the equilibria already yielded, to drop duplicates. limit, deadline and cancel
+        # (see dmmrs.limits) are checked between support profiles.
+        store = EquilibriumStore() if store is None else store
+        if limit is not None and limit <= 0:
+            return
+        
+        if reduce and self.reduce().is_reduced():
+            reduced = self.reduce()
+            reduced_game = StrategicFormGame(reduced.payoff_matrices, reduced.player_actions)
+            for equilibrium in reduced_game.iter_mixed_nash_equilibria(False, limit, deadline, cancel,
+                                                                       EquilibriumStore(store.tolerance)):
+                original = reduced.to_original_strategies(equilibrium)
+                if store.add(original):
+                    yield original
+            return
+        
+        found = 0
+        for supports in iter_support_profiles(self.player_actions):
+            if stop_requested(deadline, cancel):
+                return
+            for mixed_ne in self._check_support(supports):
+                if store.add(mixed_ne):
+                    yield mixed_ne
+                    found += 1
+                    if found == limit:
+                        return
+    
+    def _find_all_mixed_nash_equilibria(self, reduce: bool, store: Optional['EquilibriumStore'], n_jobs: Optional[int],
+                                        chunk_size: int, backend: str = 'numeric') -> List[List[np.ndarray]]:
+        store = EquilibriumStore() if store is None else store
+        
+        if reduce and self.reduce().is_reduced():
+            reduced = self.reduce()
+            reduced_game = StrategicFormGame(reduced.payoff_matrices, reduced.player_actions)
+            reduced_store = EquilibriumStore(store.tolerance)
+            reduced_game._find_all_mixed_nash_equilibria(False, reduced_store, n_jobs, chunk_size, backend)
+            store.merge(reduced_store, reduced.to_original_strategies)
+            return list(store.equilibria)
+        
+        if backend == 'smt':
+            from .smt import SMTNashSolver
+            solver = SMTNashSolver(self.payoff_matrices)
+            with phase('smt-search'):
+                for mixed_ne in solver.iter_equilibria():
+                    store.add(mixed_ne)
+            if solver.unknown:
+                # Z3 gave up on some queries, so equilibria may be missing
+                warnings.warn(f"Z3 could not decide {len(solver.unknown)} support queries; the equilibria "
+                              f"found may be incomplete", RuntimeWarning, stacklevel=3)
+            return list(store.equilibria)
+        if backend == 'exact':
+            from .exact import iter_exact_equilibria
+            inexact = []
+            with phase('exact-search'):
+                for mixed_ne in iter_exact_equilibria(self.payoff_matrices, inexact=inexact):
+                    store.add([np.asarray(strategy, dtype=float) for strategy in mixed_ne])
+            for mixed_ne in inexact:
+                store.add(mixed_ne)
+            return list(store.equilibria)
+        if self.n_players == 2:
+            return self._find_all_mixed_nash_two_player(store, n_jobs, chunk_size)
+        else:
+            return self._find_all_mixed_nash_n_player(store, n_jobs, chunk_size)
+    
+    def _find_all_mixed_nash_two_player(self, store: 'EquilibriumStore', n_jobs: Optional[int] = 1,
+                                        chunk_size: int = 64) -> List[List[np.ndarray]]:
+        # Check for pure NE first, as they're also mixed NE
+        pure_ne = self.find_pure_nash_equilibria(reduce=False)
+        
+        # Convert pure NE to mixed strategy representation
+        for profile in pure_ne:
+            mixed_profile = []
+            for i, action in enumerate(profile):
+                strategy = np.zeros(self.player_actions[i])
+                strategy[action] = 1.0
+                mixed_profile.append(strategy)
+            store.add(mixed_profile)
+        
+        # Now find mixed NE that aren't pure; the store drops near-duplicates
+        return self._find_all_mixed_nash_n_player(store, n_jobs, chunk_size)
+    
+    def _is_same_mixed_ne(self, ne1: List[np.ndarray], ne2: List[np.ndarray], tolerance: float = 1e-6) -> bool:
+        if len(ne1) != len(ne2):
+            return False
+        
+        for i in range(len(ne1)):
+            if ne1[i].shape != ne2[i].shape:
+                return False
+            
+            if not np.allclose(ne1[i], ne2[i], atol=tolerance):
+                return False
+        
+        return True
+    
+    def _find_all_mixed_nash_n_player(self, store: Optional['EquilibriumStore'] = None, n_jobs: Optional[int] = 1,
+                                      chunk_size: int = 64) -> List[List[np.ndarray]]:
+        store = EquilibriumStore() if store is None else store
+        n_cpus = os.cpu_count() or 1
+        n_jobs = n_cpus if n_jobs is None else min(n_jobs, n_cpus)
+        n_supports = int(np.prod([2 ** n - 1 for n in self.player_actions], dtype=float))
+        n_jobs = 1 if n_supports < PARALLEL_MIN_SUPPORTS else min(n_jobs, -(-n_supports // chunk_size))
+        stats = active_stats()
+        duplicates = store.duplicates
+        
+        if n_jobs > 1:
+            # Chunks come back in submission order, so the store sees the same sequence as below
+            from .parallel import _parallel_support_search
+            for chunk_equilibria in _parallel_support_search(self, n_jobs, chunk_size):
+                for mixed_ne in chunk_equilibria:
+                    store.add(mixed_ne)
+        else:
+            with phase('support-search'):
+                for supports in iter_support_profiles(self.player_actions):
+                    for mixed_ne in self._check_support(supports):
+                        store.add(mixed_ne)
+        
+        if stats is not None:
+            stats.count('duplicates_rejected', store.duplicates - duplicates)
+        return list(store.equilibria)
+    
+    def _check_support(self, supports: Tuple[Tuple[int, ...], ...]) -> List[List[np.ndarray]]:
+        # Skip support profiles that cannot carry an equilibrium before solving anything
+        stats = active_stats()
+        if stats is not None:
+            stats.count('supports_tried')
+        if self._is_conditionally_dominated(supports):
+            if stats is not None:
+                stats.count('supports_pruned')
+            return []
+        return self._check_support_profile(supports)
+    
+    def _is_conditionally_dominated(self, supports: Tuple[Tuple[int, ...], ...]) -> bool:
+        # An action in a support is useless if some other action of the same player strictly
+        # beats it against every profile the opponents can play from their supports
+        for player in range(self.n_players):
+            index = [np.asarray(support) for support in supports]
+            index[player] = np.arange(self.player_actions[player])
+            payoffs = np.moveaxis(self.payoff_matrices[player][np.ix_(*index)], player, 0)
+            payoffs = payoffs.reshape(payoffs.shape[0], -1)
+            
+            candidates = payoffs[list(supports[player])]
+            if (payoffs[:, None, :] > candidates[None, :, :]).all(axis=2).any():
+                return True
+        
+        return False
+    
+    def _check_support_profile(self, supports: Tuple[Tuple[int, ...], ...], subdivision_rounds: int = 2,
+                               max_cells: int = 32, starts: Optional[List[np.ndarray]] = None) -> List[List[np.ndarray]]:
+        # Unknowns are the probabilities and the equilibrium payoff v_p of every player with more
+        # than one action in support; each contributes sum(x_p) = 1 and E_p(a) = v_p for a in S_p.
+        # With at most two such players the system is linear and one Newton step solves it exactly,
+        # otherwise it is multilinear and Newton runs from several starting points at once, or
+        # only from starts (full strategies, e.g. a nearby equilibrium) when given. The multilinear
+        # case is a heuristic: the exclusion search only rules regions out, and a root that no
+        # surviving cell centre converges to is missed. Use backend='smt' when completeness matters.
+        # Each player's payoffs are divided by their range, so the residual tolerances and the
+        # bounds below are relative to it.
+        supports = [np.asarray(sorted(support)) for support in supports]
+        sizes = [len(support) for support in supports]
+        scales = self._payoff_scales()
+        sub_payoffs = [np.asarray(self.payoff_matrices[p][np.ix_(*supports)], dtype=float) / scales[p]
+                       for p in range(self.n_players)]
+        mixed_players = [p for p in range(self.n_players) if sizes[p] > 1]
+        batch_axis = self.n_players
+        
+        offsets = {}
+        n_unknowns = 0
+        for p in mixed_players:
+            offsets[p] = n_unknowns
+            n_unknowns += sizes[p] + 1
+        
+        def unpack(z):
+            local = [np.ones((len(z), 1)) for _ in range(self.n_players)]
+            for p in mixed_players:
+                local[p] = z[:, offsets[p]:offsets[p] + sizes[p]]
+            return local
+        
+        def contract(p, local, keep):
+            # Contract player p's payoffs with every strategy outside keep, for each start in the batch
+            operands = [sub_payoffs[p], list(range(self.n_players))]
+            for q in range(self.n_players):
+                if q not in keep:
+                    operands += [local[q], [batch_axis, q]]
+            if len(keep) == self.n_players:
+                # Nothing left to contract (two-player Jacobian block): the same for every start
+                return np.broadcast_to(sub_payoffs[p], (len(local[0]),) + sub_payoffs[p].shape)
+            return np.einsum(*operands, [batch_axis] + list(keep))
+        
+        def system(z):
+            local = unpack(z)
+            residual = np.zeros((len(z), n_unknowns))
+            jacobian = np.zeros((len(z), n_unknowns, n_unknowns))
+            for p in mixed_players:
+                row = offsets[p]
+                value_column = row + sizes[p]
+                
+                residual[:, row] = local[p].sum(axis=1) - 1.0
+                jacobian[:, row, row:row + sizes[p]] = 1.0
+                
+                indifference = slice(row + 1, row + 1 + sizes[p])
+                residual[:, indifference] = contract(p, local, (p,)) - z[:, value_column, None]
+                jacobian[:, indifference, value_column] = -1.0
+                for q in mixed_players:
+                    if q != p:
+                        block = contract(p, local, (min(p, q), max(p, q)))
+                        if q < p:
+                            block = block.transpose(0, 2, 1)
+                        jacobian[:, indifference, offsets[q]:offsets[q] + sizes[q]] = block
+            return residual, jacobian
+        
+        # The linear case needs a single start; the multilinear case starts from the centre of
+        # every region of the strategy simplices that may still contain a root
+        stats = active_stats()
+        if starts is not None:
+            centres = {}
+            for p in mixed_players:
+                start = np.clip(np.asarray(starts[p], dtype=float)[supports[p]], 0.0, None)
+                centres[p] = (start / start.sum() if start.sum() > 0 else np.full(sizes[p], 1.0 / sizes[p]))[None]
+            n_batch = 1
+        elif len(mixed_players) > 2:
+            centres = self._subdivide_supports(sub_payoffs, mixed_players, subdivision_rounds, max_cells)
+            if centres is None:
+                if stats is not None:
+                    stats.count('supports_excluded')
+                return []
+            n_batch = len(centres[mixed_players[0]])
+        else:
+            centres = {p: np.full((1, sizes[p]), 1.0 / sizes[p]) for p in mixed_players}
+            n_batch = 1
+        
+        z = np.zeros((n_batch, n_unknowns))
+        for p in mixed_players:
+            z[:, offsets[p]:offsets[p] + sizes[p]] = centres[p]
+        local = unpack(z)
+        for p in mixed_players:
+            z[:, offsets[p] + sizes[p]] = contract(p, local, (p,)).mean(axis=1)
+        
+        # Newton iterations on all starts together; a start stops moving once it converges or
+        # once its probabilities have wandered far outside the simplex, or its payoffs more than
+        # one payoff range outside the player's payoffs
+        probabilities = [i for p in mixed_players for i in range(offsets[p], offsets[p] + sizes[p])]
+        values = [offsets[p] + sizes[p] for p in mixed_players]
+        low = np.array([sub_payoffs[p].min() - 1.0 for p in mixed_players])
+        high = np.array([sub_payoffs[p].max() + 1.0 for p in mixed_players])
+        active = np.ones(n_batch, dtype=bool)
+        for _ in range(30):
+            residual, jacobian = system(z)
+            error = np.abs(residual).max(axis=1, initial=0.0)
+            escaped = ((z[:, probabilities] < -2.0) | (z[:, probabilities] > 3.0)).any(axis=1)
+            escaped |= ((z[:, values] < low) | (z[:, values] > high)).any(axis=1)
+            active &= (error > 1e-12) & ~escaped
+            if not active.any():
+                break
+            if stats is not None:
+                stats.count('linear_systems_solved', int(active.sum()))
+            try:
+                step = np.linalg.solve(jacobian[active], residual[active][:, :, None])[:, :, 0]
+            except np.linalg.LinAlgError:
+                # Degenerate supports have singular Jacobians: take the least-squares step instead
+                step = np.einsum('bij,bj->bi', np.linalg.pinv(jacobian[active]), residual[active])
+            z[active] -= step
+        
+        residual, _ = system(z)
+        converged = np.abs(residual).max(axis=1, initial=0.0) <= 1e-9
+        if stats is not None:
+            stats.count('newton_starts', n_batch)
+            stats.count('candidates_converged', int(converged.sum()))
+        
+        equilibria = []
+        local = unpack(z)
+        for start in np.flatnonzero(converged):
+            # Feasibility: non-negative probabilities and no profitable deviation outside the supports
+            if any((local[p][start] < -1e-9).any() for p in mixed_players):
+                continue
+            
+            strategies = []
+            for p in range(self.n_players):
+                strategy = np.zeros(self.player_actions[p])
+                strategy[supports[p]] = np.clip(local[p][start], 0.0, None)
+                strategies.append(strategy / strategy.sum())
+            
+            if self._is_mixed_nash_equilibrium(strategies):
+                if not any(self._is_same_mixed_ne(strategies, existing) for existing in equilibria):
+                    equilibria.append(strategies)
+        
+        return equilibria
+    
+    def _subdivide_supports(self, sub_payoffs: List[np.ndarray], mixed_players: List[int], rounds: int,
+                            max_cells: int) -> Optional[Dict[int, np.ndarray]]:
+        # Exclusion search over products of sub-simplices. Each indifference equation
+        # E_p(a) - E_p(a_0) = 0 is multilinear in the other players' strategies, so its exact range
+        # over a cell is spanned by its values at the cell's vertex combinations; a cell where some
+        # equation keeps one sign cannot hold an equilibrium. Returns the centres of the surviving
+        # cells per mixed player, or None when the whole support profile is excluded.
+        mixed_axes = {p: [q for q in mixed_players if q != p] for p in mixed_players}
+        differences = {}
+        for p in mixed_players:
+            payoffs = np.moveaxis(sub_payoffs[p], p, 0)
+            payoffs = payoffs.reshape((payoffs.shape[0],) + tuple(sub_payoffs[p].shape[q] for q in mixed_axes[p]))
+            differences[p] = payoffs[1:] - payoffs[:1]
+        
+        # vertices[q] has shape (cells, vertex, coordinate) and starts as the whole simplex
+        vertices = {q: np.eye(sub_payoffs[q].shape[q])[None] for q in mixed_players}
+        cell_axis = self.n_players
+        equation_axis = self.n_players + 1
+        vertex_axes = {q: self.n_players + 2 + i for i, q in enumerate(mixed_players)}
+        
+        for level in range(rounds * len(mixed_players) + 1):
+            keep = np.ones(len(vertices[mixed_players[0]]), dtype=bool)
+            for p in mixed_players:
+                operands = [differences[p], [equation_axis] + mixed_axes[p]]
+                for q in mixed_axes[p]:
+                    operands += [vertices[q], [cell_axis, vertex_axes[q], q]]
+                values = np.einsum(*operands, [cell_axis, equation_axis] + [vertex_axes[q] for q in mixed_axes[p]])
+                values = values.reshape(values.shape[0], values.shape[1], -1)
+                one_signed = (values > 1e-12).all(axis=2) | (values < -1e-12).all(axis=2)
+                keep &= ~one_signed.any(axis=1)
+            
+            vertices = {q: v[keep] for q, v in vertices.items()}
+            n_cells = int(keep.sum())
+            if n_cells == 0:
+                return None
+            if level == rounds * len(mixed_players) or 2 * n_cells > max_cells:
+                break
+            
+            # Bisect the longest edge of one player's sub-simplex in every surviving cell
+            split = vertices[mixed_players[level % len(mixed_players)]]
+            lengths = np.linalg.norm(split[:, :, None, :] - split[:, None, :, :], axis=3)
+            first, second = np.unravel_index(lengths.reshape(n_cells, -1).argmax(axis=1), lengths.shape[1:])
+            midpoints = 0.5 * (split[np.arange(n_cells), first] + split[np.arange(n_cells), second])
+            left = split.copy()
+            right = split.copy()
+            left[np.arange(n_cells), first] = midpoints
+            right[np.arange(n_cells), second] = midpoints
+            
+            vertices = {q: np.concatenate([v, v]) for q, v in vertices.items()}
+            vertices[mixed_players[level % len(mixed_players)]] = np.concatenate([left, right])
+        
+        return {q: v.mean(axis=1) for q, v in vertices.items()}
+    
+    def _is_mixed_nash_equilibrium(self, strategies: List[np.ndarray]) -> bool:
+        # Expected payoff of every action for every player, from one contraction per player
+        table = expected_payoff_table(self.payoff_matrices, strategies)
+        scales = self._payoff_scales()
+        
+        for player in range(self.n_players):
+            expected_payoffs = table[player]
+            tolerance = 1e-6 * scales[player]
+            
+            # Get the support of the player's strategy
+            support = strategies[player] > 1e-10
+            if not support.any():
+                continue
+            
+            # All actions in support must yield the same payoff, and no action may do better
+            support_payoffs = expected_payoffs[support]
+            baseline_payoff = support_payoffs[0]
+            if np.abs(support_payoffs - baseline_payoff).max() > tolerance:
+                return False
+            if expected_payoffs[~support].max(initial=-np.inf) > baseline_payoff + tolerance:
+                return False
+        
+        return True
+    
+    def _regrets(self, strategies: List[np.ndarray]) -> np.ndarray:
+        table = expected_payoff_table(self.payoff_matrices, strategies)
+        return np.array([payoffs.max() - payoffs @ strategies[player] for player, payoffs in enumerate(table)])
+    
+    def batch_regrets(self, strategy_batches: List[np.ndarray]) -> np.ndarray:
+        return batch_regrets(self.payoff_matrices, strategy_batches)
+    
+    def _calculate_expected_payoffs(self, player: int, strategies: List[np.ndarray]) -> np.ndarray:
+        operands = [self.payoff_matrices[player], list(range(self.n_players))]
+        for other in range(self.n_players):
+            if other != player:
+                operands += [strategies[other], [other]]
+        return np.einsum(*operands, [player], optimize=True)
+    
+    def _calculate_expected_payoff(self, player: int, strategies: List[np.ndarray]) -> float:
+        return float(self._calculate_expected_payoffs(player, strategies) @ strategies[player])
+    
+    def _get_payoff(self, player: int, action_profile: Tuple[int, ...]) -> float:
+        return self.payoff_matrices[player][action_profile]
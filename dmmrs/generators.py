@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Callable, Dict, List, Sequence, Union
+
+# Random game families in the spirit of GAMUT. Every generator takes the number of actions per
+# player and a seed (an int, a numpy Generator or None) and returns the payoff tensors.
+Seed = Union[None, int, np.random.Generator]
+
+
+def random_game(player_actions: Sequence[int], seed: Seed = None) -> List[np.ndarray]:
+    # Independent uniform payoffs in [-1, 1)
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-1.0, 1.0, size=tuple(player_actions)) for _ in player_actions]
+
+
+def covariant_game(player_actions: Sequence[int], seed: Seed = None, correlation: float = 0.5) -> List[np.ndarray]:
+    # Payoffs of a profile are jointly normal with this correlation between players: 1 gives common
+    # interest, -1 / (n_players - 1) is as competitive as n players can be
+    n_players = len(player_actions)
+    if not -1.0 / max(1, n_players - 1) <= correlation <= 1.0:
+        raise ValueError(f"Correlation must lie in [{-1.0 / max(1, n_players - 1)}, 1], got {correlation}")
+    rng = np.random.default_rng(seed)
+    covariance = np.full((n_players, n_players), correlation)
+    np.fill_diagonal(covariance, 1.0)
+    # Eigendecomposition rather than Cholesky: the covariance is only semidefinite at the bounds
+    values, vectors = np.linalg.eigh(covariance)
+    factor = vectors * np.sqrt(np.clip(values, 0.0, None))
+    samples = rng.standard_normal(size=tuple(player_actions) + (n_players,)) @ factor.T
+    return [samples[..., player] for player in range(n_players)]
+
+
+def coordination_game(player_actions: Sequence[int], seed: Seed = None) -> List[np.ndarray]:
+    # Common payoffs, and every profile where everybody plays the same action index pays more
+    # than every profile where they do not
+    rng = np.random.default_rng(seed)
+    common = rng.uniform(0.0, 1.0, size=tuple(player_actions))
+    for action in range(min(player_actions)):
+        common[(action,) * len(player_actions)] = rng.uniform(1.0, 2.0)
+    return [common.copy() for _ in player_actions]
+
+
+def zero_sum_game(player_actions: Sequence[int], seed: Seed = None) -> List[np.ndarray]:
+    if len(player_actions) != 2:
+        raise ValueError("Zero-sum games are generated for two players only")
+    rng = np.random.default_rng(seed)
+    payoffs = rng.uniform(-1.0, 1.0, size=tuple(player_actions))
+    return [payoffs, -payoffs]
+
+
+def congestion_game(player_actions: Sequence[int], seed: Seed = None) -> List[np.ndarray]:
+    # Every action is a resource shared by the players who pick it; a player's payoff is minus the
+    # resource's cost at its load, with random non-decreasing cost functions
+    n_players = len(player_actions)
+    n_resources = player_actions[0]
+    if any(n != n_resources for n in player_actions):
+        raise ValueError("Congestion games need the same number of actions for every player")
+    rng = np.random.default_rng(seed)
+    costs = np.cumsum(rng.uniform(0.0, 1.0, size=(n_resources, n_players)), axis=1)
+
+    profiles = np.indices(tuple(player_actions))
+    loads = np.zeros((n_resources,) + tuple(player_actions), dtype=np.int64)
+    for player in range(n_players):
+        loads += profiles[player][None] == np.arange(n_resources).reshape((-1,) + (1,) * n_players)
+    return [-costs[profiles[player], np.take_along_axis(loads, profiles[player][None], axis=0)[0] - 1]
+            for player in range(n_players)]
+
+
+def dominance_solvable_game(player_actions: Sequence[int], seed: Seed = None) -> List[np.ndarray]:
+    # Random payoffs reshaped so that iterated elimination of strictly dominated actions, one
+    # action per player and round, ends in a single profile. The schedule is drawn first and then
+    # imposed backwards, so that making a later victim worse never undoes an earlier dominance.
+    rng = np.random.default_rng(seed)
+    n_players = len(player_actions)
+    payoffs = [rng.uniform(-1.0, 1.0, size=tuple(player_actions)) for _ in player_actions]
+
+    surviving = [list(rng.permutation(n)) for n in player_actions]
+    schedule = []
+    while any(len(actions) > 1 for actions in surviving):
+        for player in range(n_players):
+            if len(surviving[player]) > 1:
+                box = [list(actions) for actions in surviving]
+                victim = surviving[player].pop()
+                witness = surviving[player][rng.integers(len(surviving[player]))]
+                schedule.append((player, victim, witness, box))
+
+    for player, victim, witness, box in reversed(schedule):
+        box[player] = [victim]
+        region = np.ix_(*box)
+        box[player] = [witness]
+        payoffs[player][region] = payoffs[player][np.ix_(*box)] - rng.uniform(0.1, 1.0, size=payoffs[player][region].shape)
+    return payoffs
+
+
+GENERATORS: Dict[str, Callable[..., List[np.ndarray]]] = {
+    'random': random_game,
+    'covariant': covariant_game,
+    'coordination': coordination_game,
+    'zero-sum': zero_sum_game,
+    'congestion': congestion_game,
+    'dominance-solvable': dominance_solvable_game,
+}
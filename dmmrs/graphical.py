@@ -0,0 +1,244 @@
+import abc
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .limits import bounded, stop_requested
+
+
+class _FactoredGame(abc.ABC):
+    # Shared machinery for games whose payoffs are stored as local interaction tables. Subclasses
+    # provide neighbours[p] (the players p's payoff depends on), _payoffs_of_actions(p, profile)
+    # (p's payoff for each of its own actions with everyone else fixed) and
+    # expected_payoffs(p, strategies).
+    player_actions: List[int]
+    neighbours: List[Tuple[int, ...]]
+
+    @property
+    def n_players(self) -> int:
+        return len(self.player_actions)
+
+    @abc.abstractmethod
+    def _payoffs_of_actions(self, player: int, profile: Sequence[int]) -> np.ndarray:
+        ...
+
+    @abc.abstractmethod
+    def expected_payoffs(self, player: int, strategies: List[np.ndarray]) -> np.ndarray:
+        ...
+
+    def payoff(self, player: int, profile: Sequence[int]) -> float:
+        return float(self._payoffs_of_actions(player, profile)[profile[player]])
+
+    def payoffs(self, profile: Sequence[int]) -> np.ndarray:
+        return np.array([self.payoff(player, profile) for player in range(self.n_players)])
+
+    def best_responses(self, player: int, profile: Sequence[int], tolerance: float = 0.0) -> np.ndarray:
+        # The player's best actions with everyone else playing as in profile
+        values = self._payoffs_of_actions(player, profile)
+        return np.flatnonzero(values >= values.max() - tolerance)
+
+    def is_pure_nash(self, profile: Sequence[int]) -> bool:
+        for player in range(self.n_players):
+            values = self._payoffs_of_actions(player, profile)
+            if values[profile[player]] < values.max():
+                return False
+        return True
+
+    def expected_payoff_table(self, strategies: List[np.ndarray]) -> List[np.ndarray]:
+        # [player][action] = expected payoff of the pure action against the others' mixed strategies
+        return [self.expected_payoffs(player, strategies) for player in range(self.n_players)]
+
+    def regrets(self, strategies: List[np.ndarray]) -> np.ndarray:
+        table = self.expected_payoff_table(strategies)
+        return np.array([payoffs.max() - payoffs @ strategies[player] for player, payoffs in enumerate(table)])
+
+    def _scopes(self) -> Tuple[List[set], List[set]]:
+        # scopes[p]: players in p's best-response constraint; users[q]: constraints that involve q
+        scopes = [set(self.neighbours[p]) | {p} for p in range(self.n_players)]
+        users = [set() for _ in range(self.n_players)]
+        for p, scope in enumerate(scopes):
+            for q in scope:
+                users[q].add(p)
+        return scopes, users
+
+    def _elimination_order(self) -> List[int]:
+        # Greedy order keeping the DP frontier small: repeatedly assign the player after which the
+        # fewest assigned players still appear in an unchecked constraint
+        scopes, users = self._scopes()
+        missing = [len(scope) for scope in scopes]
+        open_count = [len(users[q]) for q in range(self.n_players)]
+        frontier = 0
+        unassigned = set(range(self.n_players))
+        order = []
+        while unassigned:
+            best = None
+            for v in sorted(unassigned):
+                closing = [p for p in users[v] if missing[p] == 1]
+                drops = {}
+                for p in closing:
+                    for q in scopes[p]:
+                        drops[q] = drops.get(q, 0) + 1
+                released = sum(1 for q, count in drops.items() if open_count[q] == count)
+                size = frontier + 1 - released
+                if best is None or size < best[0]:
+                    best = (size, v, closing)
+            size, v, closing = best
+            for p in users[v]:
+                missing[p] -= 1
+            for p in closing:
+                for q in scopes[p]:
+                    open_count[q] -= 1
+            frontier = size
+            unassigned.discard(v)
+            order.append(v)
+        return order
+
+    def iter_pure_nash(self, order: Optional[Sequence[int]] = None, limit: Optional[int] = None,
+                       deadline: Optional[float] = None, cancel=None) -> Iterator[Tuple[int, ...]]:
+        # limit, deadline and cancel (see dmmrs.limits) are also checked between frontier states
+        # of the forward pass, which has to finish before the first equilibrium is known
+        yield from bounded(self._iter_pure_nash(order, deadline, cancel), limit, deadline, cancel)
+
+    def _iter_pure_nash(self, order: Optional[Sequence[int]], deadline: Optional[float],
+                        cancel) -> Iterator[Tuple[int, ...]]:
+        # Frontier dynamic program over the interaction graph. Players are assigned one at a time;
+        # a player's best-response constraint is checked as soon as its whole neighbourhood is
+        # assigned, and only the assigned players that still appear in an unchecked constraint (the
+        # frontier) are remembered. Time and memory grow with prod(n_i) over the largest frontier,
+        # i.e. exponentially in the graph's pathwidth rather than in the number of players.
+        order = self._elimination_order() if order is None else list(order)
+        scopes, users = self._scopes()
+        missing = [len(scope) for scope in scopes]
+        open_count = [len(users[q]) for q in range(self.n_players)]
+
+        frontier: Tuple[int, ...] = ()
+        # layers[t] maps a frontier assignment to its (previous frontier assignment, action) pairs
+        layers: List[Dict[Tuple[int, ...], List[Tuple[Tuple[int, ...], int]]]] = [{(): []}]
+        for variable in order:
+            ready = []
+            for p in users[variable]:
+                missing[p] -= 1
+                if missing[p] == 0:
+                    ready.append(p)
+            for p in ready:
+                for q in scopes[p]:
+                    open_count[q] -= 1
+            next_frontier = tuple(sorted(q for q in frontier + (variable,) if open_count[q] > 0))
+
+            layer: Dict[Tuple[int, ...], List[Tuple[Tuple[int, ...], int]]] = {}
+            profile = [0] * self.n_players
+            for state in layers[-1]:
+                if stop_requested(deadline, cancel):
+                    return
+                for q, action in zip(frontier, state):
+                    profile[q] = action
+                for action in range(self.player_actions[variable]):
+                    profile[variable] = action
+                    if all(self._is_best(p, profile) for p in ready):
+                        key = tuple(profile[q] for q in next_frontier)
+                        layer.setdefault(key, []).append((state, action))
+            if not layer:
+                return
+            layers.append(layer)
+            frontier = next_frontier
+
+        # Walk the back-pointers from the final (empty) frontier; every path is an equilibrium
+        stack = [(len(order), (), ())]
+        while stack:
+            t, state, suffix = stack.pop()
+            if t == 0:
+                profile = [0] * self.n_players
+                for variable, action in zip(order, suffix):
+                    profile[variable] = action
+                yield tuple(profile)
+                continue
+            for previous, action in reversed(layers[t][state]):
+                stack.append((t - 1, previous, (action,) + suffix))
+
+    def _is_best(self, player: int, profile: Sequence[int]) -> bool:
+        values = self._payoffs_of_actions(player, profile)
+        return values[profile[player]] >= values.max()
+
+    def find_pure_nash_equilibria(self, order: Optional[Sequence[int]] = None) -> List[Tuple[int, ...]]:
+        return sorted(self.iter_pure_nash(order))
+
+    def to_strategic_form(self):
+        # Dense equivalent, only sensible for small games (prod(player_actions) entries per player)
+        from .game import StrategicFormGame
+
+        payoff_matrices = []
+        for player in range(self.n_players):
+            tensor = np.zeros(self.player_actions)
+            for profile in np.ndindex(*self.player_actions):
+                tensor[profile] = self.payoff(player, profile)
+            payoff_matrices.append(tensor)
+        return StrategicFormGame(payoff_matrices, list(self.player_actions))
+
+
+class GraphicalGame(_FactoredGame):
+    # Player p's payoff depends only on its own action and those of neighbours[p].
+    # local_payoffs[p] has axes (p, *neighbours[p]), i.e. shape (n_p, n_q for q in neighbours[p]),
+    # so storage is sum_p prod over p's closed neighbourhood instead of n_players * prod(n_i).
+    def __init__(self, player_actions: List[int], neighbours: List[Sequence[int]], local_payoffs: List[np.ndarray]):
+        self.player_actions = list(player_actions)
+        self.neighbours = [tuple(int(q) for q in nbrs) for nbrs in neighbours]
+        self.local_payoffs = [np.asarray(payoffs) for payoffs in local_payoffs]
+
+        for p, (nbrs, payoffs) in enumerate(zip(self.neighbours, self.local_payoffs)):
+            if p in nbrs or len(set(nbrs)) != len(nbrs):
+                raise ValueError(f"Neighbours of player {p} must be distinct other players")
+            expected = (self.player_actions[p],) + tuple(self.player_actions[q] for q in nbrs)
+            if payoffs.shape != expected:
+                raise ValueError(f"Local payoffs of player {p} have incorrect shape. Expected {expected}, got {payoffs.shape}")
+
+    def _payoffs_of_actions(self, player: int, profile: Sequence[int]) -> np.ndarray:
+        return self.local_payoffs[player][(slice(None),) + tuple(profile[q] for q in self.neighbours[player])]
+
+    def expected_payoffs(self, player: int, strategies: List[np.ndarray]) -> np.ndarray:
+        # One contraction of the local table with the neighbours' strategies
+        nbrs = self.neighbours[player]
+        operands = [self.local_payoffs[player], list(range(len(nbrs) + 1))]
+        for axis, q in enumerate(nbrs, 1):
+            operands += [strategies[q], [axis]]
+        return np.einsum(*operands, [0], optimize=True)
+
+
+class PolymatrixGame(_FactoredGame):
+    # Payoffs are sums of pairwise interactions: u_p(a) = sum over edges (p, q) of
+    # edges[(p, q)][a_p, a_q], where edges[(p, q)] has shape (n_p, n_q). The edge (q, p), if
+    # present, gives q's side of the same interaction.
+    def __init__(self, player_actions: List[int], edges: Dict[Tuple[int, int], np.ndarray]):
+        self.player_actions = list(player_actions)
+        self.edges = {(int(p), int(q)): np.asarray(matrix) for (p, q), matrix in edges.items()}
+        self._out_edges: List[List[Tuple[int, np.ndarray]]] = [[] for _ in self.player_actions]
+        for (p, q), matrix in sorted(self.edges.items()):
+            if p == q:
+                raise ValueError(f"Edge ({p}, {q}) is a self-loop")
+            if matrix.shape != (self.player_actions[p], self.player_actions[q]):
+                raise ValueError(f"Edge ({p}, {q}) has incorrect shape. Expected "
+                                 f"{(self.player_actions[p], self.player_actions[q])}, got {matrix.shape}")
+            self._out_edges[p].append((q, matrix))
+        self.neighbours = [tuple(q for q, _ in out) for out in self._out_edges]
+
+    def _payoffs_of_actions(self, player: int, profile: Sequence[int]) -> np.ndarray:
+        values = np.zeros(self.player_actions[player])
+        for q, matrix in self._out_edges[player]:
+            values = values + matrix[:, profile[q]]
+        return values
+
+    def expected_payoffs(self, player: int, strategies: List[np.ndarray]) -> np.ndarray:
+        values = np.zeros(self.player_actions[player])
+        for q, matrix in self._out_edges[player]:
+            values = values + matrix @ strategies[q]
+        return values
+
+    def to_graphical(self) -> GraphicalGame:
+        # Local tables are the broadcast sums of a player's edge matrices
+        local_payoffs = []
+        for player, out in enumerate(self._out_edges):
+            table = np.zeros((self.player_actions[player],) + tuple(self.player_actions[q] for q, _ in out))
+            for axis, (_, matrix) in enumerate(out, 1):
+                shape = [1] * table.ndim
+                shape[0], shape[axis] = matrix.shape
+                table = table + matrix.reshape(shape)
+            local_payoffs.append(table)
+        return GraphicalGame(self.player_actions, self.neighbours, local_payoffs)
@@ -0,0 +1,80 @@
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional
+
+# Opt-in solver instrumentation. Solvers look up the active SolverStats once per call and guard
+# every hook with `if stats is not None`, so with instrumentation off (the default) the cost is a
+# context-variable lookup per call and a None check per hook.
+_ACTIVE: ContextVar[Optional['SolverStats']] = ContextVar('dmmrs_solver_stats', default=None)
+_NO_PHASE = nullcontext()
+
+
+class SolverStats:
+    # counters[name]: events counted by the solvers (profiles scanned, supports tried, ...)
+    # timings[name]: wall time spent in each phase, inclusive of nested phases
+    # phase_calls[name]: how often each phase was entered
+    # progress(stats), if given, is called from count() at most every progress_interval seconds
+    def __init__(self, progress: Optional[Callable[['SolverStats'], None]] = None, progress_interval: float = 1.0):
+        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, float] = {}
+        self.phase_calls: Dict[str, int] = {}
+        self._progress = progress
+        self._progress_interval = progress_interval
+        self._next_progress = time.perf_counter() + progress_interval
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + int(amount)
+        if self._progress is not None:
+            now = time.perf_counter()
+            if now >= self._next_progress:
+                self._next_progress = now + self._progress_interval
+                self._progress(self)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+            self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+
+    def merge(self, counters: Dict[str, int], timings: Optional[Dict[str, float]] = None):
+        # Adds counts (and phase times, e.g. summed over worker processes) collected elsewhere
+        for name, amount in counters.items():
+            self.count(name, amount)
+        for name, seconds in (timings or {}).items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        return {'counters': dict(self.counters), 'timings': dict(self.timings), 'phase_calls': dict(self.phase_calls)}
+
+    def __repr__(self) -> str:
+        return f"SolverStats(counters={self.counters}, timings={self.timings})"
+
+
+def active_stats() -> Optional[SolverStats]:
+    return _ACTIVE.get()
+
+
+def phase(name: str):
+    # Times a phase in the active stats; a shared no-op context when instrumentation is off
+    stats = _ACTIVE.get()
+    return _NO_PHASE if stats is None else stats.phase(name)
+
+
+@contextmanager
+def instrument(progress: Optional[Callable[[SolverStats], None]] = None, progress_interval: float = 1.0,
+               stats: Optional[SolverStats] = None) -> Iterator[SolverStats]:
+    # Collects stats for every solver called inside the block (in this thread or task):
+    #     with instrument() as stats:
+    #         equilibria = game.find_all_mixed_nash_equilibria()
+    #     stats.counters['supports_tried']
+    # Pass stats to keep accumulating into an existing SolverStats.
+    stats = SolverStats(progress, progress_interval) if stats is None else stats
+    token = _ACTIVE.set(stats)
+    try:
+        yield stats
+    finally:
+        _ACTIVE.reset(token)
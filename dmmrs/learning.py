@@ -0,0 +1,160 @@
+import numpy as np
+import time
+from collections import namedtuple
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .instrumentation import active_stats
+
+# strategies: the best profile seen (lowest epsilon), epsilon: its largest regret over players,
+# iterations: iterations run, converged: epsilon reached the target, elapsed: wall time in seconds
+LearningResult = namedtuple('LearningResult', ['strategies', 'epsilon', 'iterations', 'converged', 'elapsed'])
+
+# callback(iteration, epsilon, strategies) is called at every check; returning True stops the run
+LearningCallback = Callable[[int, float, List[np.ndarray]], Optional[bool]]
+
+
+class _PayoffContraction:
+    # expected_payoff_table with the einsum contraction order worked out once per game instead of
+    # on every call, since the learning dynamics evaluate it thousands of times on the same tensors
+    def __init__(self, payoff_matrices: List[np.ndarray]):
+        self.payoff_matrices = [np.asarray(payoffs, dtype=float) for payoffs in payoff_matrices]
+        self.n_players = len(self.payoff_matrices)
+        self.player_actions = list(self.payoff_matrices[0].shape)
+        uniform = [np.full(n, 1.0 / n) for n in self.player_actions]
+        self._paths = []
+        for player in range(self.n_players):
+            operands = self._operands(player, uniform)
+            self._paths.append(np.einsum_path(*operands, [player], optimize='optimal')[0])
+
+    def _operands(self, player: int, strategies: List[np.ndarray]) -> list:
+        operands = [self.payoff_matrices[player], list(range(self.n_players))]
+        for other in range(self.n_players):
+            if other != player:
+                operands += [strategies[other], [other]]
+        return operands
+
+    def table(self, strategies: List[np.ndarray]) -> List[np.ndarray]:
+        # [player][action] = expected payoff of the pure action against the others' strategies
+        return [np.einsum(*self._operands(player, strategies), [player], optimize=self._paths[player])
+                for player in range(self.n_players)]
+
+
+def _epsilon(table: List[np.ndarray], strategies: List[np.ndarray]) -> float:
+    return max(float(payoffs.max() - payoffs @ strategy) for payoffs, strategy in zip(table, strategies))
+
+
+def _anytime(iterates: Iterator[Tuple[List[np.ndarray], Optional[float]]], contraction: _PayoffContraction,
+             epsilon: float, max_iterations: int, time_budget: Optional[float],
+             callback: Optional[LearningCallback], check_every: int) -> LearningResult:
+    # Drives one of the dynamics below. Each iterate is a profile and, when the dynamics got it for
+    # free, its epsilon; otherwise epsilon is computed every check_every iterations. Stops at the
+    # target epsilon, after max_iterations or once time_budget seconds have passed, and returns the
+    # best profile seen so far, so an interrupted run is still the best available approximation.
+    start = time.perf_counter()
+    deadline = None if time_budget is None else start + time_budget
+    best_strategies, best_epsilon = None, np.inf
+    iteration = 0
+    stats = active_stats()
+    for iteration, (strategies, current) in enumerate(iterates, 1):
+        if stats is not None:
+            stats.count('learning_iterations')
+        checked = current is not None or iteration % check_every == 0 or iteration == max_iterations
+        if checked:
+            if current is None:
+                current = _epsilon(contraction.table(strategies), strategies)
+            if current < best_epsilon:
+                best_strategies, best_epsilon = [np.array(s) for s in strategies], current
+            if callback is not None and callback(iteration, current, strategies):
+                break
+            if best_epsilon <= epsilon:
+                break
+        if iteration >= max_iterations or (deadline is not None and time.perf_counter() >= deadline):
+            break
+    return LearningResult(best_strategies, best_epsilon, iteration, best_epsilon <= epsilon, time.perf_counter() - start)
+
+
+def _initial_strategies(contraction: _PayoffContraction, initial: Optional[List[np.ndarray]]) -> List[np.ndarray]:
+    if initial is None:
+        return [np.full(n, 1.0 / n) for n in contraction.player_actions]
+    return [np.asarray(strategy, dtype=float) / np.sum(strategy) for strategy in initial]
+
+
+def _fictitious_play(contraction: _PayoffContraction, initial: Optional[List[np.ndarray]]):
+    # Simultaneous fictitious play: everybody best-responds to the empirical frequencies of the
+    # others' past play. The table used for the best responses also gives the frequencies' epsilon.
+    counts = _initial_strategies(contraction, initial)
+    total = 1.0
+    while True:
+        averages = [c / total for c in counts]
+        table = contraction.table(averages)
+        yield averages, _epsilon(table, averages)
+        for player, payoffs in enumerate(table):
+            counts[player][np.argmax(payoffs)] += 1.0
+        total += 1.0
+
+
+def _regret_matching(contraction: _PayoffContraction, initial: Optional[List[np.ndarray]]):
+    # Regret matching: play each action in proportion to its positive cumulative regret. The average
+    # strategies converge to equilibrium in two-player zero-sum games (to a coarse correlated
+    # equilibrium in general), so they are what is reported.
+    current = _initial_strategies(contraction, initial)
+    regrets = [np.zeros(n) for n in contraction.player_actions]
+    sums = [np.zeros(n) for n in contraction.player_actions]
+    while True:
+        table = contraction.table(current)
+        for player, payoffs in enumerate(table):
+            regrets[player] += payoffs - payoffs @ current[player]
+            sums[player] += current[player]
+        yield [s / s.sum() for s in sums], None
+        for player, regret in enumerate(regrets):
+            positive = np.maximum(regret, 0.0)
+            total = positive.sum()
+            current[player] = positive / total if total > 0 else np.full(len(regret), 1.0 / len(regret))
+
+
+def _replicator_dynamics(contraction: _PayoffContraction, initial: Optional[List[np.ndarray]], step_size: float):
+    # Discrete-time (exponential) replicator dynamics: actions grow in proportion to exp(step_size *
+    # payoff advantage). The current profile is reported; its epsilon comes from the same table.
+    current = _initial_strategies(contraction, initial)
+    while True:
+        table = contraction.table(current)
+        yield current, _epsilon(table, current)
+        updated = []
+        for player, payoffs in enumerate(table):
+            weights = current[player] * np.exp(step_size * (payoffs - payoffs.max()))
+            updated.append(weights / weights.sum())
+        current = updated
+
+
+def fictitious_play(payoff_matrices: List[np.ndarray], epsilon: float = 1e-3, max_iterations: int = 100000,
+                    time_budget: Optional[float] = None, callback: Optional[LearningCallback] = None,
+                    initial: Optional[List[np.ndarray]] = None) -> LearningResult:
+    contraction = _PayoffContraction(payoff_matrices)
+    return _anytime(_fictitious_play(contraction, initial), contraction, epsilon, max_iterations,
+                    time_budget, callback, 1)
+
+
+def regret_matching(payoff_matrices: List[np.ndarray], epsilon: float = 1e-3, max_iterations: int = 100000,
+                    time_budget: Optional[float] = None, callback: Optional[LearningCallback] = None,
+                    initial: Optional[List[np.ndarray]] = None, check_every: int = 10) -> LearningResult:
+    # Checking epsilon costs one more contraction, hence only every check_every iterations
+    contraction = _PayoffContraction(payoff_matrices)
+    return _anytime(_regret_matching(contraction, initial), contraction, epsilon, max_iterations,
+                    time_budget, callback, check_every)
+
+
+def replicator_dynamics(payoff_matrices: List[np.ndarray], epsilon: float = 1e-3, max_iterations: int = 100000,
+                        time_budget: Optional[float] = None, callback: Optional[LearningCallback] = None,
+                        initial: Optional[List[np.ndarray]] = None, step_size: float = 0.1) -> LearningResult:
+    # Starts from the uniform profile unless given an interior one: actions with zero probability
+    # never come back
+    contraction = _PayoffContraction(payoff_matrices)
+    return _anytime(_replicator_dynamics(contraction, initial, step_size), contraction, epsilon, max_iterations,
+                    time_budget, callback, 1)
+
+
+LEARNING_METHODS = {
+    'fictitious-play': fictitious_play,
+    'regret-matching': regret_matching,
+    'replicator': replicator_dynamics,
+}
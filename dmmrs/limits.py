@@ -0,0 +1,31 @@
+import time
+from typing import Iterable, Iterator, Optional, TypeVar
+
+# Shared stopping rules of the iter_* searches:
+#   limit:    stop after yielding this many results
+#   deadline: stop once time.monotonic() reaches this value (e.g. time.monotonic() + 0.05)
+#   cancel:   any object with is_set(), e.g. a threading.Event set by another thread
+# Searches check deadline and cancel between units of work (a support profile, a chunk of
+# profiles, a polytope basis), so they stop promptly even while nothing is being found.
+T = TypeVar('T')
+
+
+def stop_requested(deadline: Optional[float] = None, cancel=None) -> bool:
+    return (deadline is not None and time.monotonic() >= deadline) or (cancel is not None and cancel.is_set())
+
+
+def bounded(results: Iterable[T], limit: Optional[int] = None, deadline: Optional[float] = None,
+            cancel=None) -> Iterator[T]:
+    # Applies the stopping rules to an iterator that does not check them itself; they are checked
+    # before each item is requested, so a stopped search does no further work
+    results = iter(results)
+    count = 0
+    while limit is None or count < limit:
+        if stop_requested(deadline, cancel):
+            return
+        try:
+            result = next(results)
+        except StopIteration:
+            return
+        yield result
+        count += 1
@@ -0,0 +1,154 @@
+import numpy as np
+from itertools import product
+from typing import Iterable, List, Sequence, Set, Tuple
+
+from .dominance import DominanceResult
+from .elimination import _weak_comparison_counts
+from .instrumentation import active_stats
+from .pure import iter_pure_nash
+
+
+class MutableGame:
+    # A game whose payoff entries change between queries, with its analyses kept up to date. Per
+    # player it maintains:
+    #   best[p]          max over p's axis for every opponent profile (the best-response value)
+    #   br_counts[p]     per action, the opponent profiles where it is a best response; and
+    #   unique_counts[p] where it is the only one (dominant strategies are the actions with full counts)
+    #   comparisons[p]   [i, j] = opponent profiles where i <= j, as in elimination's counts; i
+    #                    strictly dominates j when it is 0 and weakly when [j, i] covers every profile
+    #   minima[p]        worst payoff of every action, with the number of entries attaining it
+    # plus the set of pure Nash equilibria. A changed entry of player p only touches p's fiber
+    # through it (the n_p profiles that differ in p's action): O(n_p^2 + n_p * n_players) work, and a
+    # rescan of one row of p's payoffs only when the last entry attaining a row minimum goes up.
+    def __init__(self, payoff_matrices: List[np.ndarray]):
+        self.payoff_matrices = [np.array(payoffs, dtype=float) for payoffs in payoff_matrices]
+        self.player_actions = list(self.payoff_matrices[0].shape)
+        self.n_players = len(self.player_actions)
+        for i, payoffs in enumerate(self.payoff_matrices):
+            if payoffs.shape != tuple(self.player_actions):
+                raise ValueError(f"Payoff matrix for player {i} has incorrect shape. Expected {tuple(self.player_actions)}, got {payoffs.shape}")
+
+        self.best, self.br_counts, self.unique_counts = [], [], []
+        self.comparisons, self.minima, self.minimum_counts = [], [], []
+        for player, payoffs in enumerate(self.payoff_matrices):
+            best = payoffs.max(axis=player, keepdims=True)
+            table = payoffs == best
+            unique = table & (table.sum(axis=player, keepdims=True) == 1)
+            rows = np.moveaxis(payoffs, player, 0).reshape(self.player_actions[player], -1)
+            self.best.append(best)
+            self.br_counts.append(np.moveaxis(table, player, 0).reshape(rows.shape).sum(axis=1))
+            self.unique_counts.append(np.moveaxis(unique, player, 0).reshape(rows.shape).sum(axis=1))
+            self.comparisons.append(_weak_comparison_counts(rows))
+            self.minima.append(rows.min(axis=1))
+            self.minimum_counts.append((rows == self.minima[-1][:, None]).sum(axis=1))
+        self.n_opponent_profiles = [int(np.prod(self.player_actions)) // n for n in self.player_actions]
+        self.pure_nash: Set[Tuple[int, ...]] = set(iter_pure_nash(self.payoff_matrices))
+
+    @classmethod
+    def from_game(cls, game) -> 'MutableGame':
+        return cls(game.payoff_matrices)
+
+    def to_game(self):
+        from .game import StrategicFormGame
+        return StrategicFormGame([payoffs.copy() for payoffs in self.payoff_matrices], list(self.player_actions))
+
+    def _fiber(self, player: int, profile: Sequence[int]) -> tuple:
+        index = list(profile)
+        index[player] = slice(None)
+        return tuple(index)
+
+    def _is_best_response(self, player: int, profile: Tuple[int, ...]) -> bool:
+        best_index = list(profile)
+        best_index[player] = 0
+        return self.payoff_matrices[player][profile] == self.best[player][tuple(best_index)]
+
+    def set_payoff(self, player: int, profile: Sequence[int], value: float):
+        profile = tuple(int(a) for a in profile)
+        payoffs = self.payoff_matrices[player]
+        old = payoffs[profile]
+        if old == value:
+            return
+        stats = active_stats()
+        if stats is not None:
+            stats.count('payoff_cells_patched')
+
+        fiber = self._fiber(player, profile)
+        before = payoffs[fiber].copy()
+        payoffs[profile] = value
+        after = payoffs[fiber]
+        action = profile[player]
+
+        # Dominance counts: only this opponent profile's comparisons change
+        self.comparisons[player] += ((after[:, None] <= after[None, :]).astype(np.int64)
+                                     - (before[:, None] <= before[None, :]))
+
+        # Best responses in the fiber
+        best_before, best_after = before == before.max(), after == after.max()
+        self.br_counts[player] += best_after.astype(np.int64) - best_before
+        if best_before.sum() == 1:
+            self.unique_counts[player][best_before] -= 1
+        if best_after.sum() == 1:
+            self.unique_counts[player][best_after] += 1
+        best_index = list(profile)
+        best_index[player] = 0
+        self.best[player][tuple(best_index)] = after.max()
+
+        # Pure equilibria: only profiles of the fiber whose best-response status changed
+        for other in np.flatnonzero(best_before != best_after):
+            candidate = profile[:player] + (int(other),) + profile[player + 1:]
+            if not best_after[other]:
+                self.pure_nash.discard(candidate)
+            elif all(self._is_best_response(q, candidate) for q in range(self.n_players) if q != player):
+                self.pure_nash.add(candidate)
+
+        # Row minimum of the changed action
+        minima, counts = self.minima[player], self.minimum_counts[player]
+        if old == minima[action]:
+            counts[action] -= 1
+        if value < minima[action]:
+            minima[action], counts[action] = value, 1
+        elif value == minima[action]:
+            counts[action] += 1
+        if counts[action] == 0:
+            if stats is not None:
+                stats.count('minima_rescans')
+            row = np.take(payoffs, action, axis=player)
+            minima[action] = row.min()
+            counts[action] = int((row == minima[action]).sum())
+
+    def update(self, player: int, profiles: Iterable[Sequence[int]], values: Iterable[float]):
+        # Patch several entries of one player's payoffs
+        for profile, value in zip(profiles, values):
+            self.set_payoff(player, profile, value)
+
+    def find_pure_nash_equilibria(self) -> List[Tuple[int, ...]]:
+        return sorted(self.pure_nash)
+
+    def best_responses(self, player: int, profile: Sequence[int]) -> np.ndarray:
+        column = self.payoff_matrices[player][self._fiber(player, profile)]
+        return np.flatnonzero(column == column.max())
+
+    def find_dominant_strategies(self, dominance_type: str = 'strong') -> List[List[int]]:
+        counts = self.unique_counts if dominance_type == 'strong' else self.br_counts
+        return [np.flatnonzero(c == m).tolist() for c, m in zip(counts, self.n_opponent_profiles)]
+
+    def find_dominant_strategy_equilibria(self, dominance_type: str = 'strong') -> List[Tuple[int, ...]]:
+        dominant = self.find_dominant_strategies(dominance_type)
+        if not all(dominant):
+            return []
+        return list(product(*dominant))
+
+    def find_dominance(self) -> DominanceResult:
+        strict_relations, weak_relations = [], []
+        for comparisons, n_profiles in zip(self.comparisons, self.n_opponent_profiles):
+            strict = comparisons == 0
+            np.fill_diagonal(strict, False)
+            strict_relations.append(strict)
+            weak_relations.append(comparisons.T == n_profiles)
+        return DominanceResult(self.find_dominant_strategies('strong'), self.find_dominant_strategies('weak'),
+                               strict_relations, weak_relations)
+
+    def find_maxmin_values_and_strategies(self) -> Tuple[List, List[List[int]]]:
+        values = [minima.max() for minima in self.minima]
+        strategies = [np.flatnonzero(minima == value).tolist() for minima, value in zip(self.minima, values)]
+        return values, strategies
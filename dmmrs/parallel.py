@@ -0,0 +1,72 @@
+import numpy as np
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, List, Optional, Tuple
+
+from .game import StrategicFormGame
+from .instrumentation import active_stats, instrument
+from .support import iter_support_profiles
+
+# Worker-side game, rebuilt once per process on top of the shared payoff tensors
+_WORKER_GAME: Optional['StrategicFormGame'] = None
+_WORKER_BLOCKS: List[shared_memory.SharedMemory] = []
+
+
+def _attach_shared_game(names: List[str], player_actions: List[int]):
+    global _WORKER_GAME, _WORKER_BLOCKS
+    _WORKER_BLOCKS = []
+    payoff_matrices = []
+    for name in names:
+        # Workers share the parent's resource tracker, so the parent's unlink cleans these up
+        block = shared_memory.SharedMemory(name=name)
+        _WORKER_BLOCKS.append(block)
+        payoff_matrices.append(np.ndarray(tuple(player_actions), dtype=np.float64, buffer=block.buf))
+    _WORKER_GAME = StrategicFormGame(payoff_matrices, player_actions)
+
+
+def _check_support_chunk(chunk: List[Tuple[Tuple[int, ...], ...]], instrumented: bool = False):
+    # Returns the chunk's equilibria and, when the parent is instrumented, the worker's stats
+    if not instrumented:
+        return [equilibrium for supports in chunk for equilibrium in _WORKER_GAME._check_support(supports)], None
+    with instrument() as stats:
+        equilibria = [equilibrium for supports in chunk for equilibrium in _WORKER_GAME._check_support(supports)]
+    return equilibria, stats
+
+
+def _parallel_support_search(game: 'StrategicFormGame', n_jobs: int, chunk_size: int) -> Iterator[List[List[np.ndarray]]]:
+    # Shard the support profiles into chunks over a process pool. The payoff tensors are copied
+    # once into shared memory and mapped by every worker instead of being pickled per task. At
+    # most a few chunks per worker are in flight, and results are yielded in submission order.
+    # Worker stats are merged into the active stats, with phase times summed over workers.
+    stats = active_stats()
+    blocks = []
+    try:
+        for payoffs in game.payoff_matrices:
+            payoffs = np.ascontiguousarray(payoffs, dtype=np.float64)
+            block = shared_memory.SharedMemory(create=True, size=max(1, payoffs.nbytes))
+            np.ndarray(payoffs.shape, dtype=np.float64, buffer=block.buf)[...] = payoffs
+            blocks.append(block)
+        
+        supports = iter_support_profiles(game.player_actions)
+        chunks = iter(lambda: list(itertools.islice(supports, chunk_size)), [])
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_attach_shared_game,
+                                 initargs=([block.name for block in blocks], list(game.player_actions))) as pool:
+            def collect(future):
+                equilibria, worker_stats = future.result()
+                if worker_stats is not None:
+                    stats.merge(worker_stats.counters, worker_stats.timings)
+                return equilibria
+            
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_check_support_chunk, chunk, stats is not None))
+                if len(pending) >= 4 * n_jobs:
+                    yield collect(pending.popleft())
+            while pending:
+                yield collect(pending.popleft())
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,63 @@
+import numpy as np
+from typing import Iterator, List, Optional, Tuple
+
+from .instrumentation import active_stats
+from .limits import stop_requested
+
+# Upper bound on the number of payoff entries examined per chunk
+PURE_NASH_CHUNK_ELEMENTS = 1 << 22
+
+
+def iter_pure_nash(payoff_matrices: List[np.ndarray], chunk_elements: int = PURE_NASH_CHUNK_ELEMENTS,
+                   limit: Optional[int] = None, deadline: Optional[float] = None, cancel=None) -> Iterator[Tuple[int, ...]]:
+    # A profile is a pure NE iff it is in every player's best-response mask, where the mask of
+    # player p compares each entry with the max along p's axis. Trailing axes that fit in
+    # chunk_elements are processed together; leading axes are iterated over, so memory stays
+    # bounded even for memory-mapped tensors larger than RAM. Equilibria are yielded chunk by
+    # chunk; limit, deadline and cancel (see dmmrs.limits) are checked before every chunk.
+    if limit is not None and limit <= 0:
+        return
+    shape = np.shape(payoff_matrices[0])
+    n_players = len(shape)
+
+    n_outer = n_players
+    chunk_size = 1
+    while n_outer > 0 and chunk_size * shape[n_outer - 1] <= chunk_elements:
+        n_outer -= 1
+        chunk_size *= shape[n_outer]
+
+    # Players whose axis lies inside the chunk are cheap to check, so do them first
+    player_order = list(range(n_outer, n_players)) + list(range(n_outer))
+
+    stats = active_stats()
+    found = 0
+    for outer_index in np.ndindex(*shape[:n_outer]):
+        if stop_requested(deadline, cancel):
+            return
+        if stats is not None:
+            stats.count('profiles_scanned', chunk_size)
+        mask = None
+        for player in player_order:
+            payoffs = payoff_matrices[player]
+            chunk = np.asarray(payoffs[outer_index])
+            if player >= n_outer:
+                best = chunk.max(axis=player - n_outer, keepdims=True)
+            else:
+                # The player's axis is outside the chunk: read its fiber with the other outer axes fixed
+                fiber_index = outer_index[:player] + (slice(None),) + outer_index[player + 1:]
+                best = np.asarray(payoffs[fiber_index]).max(axis=0)
+
+            player_mask = chunk == best
+            mask = player_mask if mask is None else mask & player_mask
+            if not mask.any():
+                break
+        else:
+            for inner_index in np.argwhere(mask):
+                yield outer_index + tuple(int(i) for i in inner_index)
+                found += 1
+                if found == limit:
+                    return
+
+
+def find_pure_nash(payoff_matrices: List[np.ndarray], chunk_elements: int = PURE_NASH_CHUNK_ELEMENTS) -> List[Tuple[int, ...]]:
+    return list(iter_pure_nash(payoff_matrices, chunk_elements))
@@ -0,0 +1,246 @@
+import numpy as np
+import time
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .instrumentation import active_stats, phase
+from .limits import stop_requested
+from .support import iter_support_profiles
+
+
+def _import_z3():
+    try:
+        import z3
+    except ImportError:
+        raise ImportError("The SMT backend needs Z3 (pip install z3-solver)") from None
+    return z3
+
+
+def _isolated_bound(supports: Tuple[Tuple[int, ...], ...]) -> int:
+    # Most isolated equilibria the support profile can carry: with d_p = |support_p| - 1 free
+    # probabilities per player, player p's d_p indifference equations are multilinear in the other
+    # players' blocks, so by Bernstein's theorem the isolated solutions number at most the
+    # coefficient of prod_q t_q^d_q in prod_p (sum_{q != p} t_q)^d_p
+    degrees = [len(support) - 1 for support in supports]
+    n = len(degrees)
+    terms = {(0,) * n: 1}
+    for p, degree in enumerate(degrees):
+        for _ in range(degree):
+            expanded: Dict[Tuple[int, ...], int] = {}
+            for exponents, coefficient in terms.items():
+                for q in range(n):
+                    if q != p and exponents[q] < degrees[q]:
+                        key = exponents[:q] + (exponents[q] + 1,) + exponents[q + 1:]
+                        expanded[key] = expanded.get(key, 0) + coefficient
+            terms = expanded
+    return terms.get(tuple(degrees), 0)
+
+
+class SMTNashSolver:
+    # Exact Nash equilibria with one incremental Z3 solver per game. The base encoding is asserted
+    # once, over real variables x[p][a] (strategies), u[p][a] (expected payoff of each action) and
+    # v[p] (equilibrium payoff), and a Boolean s[p][a] per action meaning "a is in p's support":
+    #   x >= 0,  sum_a x[p][a] = 1,  u[p][a] = E[U_p(a, .)] under the others' x,  u[p][a] <= v[p]
+    #   s[p][a] -> x[p][a] > 0 and u[p][a] = v[p],   not s[p][a] -> x[p][a] = 0
+    # Payoffs enter as exact rationals (every float is one), so nothing depends on a tolerance.
+    # Two-player games are linear once the supports are fixed and always decided. With more
+    # players the payoff terms are polynomials, which Z3's incremental core often cannot decide;
+    # a check still open after fallback_ms goes to a fresh solver running Z3's complete nonlinear
+    # procedure (the qfnra-nlsat tactic) on a copy of the current assertions, support literals
+    # included; its preprocessing simplifies the fixed supports away. That is quick on small
+    # integer payoffs but can be slow on arbitrary floats, whose exact rationals have 53-bit
+    # denominators; pass a deadline to bound it.
+    #
+    # mode='support' asserts the s literals of one support profile at a time between push() and
+    # pop(), in iter_support_profiles order, so the encoding and the lemmas learned about it are
+    # reused across supports. mode='block' lets the solver pick the supports. Either way each
+    # equilibrium found is cut off by a clause excluding exactly that point, and the search goes
+    # on until unsat, so a support profile with several isolated equilibria (possible with three
+    # or more players) yields all of them. A support can only carry more isolated equilibria than
+    # the multihomogeneous Bezout number of its indifference equations (_isolated_bound) when
+    # they form a continuum, i.e. in a degenerate game; once it does, the whole support is
+    # excluded instead, so the search terminates with a few points of the continuum. The default
+    # is 'block' for two players; with more, the open-ended nonlinear search of 'block' can stall
+    # where fixed supports are decided quickly, so 'support'.
+    def __init__(self, payoff_matrices: List[np.ndarray], fallback_ms: int = 200):
+        z3 = _import_z3()
+        self._z3 = z3
+        self.payoff_matrices = [np.asarray(payoffs, dtype=float) for payoffs in payoff_matrices]
+        self.player_actions = list(self.payoff_matrices[0].shape)
+        self.n_players = len(self.player_actions)
+        # Supports on which the solver gave up (mode='support'), or None for a block search that
+        # stopped on unknown; empty when every answer was sat or unsat
+        self.unknown: List[Optional[Tuple[Tuple[int, ...], ...]]] = []
+
+        with phase('smt-encoding'):
+            self.x = [[z3.Real(f'x_{p}_{a}') for a in range(n)] for p, n in enumerate(self.player_actions)]
+            self.u = [[z3.Real(f'u_{p}_{a}') for a in range(n)] for p, n in enumerate(self.player_actions)]
+            self.v = [z3.Real(f'v_{p}') for p in range(self.n_players)]
+            self.s = [[z3.Bool(f's_{p}_{a}') for a in range(n)] for p, n in enumerate(self.player_actions)]
+            self.solver = z3.Solver()
+            self.fallback_ms = fallback_ms
+            self._nonlinear = z3.Tactic('qfnra-nlsat')
+            for p in range(self.n_players):
+                self.solver.add(z3.Sum(self.x[p]) == 1)
+                others = [q for q in range(self.n_players) if q != p]
+                for a in range(self.player_actions[p]):
+                    x, u, s = self.x[p][a], self.u[p][a], self.s[p][a]
+                    self.solver.add(x >= 0, u <= self.v[p],
+                                    u == self._polynomial(np.take(self.payoff_matrices[p], a, axis=p), others),
+                                    z3.Implies(s, z3.And(x > 0, u == self.v[p])),
+                                    z3.Implies(z3.Not(s), x == 0))
+
+    def _polynomial(self, tensor: np.ndarray, players: List[int]):
+        # Expected payoff of an opponent tensor, nested one player at a time (Horner form) so that
+        # every strategy variable appears once per sub-table instead of once per profile
+        z3 = self._z3
+        if not players:
+            return z3.RealVal(str(Fraction(float(tensor))))
+        terms = []
+        for action in range(tensor.shape[0]):
+            if np.any(tensor[action] != 0):
+                terms.append(self.x[players[0]][action] * self._polynomial(tensor[action], players[1:]))
+        return z3.Sum(terms) if terms else z3.RealVal(0)
+
+    def _literals(self, supports: Tuple[Tuple[int, ...], ...]) -> list:
+        z3 = self._z3
+        return [self.s[p][a] if a in support else z3.Not(self.s[p][a])
+                for p, support in enumerate(supports) for a in range(self.player_actions[p])]
+
+    def _value(self, model, variable) -> float:
+        z3 = self._z3
+        value = model.eval(variable, model_completion=True)
+        if z3.is_algebraic_value(value):
+            value = value.approx(20)
+        return float(value.as_fraction())
+
+    def _strategies(self, model) -> List[np.ndarray]:
+        strategies = [np.array([self._value(model, x) for x in xs]) for xs in self.x]
+        # Exact rationals only lose the last bit in float conversion; renormalize that away
+        return [strategy / strategy.sum() for strategy in strategies]
+
+    def _supports(self, model) -> Tuple[Tuple[int, ...], ...]:
+        z3 = self._z3
+        return tuple(tuple(a for a, s in enumerate(ss) if z3.is_true(model.eval(s, model_completion=True)))
+                     for ss in self.s)
+
+    def _excluding_point(self, model):
+        # Clause true everywhere except at the model's strategy profile (values are exact, possibly
+        # algebraic numbers)
+        z3 = self._z3
+        return z3.Or([x != model.eval(x, model_completion=True) for xs in self.x for x in xs])
+
+    def _timeout(self, deadline: Optional[float], cap: Optional[int] = None) -> int:
+        # Milliseconds left before the deadline, as a Z3 timeout (the largest unsigned int, Z3's
+        # default, means none)
+        timeout = 4294967295 if deadline is None else max(1, int(1000 * (deadline - time.monotonic())))
+        return timeout if cap is None else min(timeout, cap)
+
+    def _check(self, deadline: Optional[float]):
+        # (result, model or None) for the current assertions
+        z3 = self._z3
+        nonlinear = self.n_players > 2
+        stats = active_stats()
+        if stats is not None:
+            stats.count('smt_checks')
+        self.solver.set('timeout', self._timeout(deadline, self.fallback_ms if nonlinear else None))
+        result = self.solver.check()
+        solver = self.solver
+        if result == z3.unknown and nonlinear and not stop_requested(deadline):
+            if stats is not None:
+                stats.count('smt_fallbacks')
+            solver = self._nonlinear.solver()
+            solver.set('timeout', self._timeout(deadline))
+            solver.add(self.solver.assertions())
+            result = solver.check()
+        if result == z3.unknown and stats is not None:
+            stats.count('smt_unknown')
+        return result, solver.model() if result == z3.sat else None
+
+    def check_support(self, supports: Tuple[Tuple[int, ...], ...],
+                      deadline: Optional[float] = None) -> Optional[List[np.ndarray]]:
+        # An equilibrium with exactly these supports, or None if there is none (or Z3 gave up, in
+        # which case the supports are appended to self.unknown)
+        z3 = self._z3
+        self.solver.push()
+        try:
+            self.solver.add(*self._literals(supports))
+            result, model = self._check(deadline)
+            if result == z3.unknown:
+                self.unknown.append(supports)
+            return self._strategies(model) if model is not None else None
+        finally:
+            self.solver.pop()
+
+    def _iter_support(self, supports: Tuple[Tuple[int, ...], ...], deadline: Optional[float],
+                      cancel) -> Iterator[List[np.ndarray]]:
+        # Every isolated equilibrium with exactly these supports (a few points of a continuum if
+        # there are more than _isolated_bound of them)
+        z3 = self._z3
+        bound = max(_isolated_bound(supports), 1)
+        found = 0
+        self.solver.push()
+        try:
+            self.solver.add(*self._literals(supports))
+            while not stop_requested(deadline, cancel):
+                result, model = self._check(deadline)
+                if result != z3.sat:
+                    if result == z3.unknown:
+                        self.unknown.append(supports)
+                    return
+                yield self._strategies(model)
+                found += 1
+                if found > bound:
+                    return
+                self.solver.add(self._excluding_point(model))
+        finally:
+            self.solver.pop()
+
+    def iter_equilibria(self, mode: Optional[str] = None, limit: Optional[int] = None,
+                        deadline: Optional[float] = None, cancel=None) -> Iterator[List[np.ndarray]]:
+        # limit, deadline and cancel as in dmmrs.limits, checked between solver calls
+        if mode is None:
+            mode = 'block' if self.n_players == 2 else 'support'
+        if mode not in ('block', 'support'):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'block' or 'support'")
+        if limit is not None and limit <= 0:
+            return
+        found = 0
+        if mode == 'support':
+            for supports in iter_support_profiles(self.player_actions):
+                if stop_requested(deadline, cancel):
+                    return
+                for strategies in self._iter_support(supports, deadline, cancel):
+                    yield strategies
+                    found += 1
+                    if found == limit:
+                        return
+            return
+
+        # Blocking clauses are scoped to this search, so the solver can be searched again
+        z3 = self._z3
+        per_support: Dict[Tuple[Tuple[int, ...], ...], int] = {}
+        self.solver.push()
+        try:
+            while not stop_requested(deadline, cancel):
+                result, model = self._check(deadline)
+                if result != z3.sat:
+                    if result == z3.unknown:
+                        self.unknown.append(None)
+                    return
+                supports = self._supports(model)
+                per_support[supports] = per_support.get(supports, 0) + 1
+                if per_support[supports] > max(_isolated_bound(supports), 1):
+                    self.solver.add(z3.Not(z3.And(*self._literals(supports))))
+                else:
+                    self.solver.add(self._excluding_point(model))
+                yield self._strategies(model)
+                found += 1
+                if found == limit:
+                    return
+        finally:
+            self.solver.pop()
+
+    def find_all_equilibria(self, mode: Optional[str] = None) -> List[List[np.ndarray]]:
+        with phase('smt-search'):
+            return list(self.iter_equilibria(mode))
@@ -0,0 +1,123 @@
+import numpy as np
+import itertools
+from typing import Dict, Iterator, List, Tuple
+
+
+class EquilibriumStore:
+    # Deduplicating collection of mixed equilibria. Candidates are hashed on a grid of cells much
+    # wider than the matching tolerance (shifted off the common fractions 0, 1/2, 1/3, ...); a
+    # candidate only has to be compared with the stored equilibria in its own cell and in the
+    # neighbouring cells of coordinates that lie within the tolerance of a cell boundary, so
+    # inserts and lookups are amortized O(1) instead of a scan over everything stored.
+    # Matching follows np.allclose(atol=tolerance), like StrategicFormGame._is_same_mixed_ne.
+    GRID_OFFSET = 0.5 * (np.sqrt(5.0) - 1.0)
+    MAX_AMBIGUOUS = 16
+    
+    def __init__(self, tolerance: float = 1e-6):
+        self.tolerance = tolerance
+        # np.allclose also allows rtol * |b| with rtol = 1e-5, and probabilities are at most 1
+        self._radius = tolerance + 1e-5
+        self._cell = 64 * self._radius
+        self._buckets: Dict[Tuple[int, ...], List[int]] = {}
+        self._vectors: List[np.ndarray] = []
+        self._parents: List[int] = []
+        self.equilibria: List[List[np.ndarray]] = []
+        self.candidates = 0
+        self.duplicates = 0
+    
+    def __len__(self) -> int:
+        return len(self.equilibria)
+    
+    def __iter__(self):
+        return iter(self.equilibria)
+    
+    def _cell_of(self, vector: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        scaled = vector / self._cell + self.GRID_OFFSET
+        base = np.floor(scaled)
+        return base.astype(np.int64), scaled - base
+    
+    def _neighbour_keys(self, vector: np.ndarray) -> Iterator[Tuple[int, ...]]:
+        base, fraction = self._cell_of(vector)
+        margin = self._radius / self._cell
+        ambiguous = [(int(i), -1) for i in np.flatnonzero(fraction < margin)]
+        ambiguous += [(int(i), 1) for i in np.flatnonzero(fraction > 1.0 - margin)]
+        
+        base = base.tolist()
+        if not ambiguous:
+            yield tuple(base)
+            return
+        if len(ambiguous) > self.MAX_AMBIGUOUS:
+            # Pathological input: fall back to every bucket rather than 2^k neighbours
+            yield from list(self._buckets)
+            return
+        for shifts in itertools.product((0, 1), repeat=len(ambiguous)):
+            key = list(base)
+            for (i, direction), shift in zip(ambiguous, shifts):
+                key[i] += direction * shift
+            yield tuple(key)
+    
+    def _matches(self, vector: np.ndarray) -> List[int]:
+        nearby = [index for key in self._neighbour_keys(vector) for index in self._buckets.get(key, ())
+                  if self._vectors[index].shape == vector.shape]
+        if not nearby:
+            return []
+        # Same test as np.allclose(vector, stored, atol=tolerance), for all nearby entries at once
+        stored = np.stack([self._vectors[index] for index in nearby])
+        close = (np.abs(vector - stored) <= self.tolerance + 1e-5 * np.abs(stored)).all(axis=1)
+        return sorted(set(np.asarray(nearby)[close].tolist()))
+    
+    def _find(self, index: int) -> int:
+        while self._parents[index] != index:
+            self._parents[index] = self._parents[self._parents[index]]
+            index = self._parents[index]
+        return index
+    
+    def _union(self, first: int, second: int):
+        first, second = self._find(first), self._find(second)
+        if first != second:
+            self._parents[max(first, second)] = min(first, second)
+    
+    def _insert(self, equilibrium: List[np.ndarray]) -> Tuple[int, bool]:
+        vector = np.concatenate([np.ravel(strategy) for strategy in equilibrium])
+        self.candidates += 1
+        
+        matches = self._matches(vector)
+        if matches:
+            # A duplicate; it also links every stored equilibrium it is close to
+            self.duplicates += 1
+            for index in matches[1:]:
+                self._union(matches[0], index)
+            return matches[0], False
+        
+        index = len(self.equilibria)
+        self.equilibria.append(equilibrium)
+        self._vectors.append(vector)
+        self._parents.append(index)
+        self._buckets.setdefault(tuple(self._cell_of(vector)[0].tolist()), []).append(index)
+        return index, True
+    
+    def add(self, equilibrium: List[np.ndarray]) -> bool:
+        # True if the equilibrium was new, False if it matched one already stored
+        return self._insert(equilibrium)[1]
+    
+    def __contains__(self, equilibrium: List[np.ndarray]) -> bool:
+        vector = np.concatenate([np.ravel(strategy) for strategy in equilibrium])
+        return bool(self._matches(vector))
+    
+    def merge(self, other: 'EquilibriumStore', transform=None):
+        # Add another store's equilibria (optionally mapped, e.g. back from a reduced game),
+        # keeping the links between them
+        indices = []
+        for equilibrium in other.equilibria:
+            index, _ = self._insert(transform(equilibrium) if transform is not None else equilibrium)
+            indices.append(index)
+        for index, parent in enumerate(other._parents):
+            self._union(indices[index], indices[other._find(parent)])
+    
+    def components(self) -> List[List[List[np.ndarray]]]:
+        # Groups of stored equilibria chained together by candidates within tolerance of several
+        # of them, e.g. points sampled along a continuum of equilibria in a degenerate game
+        groups: Dict[int, List[List[np.ndarray]]] = {}
+        for index, equilibrium in enumerate(self.equilibria):
+            groups.setdefault(self._find(index), []).append(equilibrium)
+        return list(groups.values())
@@ -0,0 +1,363 @@
+import itertools
+import json
+import os
+import re
+import sys
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from fractions import Fraction
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Analyses that solve_game can run, in the order their results appear in a record
+ANALYSES = ('dominance', 'maxmin', 'pure', 'mixed')
+
+# Characters read from a .nfg file at a time
+NFG_READ_CHARS = 1 << 20
+
+# A quoted string (possibly cut off at the end of the buffer), a brace, or a bare word/number.
+# Commas only separate outcome payoffs and are treated as whitespace.
+_NFG_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}]|[^\s{},"]+')
+_NFG_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def _iter_nfg_tokens(stream, read_chars: int = NFG_READ_CHARS) -> Iterator[str]:
+    # Tokenize a buffer at a time; a token touching the end of the buffer may continue in the
+    # next read, so it is carried over instead of emitted
+    buffer = ''
+    while True:
+        chunk = stream.read(read_chars)
+        buffer += chunk
+        position = 0
+        for match in _NFG_TOKEN.finditer(buffer):
+            token = match.group()
+            unterminated = token[0] == '"' and not _NFG_STRING.fullmatch(token)
+            if chunk and (match.end() == len(buffer) or unterminated):
+                position = match.start()
+                break
+            yield token
+            position = match.end()
+        else:
+            position = len(buffer)
+        buffer = buffer[position:]
+        if not chunk:
+            return
+
+
+class _Tokens:
+    def __init__(self, tokens: Iterator[str]):
+        self._tokens = tokens
+        self._next = None
+
+    def peek(self) -> Optional[str]:
+        if self._next is None:
+            self._next = next(self._tokens, None)
+        return self._next
+
+    def pop(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of .nfg file")
+        self._next = None
+        return token
+
+    def expect(self, expected: str):
+        token = self.pop()
+        if token != expected:
+            raise ValueError(f"Expected {expected!r} in .nfg file, got {token!r}")
+
+    def strings(self) -> List[str]:
+        # { "a" "b" ... }
+        self.expect('{')
+        values = []
+        while self.peek() != '}':
+            values.append(_unquote(self.pop()))
+        self.pop()
+        return values
+
+    def number(self) -> float:
+        # Gambit writes rationals such as 3/2 as well as decimals
+        token = self.pop()
+        return float(Fraction(token)) if '/' in token else float(token)
+
+
+def _unquote(token: str) -> str:
+    if len(token) < 2 or token[0] != '"' or token[-1] != '"':
+        raise ValueError(f"Expected a quoted string in .nfg file, got {token!r}")
+    return token[1:-1].replace('\\"', '"')
+
+
+def _read_nfg_game(tokens: _Tokens) -> Tuple[str, List[np.ndarray]]:
+    # NFG 1 R "title" { "player" ... } followed either by the action counts and a flat payoff
+    # list, or by named strategies, an outcome table and one outcome index per profile.
+    # Profiles are listed with the first player's action changing fastest.
+    tokens.expect('NFG')
+    tokens.pop()  # version
+    tokens.pop()  # precision, R or D
+    title = _unquote(tokens.pop())
+    n_players = len(tokens.strings())
+
+    tokens.expect('{')
+    if tokens.peek() == '{':
+        shape = []
+        while tokens.peek() != '}':
+            shape.append(len(tokens.strings()))
+        tokens.pop()
+    else:
+        shape = []
+        while tokens.peek() != '}':
+            shape.append(int(tokens.pop()))
+        tokens.pop()
+    if len(shape) != n_players:
+        raise ValueError(f"{n_players} players but {len(shape)} action counts in .nfg game {title!r}")
+
+    # Optional comment
+    if tokens.peek() is not None and tokens.peek().startswith('"'):
+        tokens.pop()
+
+    n_profiles = int(np.prod(shape))
+    payoffs = np.zeros((n_players, n_profiles))
+    if tokens.peek() == '{':
+        # Outcome version: { "name" u_1, u_2, ... } per outcome, then 1-based outcome indices
+        tokens.pop()
+        outcomes = [np.zeros(n_players)]
+        while tokens.peek() != '}':
+            tokens.expect('{')
+            tokens.pop()  # outcome name
+            outcomes.append(np.array([tokens.number() for _ in range(n_players)]))
+            tokens.expect('}')
+        tokens.pop()
+        for profile in range(n_profiles):
+            payoffs[:, profile] = outcomes[int(tokens.pop())]
+    else:
+        for profile in range(n_profiles):
+            for player in range(n_players):
+                payoffs[player, profile] = tokens.number()
+
+    return title, [payoffs[player].reshape(shape, order='F') for player in range(n_players)]
+
+
+def iter_nfg(path: str, read_chars: int = NFG_READ_CHARS) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    # Games from a Gambit .nfg file, which may hold several games one after another. Tokens are
+    # read in buffers of read_chars characters, so memory is bounded by the largest single game.
+    with open(path) as stream:
+        tokens = _Tokens(_iter_nfg_tokens(stream, read_chars))
+        for index in itertools.count():
+            if tokens.peek() is None:
+                return
+            _, payoff_matrices = _read_nfg_game(tokens)
+            yield f'{path}:{index}', payoff_matrices
+
+
+def _read_npy_header(member) -> Tuple[Tuple[int, ...], bool, np.dtype]:
+    version = np.lib.format.read_magic(member)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(member)
+    return np.lib.format.read_array_header_2_0(member)
+
+
+def _iter_npy_games(member, name: str) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    # One array is either a single game, shaped (n_players, n_1, ..., n_k) with n_players == k,
+    # or a stack of games shaped (B, n_players, n_1, ..., n_k), read one game at a time
+    shape, fortran_order, dtype = _read_npy_header(member)
+    if dtype.hasobject:
+        raise ValueError(f"{name}: object arrays are not supported")
+
+    if len(shape) >= 2 and shape[0] == len(shape) - 1:
+        data = np.frombuffer(member.read(int(np.prod(shape)) * dtype.itemsize), dtype=dtype)
+        game = data.reshape(shape, order='F' if fortran_order else 'C')
+        yield name, list(game)
+        return
+    if len(shape) < 3 or shape[1] != len(shape) - 2:
+        raise ValueError(f"{name}: expected (n_players, *actions) or (B, n_players, *actions), got {shape}")
+
+    game_shape = shape[1:]
+    if fortran_order:
+        # Games are interleaved in Fortran order, so the array has to be read as a whole
+        games = np.frombuffer(member.read(), dtype=dtype).reshape(shape, order='F')
+        for index in range(shape[0]):
+            yield f'{name}:{index}', list(games[index])
+        return
+
+    game_bytes = int(np.prod(game_shape)) * dtype.itemsize
+    for index in range(shape[0]):
+        data = member.read(game_bytes)
+        if len(data) != game_bytes:
+            raise ValueError(f"{name}: truncated after {index} games")
+        yield f'{name}:{index}', list(np.frombuffer(data, dtype=dtype).reshape(game_shape))
+
+
+def iter_npz(path: str) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    # Games from every array of an .npz archive (compressed or not), streamed member by member
+    with zipfile.ZipFile(path) as archive:
+        for member_name in archive.namelist():
+            key = member_name[:-4] if member_name.endswith('.npy') else member_name
+            with archive.open(member_name) as member:
+                yield from _iter_npy_games(member, f'{path}:{key}')
+
+
+def iter_npy(path: str) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    with open(path, 'rb') as member:
+        yield from _iter_npy_games(member, path)
+
+
+def iter_jsonl(path: str) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    # One game per line: {"id": ..., "payoffs": [player 1 tensor, player 2 tensor, ...]} or just
+    # the list of tensors; '-' reads standard input
+    stream = sys.stdin if path == '-' else open(path)
+    try:
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                game_id = record.get('id', f'{path}:{line_number}')
+                payoffs = record['payoffs']
+            else:
+                game_id, payoffs = f'{path}:{line_number}', record
+            yield game_id, [np.asarray(payoff, dtype=float) for payoff in payoffs]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+READERS = {'nfg': iter_nfg, 'npz': iter_npz, 'npy': iter_npy, 'jsonl': iter_jsonl}
+
+
+def iter_games(path: str, format: Optional[str] = None) -> Iterator[Tuple[str, List[np.ndarray]]]:
+    # (game id, payoff matrices) pairs from a file; the format defaults to the file suffix
+    if format is None:
+        suffix = os.path.splitext(path)[1].lstrip('.').lower()
+        format = 'jsonl' if path == '-' or suffix in ('json', 'ndjson') else suffix
+    if format not in READERS:
+        raise ValueError(f"Unknown game format {format!r}, choose from {', '.join(READERS)}")
+    return READERS[format](path)
+
+
+def _to_json(value):
+    # numpy scalars, arrays and tuples to plain JSON types
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    return value
+
+
+def solve_game(payoff_matrices: List[np.ndarray], analyses: Sequence[str] = ANALYSES) -> dict:
+    # JSON-ready results of the requested analyses for one game
+    from .bimatrix import find_mixed_nash
+    from .game import StrategicFormGame
+
+    game = StrategicFormGame([np.asarray(payoffs) for payoffs in payoff_matrices])
+    result = {'n_players': game.n_players, 'actions': list(game.player_actions)}
+    if 'dominance' in analyses:
+        analysis = game.analysis()
+        result['strong_dominant'] = analysis.strong_dominant
+        result['weak_dominant'] = analysis.weak_dominant
+        result['strong_equilibria'] = analysis.strong_equilibria
+        result['weak_equilibria'] = analysis.weak_equilibria
+    if 'maxmin' in analyses:
+        analysis = game.analysis()
+        result['maxmin_values'] = analysis.maxmin_values
+        result['maxmin_strategies'] = analysis.maxmin_strategies
+        result['mixed_maxmin_values'] = analysis.mixed_maxmin_values
+        result['mixed_maxmin_strategies'] = analysis.mixed_maxmin_strategies
+    if 'pure' in analyses:
+        # A single pass over the best-response masks; eliminating dominated actions first only adds LPs
+        result['pure_nash'] = game.find_pure_nash_equilibria(reduce=False)
+    if 'mixed' in analyses:
+        if game.n_players == 2:
+            result['mixed_nash'] = find_mixed_nash(game.payoff_matrices)
+        else:
+            result['mixed_nash'] = game.find_all_mixed_nash_equilibria()
+    return _to_json(result)
+
+
+def _solve_record(game_id: str, payoff_matrices: List[np.ndarray], analyses: Sequence[str]) -> dict:
+    # A failing game becomes an error record instead of stopping the whole stream
+    try:
+        return {'id': game_id, **solve_game(payoff_matrices, analyses)}
+    except Exception as error:
+        return {'id': game_id, 'error': f'{type(error).__name__}: {error}'}
+
+
+def _lookup(game_id: str, payoff_matrices: List[np.ndarray], analyses: Sequence[str], cache):
+    # (record on a cache hit, cache key, canonical game, payoffs left to solve on a miss)
+    if cache is None:
+        return None, None, None, payoff_matrices
+    try:
+        key, canonical = cache.prepare(payoff_matrices, analyses)
+    except Exception:
+        # Malformed games get their error record from the solver
+        return None, None, None, payoff_matrices
+    record = cache.get(key)
+    if record is not None:
+        return canonical.to_original_record({'id': game_id, **record}), key, canonical, None
+    return None, key, canonical, canonical.payoff_matrices
+
+
+def _finish(record: dict, key: Optional[str], canonical, cache) -> dict:
+    # Store a freshly solved canonical record and map it back to the caller's labelling
+    if canonical is None or 'error' in record:
+        return record
+    cache.put(key, {field: value for field, value in record.items() if field != 'id'})
+    return canonical.to_original_record(record)
+
+
+def iter_solutions(games: Iterable[Tuple[str, List[np.ndarray]]], analyses: Sequence[str] = ANALYSES,
+                   n_jobs: Optional[int] = 1, window: Optional[int] = None, ordered: bool = False,
+                   cache=None) -> Iterator[dict]:
+    # One result record per game, yielded as soon as the game is solved. With n_jobs > 1 (None
+    # for every core) games are solved in a process pool, and at most `window` games (default
+    # 4 per worker) are read ahead, so memory stays bounded however long the input is.
+    # ordered=True yields records in input order instead of completion order. With an
+    # AnalysisCache, lookups and stores happen here in the calling process and only misses
+    # reach the workers.
+    n_jobs = (os.cpu_count() or 1) if n_jobs is None else n_jobs
+    if n_jobs <= 1:
+        for game_id, payoff_matrices in games:
+            record, key, canonical, to_solve = _lookup(game_id, payoff_matrices, analyses, cache)
+            if record is None:
+                record = _finish(_solve_record(game_id, to_solve, analyses), key, canonical, cache)
+            yield record
+        return
+
+    def result(entry):
+        pending_record, key, canonical = entry
+        if isinstance(pending_record, dict):
+            return pending_record
+        return _finish(pending_record.result(), key, canonical, cache)
+
+    window = 4 * n_jobs if window is None else max(1, window)
+    games = iter(games)
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        # Entries are [future or cached record, cache key, canonical game]
+        pending = deque()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                game = next(games, None)
+                if game is None:
+                    exhausted = True
+                    break
+                record, key, canonical, to_solve = _lookup(game[0], game[1], analyses, cache)
+                if record is not None and not ordered:
+                    yield record
+                    continue
+                pending.append([record if record is not None else pool.submit(_solve_record, game[0], to_solve, analyses),
+                                key, canonical])
+            if not pending:
+                break
+            if ordered:
+                yield result(pending.popleft())
+                continue
+            done, _ = wait([entry[0] for entry in pending], return_when=FIRST_COMPLETED)
+            for entry in [entry for entry in pending if entry[0] in done]:
+                pending.remove(entry)
+                yield result(entry)
@@ -0,0 +1,57 @@
+import numpy as np
+import itertools
+from typing import Iterator, List, Tuple
+
+from .instrumentation import active_stats
+
+
+def expected_payoff_table(payoff_matrices: List[np.ndarray], strategies: List[np.ndarray]) -> List[np.ndarray]:
+    # [player][action] = expected payoff of the pure action against everyone else's mixed strategy,
+    # one tensor contraction per player: U_p contracted with s_q along every axis q != p
+    n_players = len(payoff_matrices)
+    stats = active_stats()
+    if stats is not None:
+        stats.count('payoff_contractions', n_players)
+    table = []
+    for player in range(n_players):
+        operands = [payoff_matrices[player], list(range(n_players))]
+        for other in range(n_players):
+            if other != player:
+                operands += [strategies[other], [other]]
+        table.append(np.einsum(*operands, [player], optimize=True))
+    return table
+
+
+def batch_expected_payoff_table(payoff_matrices: List[np.ndarray], strategy_batches: List[np.ndarray]) -> List[np.ndarray]:
+    # Same contraction for B candidate profiles at once: strategy_batches[q] has shape (B, n_q)
+    # and table[player] has shape (B, n_player)
+    n_players = len(payoff_matrices)
+    batch_axis = n_players
+    stats = active_stats()
+    if stats is not None:
+        stats.count('payoff_contractions', n_players * len(strategy_batches[0]))
+    table = []
+    for player in range(n_players):
+        operands = [payoff_matrices[player], list(range(n_players))]
+        for other in range(n_players):
+            if other != player:
+                operands += [strategy_batches[other], [batch_axis, other]]
+        table.append(np.einsum(*operands, [batch_axis, player], optimize=True))
+    return table
+
+
+def batch_regrets(payoff_matrices: List[np.ndarray], strategy_batches: List[np.ndarray]) -> np.ndarray:
+    # (B, n_players) array of how much each player gains by switching to a best pure response
+    table = batch_expected_payoff_table(payoff_matrices, strategy_batches)
+    regrets = [payoffs.max(axis=1) - np.einsum('ba,ba->b', payoffs, strategy_batches[player])
+               for player, payoffs in enumerate(table)]
+    return np.stack(regrets, axis=1)
+
+
+def iter_support_profiles(player_actions: List[int]) -> Iterator[Tuple[Tuple[int, ...], ...]]:
+    # Every support profile exactly once, smallest total size first and, within a total size,
+    # the most balanced size profiles first (equilibria of generic games tend to live there)
+    size_profiles = sorted(itertools.product(*[range(1, n + 1) for n in player_actions]),
+                           key=lambda sizes: (sum(sizes), max(sizes) - min(sizes)))
+    for sizes in size_profiles:
+        yield from itertools.product(*[itertools.combinations(range(n), size) for n, size in zip(player_actions, sizes)])
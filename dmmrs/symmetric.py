@@ -0,0 +1,283 @@
+import numpy as np
+import itertools
+from math import factorial
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .limits import bounded, stop_requested
+from .store import EquilibriumStore
+
+# Shrink factor of a golden-section search (1 / golden ratio)
+_GOLDEN = (5 ** 0.5 - 1) / 2
+
+
+def _compositions(total: int, parts: int) -> np.ndarray:
+    # Every way of writing total as an ordered sum of parts non-negative integers, lexicographically
+    rows = []
+    for bars in itertools.combinations(range(total + parts - 1), parts - 1):
+        counts = []
+        previous = -1
+        for bar in bars + (total + parts - 1,):
+            counts.append(bar - previous - 1)
+            previous = bar
+        rows.append(counts)
+    return np.array(rows, dtype=np.int64).reshape(-1, parts)
+
+
+class SymmetricGame:
+    # A game where every player has the same actions and a player's payoff depends only on its own
+    # action and on how many of the other players pick each action. payoffs[a, c] is the payoff of
+    # action a when the other n_players - 1 players are spread as count_profiles[c]. Storage is
+    # n_actions * C(n_players + n_actions - 2, n_actions - 1) numbers instead of
+    # n_players * n_actions^n_players.
+    def __init__(self, n_players: int, n_actions: int, payoffs: np.ndarray):
+        self.n_players = n_players
+        self.n_actions = n_actions
+        self.count_profiles = _compositions(n_players - 1, n_actions)
+        self.payoffs = np.asarray(payoffs, dtype=float)
+        if self.payoffs.shape != (n_actions, len(self.count_profiles)):
+            raise ValueError(f"Payoffs have incorrect shape. Expected {(n_actions, len(self.count_profiles))}, got {self.payoffs.shape}")
+        self._columns = {tuple(counts): column for column, counts in enumerate(self.count_profiles.tolist())}
+
+        # Number of ways the others can realize each count profile, for expected payoffs
+        self._multiplicities = np.array([factorial(n_players - 1) / np.prod([factorial(c) for c in counts])
+                                         for counts in self.count_profiles.tolist()])
+
+    @classmethod
+    def from_function(cls, n_players: int, n_actions: int, payoff: Callable[[int, Tuple[int, ...]], float]) -> 'SymmetricGame':
+        # payoff(action, counts) with counts[b] = number of other players choosing b
+        profiles = _compositions(n_players - 1, n_actions)
+        table = np.array([[payoff(action, tuple(counts)) for counts in profiles.tolist()] for action in range(n_actions)])
+        return cls(n_players, n_actions, table)
+
+    @classmethod
+    def from_strategic_form(cls, payoff_matrices: List[np.ndarray], tolerance: float = 1e-9) -> 'SymmetricGame':
+        # Player 0's payoff must not depend on who the others are, and player p's payoffs must be
+        # player 0's with the roles of 0 and p swapped
+        payoffs = [np.asarray(matrix, dtype=float) for matrix in payoff_matrices]
+        n_players = len(payoffs)
+        n_actions = payoffs[0].shape[0]
+        if payoffs[0].shape != (n_actions,) * n_players:
+            raise ValueError("Symmetric games need the same number of actions for every player")
+        for axis in range(2, n_players):
+            if not np.allclose(payoffs[0], np.swapaxes(payoffs[0], 1, axis), atol=tolerance):
+                raise ValueError("Player 0's payoff depends on which opponent plays what")
+        for player in range(1, n_players):
+            if not np.allclose(payoffs[player], np.swapaxes(payoffs[0], 0, player), atol=tolerance):
+                raise ValueError(f"Player {player}'s payoffs are not player 0's with the roles swapped")
+
+        profiles = _compositions(n_players - 1, n_actions)
+        table = np.zeros((n_actions, len(profiles)))
+        for column, counts in enumerate(profiles.tolist()):
+            others = [b for b, count in enumerate(counts) for _ in range(count)]
+            for action in range(n_actions):
+                table[action, column] = payoffs[0][(action, *others)]
+        return cls(n_players, n_actions, table)
+
+    def payoff(self, action: int, counts: Sequence[int]) -> float:
+        return float(self.payoffs[action, self._columns[tuple(counts)]])
+
+    def to_strategic_form(self):
+        # Dense equivalent, only sensible for small games
+        from .game import StrategicFormGame
+
+        shape = (self.n_actions,) * self.n_players
+        payoff_matrices = [np.zeros(shape) for _ in range(self.n_players)]
+        for profile in np.ndindex(*shape):
+            total = np.bincount(profile, minlength=self.n_actions)
+            for player, action in enumerate(profile):
+                counts = total.copy()
+                counts[action] -= 1
+                payoff_matrices[player][profile] = self.payoff(action, counts)
+        return StrategicFormGame(payoff_matrices, list(shape))
+
+    def expand(self, strategy: np.ndarray) -> List[np.ndarray]:
+        # A symmetric equilibrium in the standard one-strategy-per-player form
+        return [np.array(strategy, dtype=float) for _ in range(self.n_players)]
+
+    def counts_to_profile(self, counts: Sequence[int]) -> Tuple[int, ...]:
+        # One pure profile with the given action counts (players sorted by action)
+        return tuple(action for action, count in enumerate(counts) for _ in range(count))
+
+    def _weights(self, strategy: np.ndarray) -> np.ndarray:
+        # Probability of each count profile when the n - 1 others play strategy independently
+        return self._multiplicities * self._monomials(strategy[None, :], self.count_profiles)[0]
+
+    def expected_payoffs(self, strategy: np.ndarray) -> np.ndarray:
+        # [action] = expected payoff of the action when everyone else plays strategy
+        return self.payoffs @ self._weights(np.asarray(strategy, dtype=float))
+
+    def regret(self, strategy: np.ndarray) -> float:
+        payoffs = self.expected_payoffs(strategy)
+        return float(payoffs.max() - payoffs @ strategy)
+
+    def iter_pure_nash(self, limit: Optional[int] = None, deadline: Optional[float] = None,
+                       cancel=None) -> Iterator[Tuple[int, ...]]:
+        # Pure equilibria up to relabelling the players, as counts of all n players per action:
+        # nobody choosing a may gain by switching, given the others' counts
+        yield from bounded(self._iter_pure_nash(), limit, deadline, cancel)
+
+    def _iter_pure_nash(self) -> Iterator[Tuple[int, ...]]:
+        for counts in _compositions(self.n_players, self.n_actions):
+            for action in np.flatnonzero(counts):
+                others = counts.copy()
+                others[action] -= 1
+                values = self.payoffs[:, self._columns[tuple(others.tolist())]]
+                if values[action] < values.max():
+                    break
+            else:
+                yield tuple(int(count) for count in counts)
+
+    def find_pure_nash_equilibria(self) -> List[Tuple[int, ...]]:
+        return list(self.iter_pure_nash())
+
+    def _restrict(self, support: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Count profiles in which the others only use actions in support, with the counts of those
+        # actions, their multiplicities and the payoff columns of the support's actions
+        support = np.asarray(support)
+        profiles = self.count_profiles[:, support]
+        reachable = profiles.sum(axis=1) == self.n_players - 1
+        return profiles[reachable], self._multiplicities[reachable], self.payoffs[np.ix_(support, reachable)]
+
+    def _monomials(self, x: np.ndarray, profiles: np.ndarray, derivatives: bool = False):
+        # [b, c] = prod_j x[b, j] ** profiles[c, j], gathered from a table of powers instead of
+        # raising (batch, profiles, support) arrays; with derivatives, also d/dx_j of each monomial
+        exponents = np.arange(self.n_players)
+        powers = [np.power(x[:, j, None], exponents)[:, profiles[:, j]] for j in range(x.shape[1])]
+        monomials = np.prod(powers, axis=0)
+        if not derivatives:
+            return monomials
+        gradients = []
+        for j in range(x.shape[1]):
+            lowered = exponents * np.power(x[:, j, None], np.maximum(exponents - 1, 0))
+            factors = powers[:j] + [lowered[:, profiles[:, j]]] + powers[j + 1:]
+            gradients.append(np.prod(factors, axis=0))
+        return monomials, gradients
+
+    def _two_action_roots(self, support: Tuple[int, int], grid: int) -> List[np.ndarray]:
+        # Mixing over two actions: g(t) = E(a) - E(b) at t*a + (1 - t)*b is a polynomial of degree
+        # n_players - 1. Sign changes on a grid are refined by bisection. A root where g touches 0
+        # without changing sign (a double root) shows up as a local minimum of |g| on the grid
+        # instead; those are refined by golden-section search on |g| and left to the caller's
+        # regret check. Roots closer together than the grid spacing can still be missed.
+        profiles, multiplicities, payoffs = self._restrict(support)
+        difference = multiplicities * (payoffs[0] - payoffs[1])
+
+        def gap(t):
+            t = np.atleast_1d(t)
+            return self._monomials(np.stack([t, 1.0 - t], axis=1), profiles) @ difference
+
+        points = np.linspace(0.0, 1.0, grid + 1)[1:-1]
+        values = gap(points)
+        scale = max(1.0, np.abs(self.payoffs).max())
+        if np.abs(values).max() <= 1e-12 * scale:
+            # The two actions tie everywhere on the segment: report its midpoint
+            roots = [0.5]
+        else:
+            roots = list(points[values == 0.0])
+            for left, right, value, next_value in zip(points[:-1], points[1:], values[:-1], values[1:]):
+                if value * next_value < 0:
+                    for _ in range(60):
+                        middle = 0.5 * (left + right)
+                        if np.sign(gap(middle)[0]) == np.sign(value):
+                            left = middle
+                        else:
+                            right = middle
+                    roots.append(0.5 * (left + right))
+            magnitudes = np.abs(values)
+            for i in range(1, len(points) - 1):
+                if (values[i - 1] * values[i + 1] > 0 and values[i] * values[i - 1] > 0
+                        and magnitudes[i] <= magnitudes[i - 1] and magnitudes[i] < magnitudes[i + 1]):
+                    left, right = points[i - 1], points[i + 1]
+                    for _ in range(60):
+                        inner_left = right - _GOLDEN * (right - left)
+                        inner_right = left + _GOLDEN * (right - left)
+                        if abs(gap(inner_left)[0]) < abs(gap(inner_right)[0]):
+                            right = inner_right
+                        else:
+                            left = inner_left
+                    roots.append(0.5 * (left + right))
+
+        strategies = []
+        for t in roots:
+            strategy = np.zeros(self.n_actions)
+            strategy[list(support)] = t, 1.0 - t
+            strategies.append(strategy)
+        return strategies
+
+    def _newton_roots(self, support: Tuple[int, ...], lattice: int) -> List[np.ndarray]:
+        # Mixing over three or more actions: unknowns x_S and the common payoff v, equations
+        # sum(x_S) = 1 and E(a) = v for a in S, solved by batched Newton from a lattice of starts
+        size = len(support)
+        profiles, multiplicities, payoffs = self._restrict(support)
+        weighted = (multiplicities * payoffs).T
+
+        z = np.zeros((len(_compositions(lattice, size)), size + 1))
+        z[:, :size] = (_compositions(lattice, size) + 0.5) / (lattice + 0.5 * size)
+        converged = []
+        for _ in range(50):
+            x = z[:, :size]
+            monomials, gradients = self._monomials(x, profiles, derivatives=True)
+            residual = np.zeros_like(z)
+            residual[:, 0] = x.sum(axis=1) - 1.0
+            residual[:, 1:] = monomials @ weighted - z[:, size:]
+
+            done = np.abs(residual).max(axis=1) <= 1e-13
+            converged.extend(z[done])
+            z, residual = z[~done], residual[~done]
+            if len(z) == 0:
+                break
+
+            jacobian = np.zeros((len(z), size + 1, size + 1))
+            jacobian[:, 0, :size] = 1.0
+            jacobian[:, 1:, size] = -1.0
+            for j in range(size):
+                jacobian[:, 1:, j] = gradients[j][~done] @ weighted
+            z = z - np.einsum('bij,bj->bi', np.linalg.pinv(jacobian), residual)
+            # Starts that wander far off the simplex will not come back to a valid root
+            z = z[np.isfinite(z).all(axis=1) & (np.abs(z[:, :size]).max(axis=1) <= 10.0)]
+
+        roots = []
+        for row in converged + list(z):
+            strategy = np.zeros(self.n_actions)
+            strategy[list(support)] = row[:size]
+            roots.append(strategy)
+        return roots
+
+    def iter_symmetric_equilibria(self, grid: int = 256, lattice: int = 6, tolerance: float = 1e-7,
+                                  limit: Optional[int] = None, deadline: Optional[float] = None,
+                                  cancel=None) -> Iterator[np.ndarray]:
+        # Symmetric mixed equilibria (everyone plays the same strategy), by support enumeration on
+        # one strategy: 2^n_actions - 1 supports with at most n_actions + 1 unknowns each, instead
+        # of supports for every player over the full tensor. Two-action supports are solved by a
+        # grid scan of the payoff gap (see _two_action_roots), larger supports by Newton from a
+        # lattice of starts; both may miss roots that lie very close together.
+        # Each equilibrium is the one strategy every player uses; expand() turns it into a profile.
+        # Each new equilibrium is yielded once its support is solved; limit, deadline and cancel
+        # (see dmmrs.limits) are checked between supports.
+        store = EquilibriumStore()
+        found = 0
+        if limit is not None and limit <= 0:
+            return
+        for size in range(1, self.n_actions + 1):
+            for support in itertools.combinations(range(self.n_actions), size):
+                if stop_requested(deadline, cancel):
+                    return
+                if size == 1:
+                    candidates = [np.eye(self.n_actions)[support[0]]]
+                elif size == 2:
+                    candidates = self._two_action_roots(support, grid)
+                else:
+                    candidates = self._newton_roots(support, lattice)
+                for strategy in candidates:
+                    if strategy.min() < -1e-9:
+                        continue
+                    strategy = np.clip(strategy, 0.0, None)
+                    strategy /= strategy.sum()
+                    if self.regret(strategy) <= tolerance * max(1.0, np.abs(self.payoffs).max()) and store.add([strategy]):
+                        yield strategy
+                        found += 1
+                        if found == limit:
+                            return
+
+    def find_symmetric_equilibria(self, grid: int = 256, lattice: int = 6, tolerance: float = 1e-7) -> List[np.ndarray]:
+        return list(self.iter_symmetric_equilibria(grid, lattice, tolerance))
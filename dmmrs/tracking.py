@@ -0,0 +1,125 @@
+import numpy as np
+import itertools
+import time
+from collections import namedtuple
+from typing import List, Optional, Tuple
+
+from .game import StrategicFormGame
+from .instrumentation import active_stats
+from .limits import stop_requested
+from .support import expected_payoff_table, iter_support_profiles
+
+# strategies: the equilibrium (or, when expired, the previous one), supports: its support profile,
+# status: 'tracked' (same support), 'local' (support changed by one or two actions), 'resolved'
+# (full search) or 'expired' (nothing found before the deadline), regret: its largest regret in the
+# current game, elapsed: seconds spent in the call
+TrackingResult = namedtuple('TrackingResult', ['strategies', 'supports', 'status', 'regret', 'elapsed'])
+
+
+def _supports_of(strategies: List[np.ndarray], tolerance: float = 1e-9) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(tuple(int(a) for a in np.flatnonzero(s > tolerance)) for s in strategies)
+
+
+def _distance(first: List[np.ndarray], second: List[np.ndarray]) -> float:
+    return sum(float(np.abs(a - b).sum()) for a, b in zip(first, second))
+
+
+class EquilibriumTracker:
+    # Follows one mixed equilibrium through a sequence of slowly drifting games with the same
+    # shape, e.g. one payoff matrix per control tick. Each update tries, in order:
+    #   1. the previous support profile, Newton warm-started at the previous equilibrium (then
+    #      from the usual cold starts on that support);
+    #   2. nearby support profiles, one or two actions added to or dropped from the previous one,
+    #      most promising first (actions that became profitable, actions that were barely played);
+    #   3. full support enumeration, keeping the equilibrium closest to the previous one.
+    # update() takes deadline and cancel as in dmmrs.limits, e.g. deadline=time.monotonic() + 0.005
+    # for a 5 ms control tick, checked between support profiles; when they stop the search before
+    # anything is found, the previous equilibrium is returned with status 'expired'.
+    def __init__(self, local_edits: int = 2):
+        self.local_edits = local_edits
+        self.strategies: Optional[List[np.ndarray]] = None
+        self.supports: Optional[Tuple[Tuple[int, ...], ...]] = None
+
+    def reset(self):
+        self.strategies = None
+        self.supports = None
+
+    def _local_supports(self, game: StrategicFormGame) -> List[Tuple[Tuple[int, ...], ...]]:
+        # Single-action edits ranked by promise: adding an action that now beats the equilibrium
+        # payoff, dropping an action with little probability, then the other additions
+        table = expected_payoff_table(game.payoff_matrices, self.strategies)
+        gains, drops, others = [], [], []
+        for player, payoffs in enumerate(table):
+            value = payoffs @ self.strategies[player]
+            support = set(self.supports[player])
+            for action in range(game.player_actions[player]):
+                if action not in support:
+                    gain = payoffs[action] - value
+                    (gains if gain > 0 else others).append((-gain, player, action))
+                elif len(support) > 1:
+                    drops.append((self.strategies[player][action], player, action))
+        edits = [edit[1:] for group in (gains, drops, others) for edit in sorted(group)]
+
+        # Fewer edits first, then better-ranked edits
+        candidates = []
+        for n_edits in range(1, self.local_edits + 1):
+            for combination in itertools.combinations(range(len(edits)), n_edits):
+                supports = [set(s) for s in self.supports]
+                for player, action in (edits[i] for i in combination):
+                    supports[player] ^= {action}
+                if all(supports):
+                    candidates.append((n_edits, sum(combination), tuple(tuple(sorted(s)) for s in supports)))
+        candidates.sort(key=lambda candidate: candidate[:2])
+        return [supports for _, _, supports in candidates]
+
+    def update(self, payoff_matrices: List[np.ndarray], deadline: Optional[float] = None,
+               cancel=None) -> TrackingResult:
+        start = time.monotonic()
+        game = StrategicFormGame([np.asarray(payoffs, dtype=float) for payoffs in payoff_matrices])
+        stats = active_stats()
+
+        def expired():
+            return stop_requested(deadline, cancel)
+
+        def accept(strategies, status):
+            self.strategies = [np.array(s) for s in strategies]
+            self.supports = _supports_of(strategies)
+            if stats is not None:
+                stats.count(f'tracking_{status}')
+            return TrackingResult(self.strategies, self.supports, status, float(game._regrets(strategies).max()),
+                                  time.monotonic() - start)
+
+        def nearest(equilibria):
+            if self.strategies is None:
+                return equilibria[0]
+            return min(equilibria, key=lambda eq: _distance(eq, self.strategies))
+
+        if self.strategies is not None and not expired():
+            found = game._check_support_profile(self.supports, starts=self.strategies)
+            if not found and not expired():
+                found = game._check_support_profile(self.supports)
+            if found:
+                return accept(nearest(found), 'tracked')
+
+            for supports in self._local_supports(game):
+                if expired():
+                    break
+                found = game._check_support_profile(supports, starts=self.strategies)
+                if found:
+                    return accept(nearest(found), 'local')
+
+        found = []
+        for supports in iter_support_profiles(game.player_actions):
+            if expired():
+                break
+            found.extend(game._check_support(supports))
+            # Without a previous equilibrium any equilibrium will do, so stop at the first
+            if found and self.strategies is None:
+                break
+        if found:
+            return accept(nearest(found), 'resolved')
+
+        if stats is not None:
+            stats.count('tracking_expired')
+        regret = float(game._regrets(self.strategies).max()) if self.strategies is not None else np.inf
+        return TrackingResult(self.strategies, self.supports, 'expired', regret, time.monotonic() - start)
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from dmmrs import run_benchmark
+from dmmrs.__main__ import main
+from dmmrs.benchmark import BENCHMARK_VERSION, compare
+
+
+def entry(analysis, seconds, peak_bytes=1000, **extra):
+    return dict({'generator': 'random', 'n_players': 2, 'n_actions': 3, 'analysis': analysis,
+                 'seconds': seconds, 'peak_bytes': peak_bytes}, **extra)
+
+
+def report(*entries, version=BENCHMARK_VERSION):
+    return {'version': version, 'results': list(entries)}
+
+
+def test_compare_flags_slowdowns_and_memory_growth():
+    baseline = report(entry('pure', 0.010), entry('dominance', 0.010), entry('maxmin', 0.010, 1000))
+    current = report(entry('pure', 0.020), entry('dominance', 0.011), entry('maxmin', 0.010, 2000))
+    regressions = compare(baseline, current)
+    assert [(r['analysis'], r['metric']) for r in regressions] == [('pure', 'seconds'), ('maxmin', 'peak_bytes')]
+    assert regressions[0]['ratio'] == pytest.approx(2.0)
+    # A looser threshold accepts both
+    assert compare(baseline, current, threshold=1.5) == []
+
+
+def test_compare_ignores_noise_below_min_seconds():
+    baseline = report(entry('pure', 1e-5))
+    current = report(entry('pure', 5e-4))
+    assert compare(baseline, current) == []
+    assert [r['metric'] for r in compare(baseline, current, min_seconds=1e-4)] == ['seconds']
+
+
+def test_compare_reports_new_errors_only():
+    baseline = report(entry('pure', 0.01), entry('mixed-smt', 0.01, error='RuntimeError: x'), entry('maxmin', 0.01))
+    current = report(entry('pure', 0.01, error='RuntimeError: y'), entry('mixed-smt', 0.01, error='RuntimeError: x'),
+                     entry('maxmin', 0.5, skipped='no'), entry('dominance', 9.0))
+    assert [(r['analysis'], r['metric']) for r in compare(baseline, current)] == [('pure', 'error')]
+
+
+def test_compare_rejects_other_versions():
+    with pytest.raises(ValueError):
+        compare(report(version=BENCHMARK_VERSION + 1), report())
+    with pytest.raises(ValueError):
+        compare(report(), {'results': []})
+
+
+def test_benchmark_round_trip(tmp_path, capsys):
+    path = tmp_path / 'bench.json'
+    options = dict(generators=['random', 'zero-sum'], players=[2, 3], actions=[2], analyses=['dominance', 'mixed-vertex'],
+                   repeat=1)
+    result = run_benchmark(str(path), **options)
+    assert json.loads(path.read_text()) == result
+    records = {(e['generator'], e['n_players'], e['analysis']): e for e in result['results']}
+    assert len(records) == 8
+    assert 'skipped' in records['zero-sum', 3, 'dominance']
+    assert records['random', 3, 'mixed-vertex']['skipped'] == 'two-player games only'
+    assert records['random', 2, 'mixed-vertex']['result_size'] >= 1
+    assert main(['compare', str(path), str(path)]) == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    baseline, current = tmp_path / 'baseline.json', tmp_path / 'current.json'
+    baseline.write_text(json.dumps(report(entry('pure', 0.01))))
+    current.write_text(json.dumps(report(entry('pure', 0.05))))
+    assert main(['compare', str(baseline), str(current)]) == 1
+    assert json.loads(capsys.readouterr().out)['metric'] == 'seconds'
+    assert main(['compare', str(baseline), str(current), '--threshold', '10']) == 0
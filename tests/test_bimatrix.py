@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from dmmrs import find_mixed_nash, is_constant_sum, iter_mixed_nash, lemke_howson, solve_zero_sum, vertex_enumeration
+
+SHAPES = [(2, 2), (2, 3), (3, 3), (3, 4), (4, 4)]
+
+
+def random_bimatrix(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-1.0, 1.0, size=shape) for _ in range(2)]
+
+
+def integer_bimatrix(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(-9, 10, size=shape) for _ in range(2)]
+
+
+def is_nash(payoff_matrices, x, y, tolerance=1e-9):
+    A, B = (np.asarray(payoffs, dtype=float) for payoffs in payoff_matrices)
+    return (np.isclose(x.sum(), 1.0) and np.isclose(y.sum(), 1.0) and x.min() >= -tolerance and y.min() >= -tolerance
+            and (A @ y).max() <= x @ A @ y + tolerance and (x @ B).max() <= x @ B @ y + tolerance)
+
+
+def same_equilibria(first, second, tolerance=1e-6):
+    # Both lists match up one to one (equilibria in any order)
+    remaining = list(second)
+    for x, y in first:
+        for i, (u, v) in enumerate(remaining):
+            if np.allclose(x, u, atol=tolerance) and np.allclose(y, v, atol=tolerance):
+                del remaining[i]
+                break
+        else:
+            return False
+    return not remaining
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(5))
+def test_vertex_enumeration_matches_nashpy(shape, seed):
+    nash = pytest.importorskip('nashpy')
+    payoffs = random_bimatrix(shape, seed)
+    expected = list(nash.Game(*payoffs).vertex_enumeration())
+    assert same_equilibria(vertex_enumeration(payoffs), expected)
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(5))
+def test_lemke_howson_is_nash_for_every_label(shape, seed):
+    floats = random_bimatrix(shape, seed)
+    integers = integer_bimatrix(shape, seed)
+    for label in range(sum(shape)):
+        assert is_nash(floats, *lemke_howson(floats, label))
+        assert is_nash(integers, *lemke_howson(integers, label, exact=True))
+
+
+def test_lemke_howson_rejects_bad_label():
+    with pytest.raises(ValueError):
+        lemke_howson(random_bimatrix((2, 3), 0), 5)
+
+
+def test_constant_sum_all_keeps_every_extreme_equilibrium():
+    # Rows 0 and 1 both guarantee the value 1 and the column player can mix in several ways, so
+    # this zero-sum game has more than the one equilibrium the LP returns
+    A = np.array([[1.0, 1.0], [1.0, 1.0], [0.0, 2.0]])
+    payoffs = [A, -A]
+    equilibria = find_mixed_nash(payoffs, method='all')
+    assert len(equilibria) > 1
+    assert same_equilibria(equilibria, vertex_enumeration(payoffs))
+    assert same_equilibria(list(iter_mixed_nash(payoffs)), equilibria)
+    assert all(is_nash(payoffs, x, y) for x, y in equilibria)
+    assert len(find_mixed_nash(payoffs, method='one')) == 1
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(5))
+def test_solve_zero_sum_gives_value_and_optimal_strategies(shape, seed):
+    pytest.importorskip('scipy')
+    A = random_bimatrix(shape, seed)[0]
+    value, x, y = solve_zero_sum(A)
+    # x guarantees the value against every column and y holds the row player to it
+    assert (x @ A).min() == pytest.approx(value, abs=1e-9)
+    assert (A @ y).max() == pytest.approx(value, abs=1e-9)
+    assert is_nash([A, -A], x, y)
+
+
+@pytest.mark.parametrize('constant', [7.0, -3.5])
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(5))
+def test_constant_sum_shortcut_matches_vertex_enumeration(constant, shape, seed):
+    # Random float payoffs make the game nondegenerate, so its single equilibrium is what vertex
+    # enumeration finds; a non-zero constant must not shift the LP's answer
+    pytest.importorskip('scipy')
+    A = random_bimatrix(shape, seed)[0]
+    payoffs = [A, constant - A]
+    assert is_constant_sum(payoffs)
+    expected = vertex_enumeration(payoffs)
+    assert len(expected) == 1
+    assert same_equilibria(find_mixed_nash(payoffs, method='one'), expected)
+    assert same_equilibria(list(iter_mixed_nash(payoffs, method='one')), expected)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_constant_sum_shortcut_on_integer_games(seed):
+    # Integer payoffs are often degenerate; the LP's equilibrium need not be extreme there, but it
+    # is still an equilibrium paying the same as every vertex
+    pytest.importorskip('scipy')
+    A = integer_bimatrix((3, 4), seed)[0].astype(float)
+    payoffs = [A, 10.0 - A]
+    [(x, y)] = find_mixed_nash(payoffs, method='one')
+    assert is_nash(payoffs, x, y)
+    for u, v in vertex_enumeration(payoffs):
+        assert x @ A @ y == pytest.approx(u @ A @ v, abs=1e-9)
+
+
+def test_is_constant_sum():
+    A = random_bimatrix((2, 3), 0)[0]
+    assert is_constant_sum([A, 2.0 - A])
+    assert not is_constant_sum([A, A])
+    assert not is_constant_sum([A[None], -A[None], A[None]])
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from dmmrs import AnalysisCache, solve_game
+
+
+def random_game(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+
+
+def relabel(payoff_matrices, seed):
+    # The same game with players and every player's actions shuffled
+    rng = np.random.default_rng(seed)
+    players = rng.permutation(len(payoff_matrices))
+    actions = [rng.permutation(n) for n in payoff_matrices[0].shape]
+    shuffled = [np.asarray(payoffs)[np.ix_(*actions)] for payoffs in payoff_matrices]
+    return [np.transpose(shuffled[p], players) for p in players]
+
+
+def assert_same_record(record, expected):
+    for field in ('n_players', 'actions', 'strong_dominant', 'weak_dominant', 'maxmin_strategies'):
+        assert record[field] == expected[field]
+    for field in ('strong_equilibria', 'weak_equilibria', 'pure_nash'):
+        assert sorted(map(list, record[field])) == sorted(map(list, expected[field]))
+    for field in ('maxmin_values', 'mixed_maxmin_values'):
+        assert np.allclose(record[field], expected[field])
+    for strategy, other in zip(record['mixed_maxmin_strategies'], expected['mixed_maxmin_strategies']):
+        assert np.allclose(strategy, other, atol=1e-6)
+    # Equilibria may come out in another order for the canonical labelling
+    flatten = lambda equilibria: sorted(np.round(np.concatenate(eq), 6).tolist() for eq in equilibria)
+    assert np.allclose(flatten(record['mixed_nash']), flatten(expected['mixed_nash']), atol=1e-6)
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (2, 4), (2, 3, 2)])
+def test_cached_records_match_direct_solves(shape):
+    cache = AnalysisCache()
+    game = random_game(shape, 0)
+    assert_same_record(cache.solve(game), solve_game(game))
+    assert cache.stats()['misses'] == 1
+
+    for seed in range(3):
+        relabelled = relabel(game, seed)
+        assert_same_record(cache.solve(relabelled), solve_game(relabelled))
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 3
+
+
+def test_disk_tier_is_shared_between_caches(tmp_path):
+    game = random_game((3, 2), 1)
+    AnalysisCache(directory=str(tmp_path)).solve(game)
+    cache = AnalysisCache(directory=str(tmp_path))
+    assert_same_record(cache.solve(relabel(game, 0)), solve_game(relabel(game, 0)))
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_lru_tier_is_bounded():
+    cache = AnalysisCache(max_entries=2)
+    for seed in range(4):
+        cache.solve(random_game((2, 2), seed), analyses=['pure'])
+    assert len(cache) == 2
+    cache.solve(random_game((2, 2), 0), analyses=['pure'])
+    assert cache.stats()['misses'] == 5
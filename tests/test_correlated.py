@@ -0,0 +1,57 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, correlated_equilibrium
+
+pytest.importorskip('scipy')
+
+
+def incentive_gain(payoffs, distribution):
+    # Largest gain any player gets by deviating from a recommendation, checked profile by profile
+    shape = distribution.shape
+    gain = 0.0
+    for p, matrix in enumerate(payoffs):
+        for recommended, deviation in itertools.product(range(shape[p]), repeat=2):
+            total = 0.0
+            for profile in itertools.product(*(range(n) for n in shape)):
+                if profile[p] == recommended:
+                    deviated = profile[:p] + (deviation,) + profile[p + 1:]
+                    total += distribution[profile] * (matrix[deviated] - matrix[profile])
+            gain = max(gain, total)
+    return gain
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 3), (2, 3, 2)])
+@pytest.mark.parametrize('seed', range(4))
+def test_welfare_optimum_is_a_correlated_equilibrium(shape, seed):
+    rng = np.random.default_rng(seed)
+    payoffs = [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+    result = correlated_equilibrium(payoffs)
+    assert result.distribution.shape == shape and np.isclose(result.distribution.sum(), 1.0)
+    assert incentive_gain(payoffs, result.distribution) < 1e-7
+    assert np.isclose(result.welfare, result.payoffs.sum())
+    # Every Nash equilibrium is a correlated equilibrium, so none has more welfare
+    for strategies in StrategicFormGame(payoffs).find_all_mixed_nash_equilibria():
+        product = strategies[0]
+        for strategy in strategies[1:]:
+            product = np.multiply.outer(product, strategy)
+        assert sum(float((matrix * product).sum()) for matrix in payoffs) <= result.welfare + 1e-7
+
+
+def test_chicken_beats_its_nash_welfare():
+    # Game of chicken: the welfare-optimal correlated equilibrium mixes (D, C), (C, D) and (C, C)
+    A = np.array([[0.0, 7.0], [2.0, 6.0]])
+    result = correlated_equilibrium([A, A.T])
+    assert np.isclose(result.welfare, 10.5)
+    assert np.isclose(result.distribution[0, 0], 0.0, atol=1e-9)
+
+
+def test_objective_checks():
+    payoffs = [np.eye(2), np.eye(2)]
+    assert np.isclose(correlated_equilibrium(payoffs, objective=np.array([[0, 0], [0, 1]])).distribution[1, 1], 1.0)
+    with pytest.raises(ValueError):
+        correlated_equilibrium(payoffs, objective='best')
+    with pytest.raises(ValueError):
+        correlated_equilibrium(payoffs, objective=np.ones(3))
@@ -0,0 +1,141 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, analyze_game_batch, dominance_relation
+
+
+def opponent_profiles(shape, player):
+    return product(*[range(n) for i, n in enumerate(shape) if i != player])
+
+
+def with_action(opponents, player, action):
+    profile = list(opponents)
+    profile.insert(player, action)
+    return tuple(profile)
+
+
+def brute_force_dominant(payoff_matrices, dominance_type):
+    # The original definition: strong means strictly better than every other action against every
+    # opponent profile, weak means never strictly worse
+    shape = payoff_matrices[0].shape
+    dominant = []
+    for player, payoffs in enumerate(payoff_matrices):
+        dominant.append([action for action in range(shape[player])
+                         if all(payoffs[with_action(opponents, player, other)] < payoffs[with_action(opponents, player, action)]
+                                if dominance_type == 'strong' else
+                                payoffs[with_action(opponents, player, other)] <= payoffs[with_action(opponents, player, action)]
+                                for other in range(shape[player]) if other != action
+                                for opponents in opponent_profiles(shape, player))])
+    return dominant
+
+
+def brute_force_maxmin(payoff_matrices):
+    shape = payoff_matrices[0].shape
+    values, strategies = [], []
+    for player, payoffs in enumerate(payoff_matrices):
+        minima = [min(payoffs[with_action(opponents, player, action)] for opponents in opponent_profiles(shape, player))
+                  for action in range(shape[player])]
+        values.append(max(minima))
+        strategies.append([action for action, value in enumerate(minima) if value == max(minima)])
+    return values, strategies
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 3), (1, 3), (2, 3, 2), (3, 1, 2), (2, 2, 2, 2)])
+def test_dominance_and_maxmin_match_brute_force(shape):
+    # Payoffs from {0, 1} (and {0, 1, 2}) tie almost everywhere, where weak and strong differ
+    rng = np.random.default_rng(len(shape) * 10 + shape[0])
+    for high in (2, 3):
+        for _ in range(150):
+            payoffs = [rng.integers(0, high, size=shape) for _ in shape]
+            game = StrategicFormGame(payoffs)
+            for dominance_type in ('strong', 'weak'):
+                expected = brute_force_dominant(payoffs, dominance_type)
+                assert game.find_dominant_strategies(dominance_type) == expected
+                equilibria = list(product(*expected)) if all(expected) else []
+                assert game.find_dominant_strategy_equilibria(dominance_type) == equilibria
+            values, strategies = game.find_maxmin_values_and_strategies()
+            assert (values, strategies) == brute_force_maxmin(payoffs)
+            for player, matrix in enumerate(payoffs):
+                strict, weak = dominance_relation(matrix, player)
+                for first, second in product(range(shape[player]), repeat=2):
+                    pairs = [(matrix[with_action(opponents, player, first)], matrix[with_action(opponents, player, second)])
+                             for opponents in opponent_profiles(shape, player)]
+                    assert weak[first, second] == all(a >= b for a, b in pairs)
+                    assert strict[first, second] == (first != second and all(a > b for a, b in pairs))
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 4), (2, 3, 2), (3, 2, 2, 2)])
+def test_batch_analysis_matches_per_game_analysis(shape):
+    # Small integer payoffs, so ties (weak dominance, several best responses) are common
+    rng = np.random.default_rng(len(shape))
+    n_games = 40
+    stacks = [rng.integers(-2, 3, size=(n_games,) + shape) for _ in shape]
+    # A small chunk bound splits the batch into several blocks
+    batch = analyze_game_batch(stacks, chunk_elements=64)
+
+    for g in range(n_games):
+        game = StrategicFormGame([stack[g] for stack in stacks])
+        analysis = game.analysis()
+        dominance = analysis.dominance
+        assert sorted(map(tuple, np.argwhere(batch.pure_nash[g]))) == sorted(game.find_pure_nash_equilibria())
+        for p in range(len(shape)):
+            assert np.flatnonzero(batch.strong_dominant[p][g]).tolist() == analysis.strong_dominant[p]
+            assert np.flatnonzero(batch.weak_dominant[p][g]).tolist() == analysis.weak_dominant[p]
+            assert batch.maxmin_values[p][g] == analysis.maxmin_values[p]
+            assert np.flatnonzero(batch.maxmin_strategies[p][g]).tolist() == analysis.maxmin_strategies[p]
+            assert np.array_equal(batch.strict_relations[p][g], dominance.strict_relations[p])
+            assert np.array_equal(batch.weak_relations[p][g], dominance.weak_relations[p])
+        assert sorted(map(tuple, np.argwhere(batch.strong_equilibria[g]))) == analysis.strong_equilibria
+        assert sorted(map(tuple, np.argwhere(batch.weak_equilibria[g]))) == analysis.weak_equilibria
+
+
+def grid_maxmin(payoffs, player, steps):
+    # Best guaranteed payoff over every mixed strategy with probabilities in multiples of 1/steps,
+    # each judged against its worst pure opponent profile
+    rows = np.moveaxis(payoffs, player, 0).reshape(payoffs.shape[player], -1)
+    best = -np.inf
+    for counts in product(range(steps + 1), repeat=rows.shape[0] - 1):
+        if sum(counts) <= steps:
+            strategy = np.array(counts + (steps - sum(counts),)) / steps
+            best = max(best, (strategy @ rows).min())
+    return best
+
+
+@pytest.mark.parametrize('shape', [(2, 2, 2), (3, 2, 2)])
+@pytest.mark.parametrize('seed', range(5))
+def test_mixed_maxmin_matches_grid_search(shape, seed):
+    pytest.importorskip('scipy')
+    rng = np.random.default_rng(seed)
+    payoffs = [rng.integers(-5, 6, size=shape).astype(float) for _ in shape]
+    game = StrategicFormGame(payoffs)
+    values, strategies = game.find_mixed_maxmin_values_and_strategies()
+    steps = 400 if shape[0] == 2 else 60
+    for player, matrix in enumerate(payoffs):
+        rows = np.moveaxis(matrix, player, 0).reshape(shape[player], -1)
+        grid = grid_maxmin(matrix, player, steps)
+        # The grid can only miss the optimum by the payoff change over one grid step
+        assert grid - 1e-9 <= values[player] <= grid + 2 * np.ptp(matrix) * (shape[player] - 1) / steps
+        assert values[player] >= max(rows.min(axis=1)) - 1e-9
+        assert (strategies[player] @ rows).min() == pytest.approx(values[player], abs=1e-7)
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 4), (2, 2, 2), (3, 2, 2)])
+@pytest.mark.parametrize('seed', range(5))
+def test_punishment_holds_player_to_minmax_value(shape, seed):
+    # By LP duality the jointly mixed punishment is the opponents' minmax strategy: the player's
+    # best reply to it earns exactly the maxmin value and no more
+    pytest.importorskip('scipy')
+    rng = np.random.default_rng(seed)
+    payoffs = [rng.integers(-5, 6, size=shape).astype(float) for _ in shape]
+    analysis = StrategicFormGame(payoffs).analysis()
+    for player, (value, strategy, punishment) in enumerate(analysis.security_strategies):
+        opponent_shape = shape[:player] + shape[player + 1:]
+        assert punishment.shape == opponent_shape
+        assert punishment.min() >= 0 and punishment.sum() == pytest.approx(1.0)
+        rows = np.moveaxis(payoffs[player], player, 0).reshape(shape[player], -1)
+        replies = rows @ punishment.ravel()
+        assert replies.max() == pytest.approx(value, abs=1e-7)
+        assert strategy @ replies == pytest.approx(value, abs=1e-7)
+        assert np.array_equal(analysis.minmax_strategies[player], punishment)
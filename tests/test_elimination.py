@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, eliminate_dominated_strategies
+
+
+def key(strategies):
+    return tuple(tuple(np.round(strategy, 6)) for strategy in strategies)
+
+
+def test_strictly_dominated_actions_are_removed():
+    # Prisoner's dilemma: cooperation is strictly dominated for both players
+    game = StrategicFormGame([np.array([[3, 0], [5, 1]]), np.array([[3, 5], [0, 1]])])
+    reduced = game.reduce()
+    assert [actions.tolist() for actions in reduced.action_maps] == [[1], [1]]
+    assert reduced.to_original_profile((0, 0)) == (1, 1)
+
+
+def test_mixed_dominance_needs_the_lp_pass():
+    # Row 2 is beaten only by the even mix of rows 0 and 1
+    A = np.array([[3.0, 0.0], [0.0, 3.0], [1.0, 1.0]])
+    payoffs = [A, np.zeros((3, 2))]
+    assert eliminate_dominated_strategies(payoffs, mixed=False).action_maps[0].tolist() == [0, 1, 2]
+    assert eliminate_dominated_strategies(payoffs).action_maps[0].tolist() == [0, 1]
+
+
+def test_searches_do_not_reduce_by_default():
+    game = StrategicFormGame([np.array([[3, 0], [5, 1]]), np.array([[3, 5], [0, 1]])])
+    game.find_pure_nash_equilibria()
+    game.find_all_mixed_nash_equilibria()
+    assert game._reduced_game is None
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (4, 3), (3, 3, 2)])
+@pytest.mark.parametrize('seed', range(5))
+def test_reduction_preserves_equilibria(shape, seed):
+    rng = np.random.default_rng(seed)
+    # Shifting one action of every player down makes it likely to be dominated
+    payoffs = []
+    for p in range(len(shape)):
+        tensor = rng.uniform(-1.0, 1.0, size=shape)
+        index = [slice(None)] * len(shape)
+        index[p] = 0
+        tensor[tuple(index)] -= 1.5
+        payoffs.append(tensor)
+    game = StrategicFormGame(payoffs)
+    assert game.reduce().is_reduced()
+    assert game.find_pure_nash_equilibria(reduce=True) == game.find_pure_nash_equilibria()
+    full = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria())
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(reduce=True)) == full
+    assert sorted(key(strategies) for strategies in game.iter_mixed_nash_equilibria(reduce=True)) == full
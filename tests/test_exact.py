@@ -0,0 +1,108 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, bareiss_solve, integer_payoffs, is_exact_nash, iter_exact_equilibria
+from dmmrs.exact import _rationalize
+
+SHAPES = [(2, 2), (3, 3), (4, 4), (3, 5), (2, 2, 2), (3, 2, 2)]
+
+
+def integer_game(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(-9, 10, size=shape) for _ in shape]
+
+
+def float_game(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+
+
+def to_rational(strategies):
+    profile = []
+    for strategy in strategies:
+        denominator = math.lcm(*(value.denominator for value in strategy))
+        profile.append((np.array([int(value * denominator) for value in strategy], dtype=object), denominator))
+    return profile
+
+
+def key(strategies):
+    return tuple(tuple(np.round(np.asarray(strategy, dtype=float), 6)) for strategy in strategies)
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_bareiss_solve_matches_numpy(seed):
+    rng = np.random.default_rng(seed)
+    n_rows, n_columns = rng.integers(1, 7, size=2)
+    rank = int(rng.integers(1, min(n_rows, n_columns) + 1))
+    # Products of integer factors give systems of any rank; large entries force Python integers
+    scale = 10 ** int(rng.integers(1, 12))
+    matrix = rng.integers(-scale, scale, size=(n_rows, rank)) @ rng.integers(-3, 4, size=(rank, n_columns))
+    solution = rng.integers(-5, 6, size=n_columns)
+    rhs = matrix @ solution
+    numerators, denominator, found_rank = bareiss_solve(matrix.astype(object), rhs.astype(object))
+    assert found_rank == np.linalg.matrix_rank(matrix.astype(float))
+    assert denominator > 0
+    # Exactly a solution, in integer arithmetic
+    assert all(sum(int(a) * int(z) for a, z in zip(row, numerators)) == int(b) * denominator
+               for row, b in zip(matrix, rhs))
+
+    inconsistent = np.append(rhs, 1)
+    assert bareiss_solve(np.vstack([matrix, np.zeros(n_columns, dtype=matrix.dtype)]).astype(object),
+                         inconsistent.astype(object)) is None
+
+
+def test_integer_payoffs_scale_rationals_per_player():
+    payoffs = [np.array([[0.5, 1 / 3], [2.0, -0.25]]), np.array([[1, 2], [3, 4]])]
+    scaled = integer_payoffs(payoffs)
+    assert scaled[0].tolist() == [[6, 4], [24, -3]]
+    assert scaled[1].tolist() == [[1, 2], [3, 4]]
+    assert integer_payoffs([np.array([[np.inf, 0.0], [0.0, 0.0]])] * 2) is None
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(6))
+def test_exact_equilibria_verify_and_cover_the_numeric_ones(shape, seed):
+    payoffs = integer_game(shape, seed)
+    scaled = integer_payoffs(payoffs)
+    inexact = []
+    exact = list(iter_exact_equilibria(payoffs, inexact=inexact))
+    keys = [key(strategies) for strategies in exact]
+    assert len(set(keys)) == len(keys)
+    for strategies in exact:
+        assert all(sum(strategy) == 1 and min(strategy) >= 0 for strategy in strategies)
+        assert is_exact_nash(scaled, to_rational(strategies))
+
+    # Every rational equilibrium of the numeric search is among the exact ones
+    game = StrategicFormGame(payoffs)
+    for strategies in game.find_all_mixed_nash_equilibria():
+        profile = _rationalize(strategies, 1 << 20)
+        if profile is not None and is_exact_nash(scaled, profile):
+            assert key(strategies) in keys
+        else:
+            assert any(np.allclose(np.concatenate(strategies), np.concatenate(other), atol=1e-6) for other in inexact)
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', range(3))
+def test_exact_backend_agrees_with_numeric_on_generic_games(shape, seed):
+    game = StrategicFormGame(float_game(shape, seed))
+    numeric = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria())
+    exact = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='exact'))
+    assert exact == numeric
+
+
+def test_exact_equilibria_are_fractions():
+    # A zero-sum game whose unique equilibrium is (1/3, 2/3) for both players
+    A = np.array([[3, -1], [-1, 1]])
+    (x, y), = iter_exact_equilibria([A, -A])
+    assert list(x) == [Fraction(1, 3), Fraction(2, 3)]
+    assert list(y) == [Fraction(1, 3), Fraction(2, 3)]
+
+
+def test_limit_stops_the_enumeration():
+    payoffs = [np.eye(3, dtype=int), np.eye(3, dtype=int)]
+    assert len(list(iter_exact_equilibria(payoffs))) == 7
+    assert len(list(iter_exact_equilibria(payoffs, limit=2))) == 2
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame
+
+
+def two_root_game():
+    # Each player's payoff gap between its actions is a product of two linear factors, so the
+    # fully mixed support carries exactly two equilibria, (1/4, 1/3, 1/2) and (2/3, 3/4, 1/5) in
+    # the probabilities of the first actions; with the boundary ones the game has nine
+    first, second = (1 / 4, 1 / 3, 1 / 2), (2 / 3, 3 / 4, 1 / 5)
+    gaps = [lambda x, y, z: (y - first[1]) * (z - second[2]),
+            lambda x, y, z: (z - first[2]) * (x - second[0]),
+            lambda x, y, z: (x - first[0]) * (y - second[1])]
+    payoffs = [np.zeros((2, 2, 2)) for _ in range(3)]
+    for profile in np.ndindex(2, 2, 2):
+        point = [1.0 - action for action in profile]
+        for p, gap in enumerate(gaps):
+            if profile[p] == 0:
+                payoffs[p][profile] = gap(*point)
+    return payoffs
+
+
+def key(strategies):
+    return tuple(tuple(np.round(strategy, 6)) for strategy in strategies)
+
+
+@pytest.mark.parametrize('scale', [1.0, 1e6, 1e-6])
+@pytest.mark.parametrize('offset', [0.0, 3.0])
+def test_every_root_on_one_support_at_any_scale(scale, offset):
+    game = StrategicFormGame([scale * (payoffs + offset) for payoffs in two_root_game()])
+    equilibria = game.find_all_mixed_nash_equilibria()
+    assert len(equilibria) == 9
+    fully_mixed = sorted(strategies[0][0] for strategies in equilibria if all(s.min() > 0 for s in strategies))
+    assert np.allclose(fully_mixed, [1 / 4, 2 / 3])
+    assert all(game._regrets(strategies).max() <= 1e-9 * scale for strategies in equilibria)
+
+def test_float_game_with_two_fully_mixed_equilibria():
+    rng = np.random.default_rng(11)
+    for _ in range(19):
+        payoffs = [rng.uniform(-1, 1, (2, 2, 2)) for _ in range(3)]
+    for scale in (1.0, 1e6, 1e-6):
+        equilibria = StrategicFormGame([scale * matrix for matrix in payoffs]).find_all_mixed_nash_equilibria()
+        assert len(equilibria) == 5
+        assert sum(all(s.min() > 0 for s in strategies) for strategies in equilibria) == 2
+
+
+@pytest.mark.parametrize('shape', [(2, 2, 2), (3, 3, 2), (2, 2, 2, 2)])
+@pytest.mark.parametrize('seed', range(5))
+def test_rescaled_games_have_the_same_equilibria(shape, seed):
+    rng = np.random.default_rng(seed)
+    payoffs = [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+    expected = sorted(key(strategies) for strategies in StrategicFormGame(payoffs).find_all_mixed_nash_equilibria())
+    for scale in (1e6, 1e-6):
+        game = StrategicFormGame([scale * matrix + 10 * scale for matrix in payoffs])
+        assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria()) == expected
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from dmmrs import GENERATORS, StrategicFormGame, eliminate_dominated_strategies
+from dmmrs.generators import congestion_game, covariant_game, dominance_solvable_game, zero_sum_game
+
+
+@pytest.mark.parametrize('name', sorted(GENERATORS))
+def test_generators_are_seeded_and_shaped(name):
+    shape = [3, 3] if name == 'zero-sum' else [3, 3, 3]
+    first = GENERATORS[name](shape, 5)
+    assert len(first) == len(shape)
+    assert all(payoffs.shape == tuple(shape) for payoffs in first)
+    assert all(np.array_equal(a, b) for a, b in zip(first, GENERATORS[name](shape, 5)))
+
+
+@pytest.mark.parametrize('shape', [[2, 2], [3, 4], [4, 2, 3], [3, 3, 3], [2, 2, 2, 2]])
+@pytest.mark.parametrize('seed', range(10))
+def test_dominance_solvable_game_reduces_to_one_profile(shape, seed):
+    payoffs = dominance_solvable_game(shape, seed)
+    # Pure strict dominance alone must suffice, no mixtures needed
+    reduced = eliminate_dominated_strategies(payoffs, mixed=False)
+    assert reduced.player_actions == [1] * len(shape)
+    survivor = reduced.to_original_profile((0,) * len(shape))
+    assert StrategicFormGame(payoffs).find_pure_nash_equilibria() == [survivor]
+
+
+@pytest.mark.parametrize('n_players, correlation', [(2, -1.0), (2, 0.0), (2, 0.7), (3, -0.5), (3, 0.3), (4, 1.0)])
+def test_covariant_game_correlation(n_players, correlation):
+    payoffs = covariant_game([20] * 2 + [2] * (n_players - 2), 0, correlation)
+    samples = np.stack([p.ravel() for p in payoffs])
+    observed = np.corrcoef(samples)[~np.eye(n_players, dtype=bool)]
+    assert np.allclose(observed, correlation, atol=0.1)
+    if correlation == 1.0:
+        assert all(np.allclose(p, payoffs[0]) for p in payoffs)
+    if n_players == 2 and correlation == -1.0:
+        assert np.allclose(payoffs[0], -payoffs[1])
+
+
+@pytest.mark.parametrize('n_players, correlation', [(2, -1.01), (2, 1.01), (3, -0.51), (4, -0.4)])
+def test_covariant_game_rejects_impossible_correlation(n_players, correlation):
+    with pytest.raises(ValueError):
+        covariant_game([2] * n_players, 0, correlation)
+
+
+def test_zero_sum_game():
+    payoffs = zero_sum_game([3, 4], 0)
+    assert np.array_equal(payoffs[0], -payoffs[1])
+    with pytest.raises(ValueError):
+        zero_sum_game([2, 2, 2], 0)
+
+
+def test_congestion_game():
+    payoffs = congestion_game([3, 3, 3], 0)
+    # Sharing a resource never costs less than having it alone
+    assert payoffs[0][0, 0, 0] <= payoffs[0][0, 0, 1] <= payoffs[0][0, 1, 2]
+    # A player's payoff depends only on its own resource and that resource's load
+    assert payoffs[0][1, 0, 2] == payoffs[0][1, 2, 0]
+    assert payoffs[1][0, 1, 2] == payoffs[1][2, 1, 0]
+    with pytest.raises(ValueError):
+        congestion_game([2, 3], 0)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from dmmrs import GraphicalGame, PolymatrixGame, expected_payoff_table
+from dmmrs.graphical import _FactoredGame
+
+
+def ring_game(player_actions, seed):
+    # Each player depends on its two ring neighbours; small integers so pure equilibria exist
+    rng = np.random.default_rng(seed)
+    n = len(player_actions)
+    neighbours = [((p - 1) % n, (p + 1) % n) for p in range(n)]
+    local_payoffs = [rng.integers(0, 3, size=(player_actions[p],) + tuple(player_actions[q] for q in nbrs))
+                     for p, nbrs in enumerate(neighbours)]
+    return GraphicalGame(player_actions, neighbours, local_payoffs)
+
+
+def star_polymatrix(player_actions, seed):
+    rng = np.random.default_rng(seed)
+    edges = {}
+    for q in range(1, len(player_actions)):
+        edges[(0, q)] = rng.integers(-3, 4, size=(player_actions[0], player_actions[q]))
+        edges[(q, 0)] = rng.integers(-3, 4, size=(player_actions[q], player_actions[0]))
+    return PolymatrixGame(player_actions, edges)
+
+
+def random_strategies(player_actions, rng):
+    return [rng.dirichlet(np.ones(n)) for n in player_actions]
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('player_actions', [[2, 2, 2], [2, 3, 2, 3], [3, 2, 2, 2, 2]])
+def test_graphical_game_matches_dense_game(player_actions, seed):
+    game = ring_game(player_actions, seed)
+    dense = game.to_strategic_form()
+    assert game.find_pure_nash_equilibria() == sorted(dense.find_pure_nash_equilibria())
+
+    rng = np.random.default_rng(seed)
+    strategies = random_strategies(player_actions, rng)
+    for table, expected in zip(game.expected_payoff_table(strategies),
+                               expected_payoff_table(dense.payoff_matrices, strategies)):
+        assert np.allclose(table, expected)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_polymatrix_game_matches_graphical_and_dense_games(seed):
+    player_actions = [3, 2, 2, 3]
+    game = star_polymatrix(player_actions, seed)
+    graphical = game.to_graphical()
+    dense = game.to_strategic_form()
+    assert game.find_pure_nash_equilibria() == graphical.find_pure_nash_equilibria()
+    assert game.find_pure_nash_equilibria() == sorted(dense.find_pure_nash_equilibria())
+
+    strategies = random_strategies(player_actions, np.random.default_rng(seed))
+    assert np.allclose(game.regrets(strategies), graphical.regrets(strategies))
+    for table, expected in zip(game.expected_payoff_table(strategies),
+                               expected_payoff_table(dense.payoff_matrices, strategies)):
+        assert np.allclose(table, expected)
+
+
+def test_incomplete_subclass_fails_at_construction():
+    class Incomplete(_FactoredGame):
+        def _payoffs_of_actions(self, player, profile):
+            return np.zeros(2)
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import numpy as np
+
+from dmmrs import SolverStats, StrategicFormGame, instrument
+from dmmrs.instrumentation import active_stats, phase
+
+
+def test_active_stats_only_inside_instrument():
+    assert active_stats() is None
+    with instrument() as stats:
+        assert active_stats() is stats
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(active_stats()))
+        thread.start()
+        thread.join()
+        # Other threads are not instrumented by this block
+        assert seen == [None]
+        with instrument() as inner:
+            assert active_stats() is inner
+        assert active_stats() is stats
+    assert active_stats() is None
+
+
+def test_phase_is_a_no_op_outside_instrument():
+    with phase('anything'):
+        pass
+    assert active_stats() is None
+
+
+def test_phases_nest_and_accumulate():
+    with instrument() as stats:
+        for _ in range(2):
+            with phase('outer'):
+                with phase('inner'):
+                    time.sleep(0.01)
+                with phase('inner'):
+                    pass
+    assert stats.phase_calls == {'inner': 4, 'outer': 2}
+    assert stats.timings['inner'] >= 0.02
+    # Phase times are inclusive: the outer one contains both inner ones
+    assert stats.timings['outer'] >= stats.timings['inner']
+
+
+def test_instrument_accumulates_into_given_stats():
+    stats = SolverStats()
+    for _ in range(2):
+        with instrument(stats=stats):
+            StrategicFormGame([np.eye(2), np.eye(2)]).find_pure_nash_equilibria()
+    assert stats.phase_calls['pure-nash'] == 2
+    stats.merge({'supports_tried': 3}, {'pure-nash': 1.0})
+    assert stats.timings['pure-nash'] >= 1.0
+    assert stats.to_dict()['counters']['supports_tried'] == 3
+
+
+def test_progress_callback_fires():
+    calls = []
+    with instrument(progress=lambda stats: calls.append(dict(stats.counters)), progress_interval=0.0):
+        StrategicFormGame([np.array([[3, 0], [0, 1]]), np.array([[0, 1], [1, 0]])]).find_all_mixed_nash_equilibria()
+    assert calls
+    # Every call sees the counters as they stood at that moment
+    assert calls[-1]['supports_tried'] == 9
+    assert [c.get('supports_tried', 0) for c in calls] == sorted(c.get('supports_tried', 0) for c in calls)
+
+    calls.clear()
+    with instrument(progress=lambda stats: calls.append(stats), progress_interval=3600.0):
+        StrategicFormGame([np.array([[3, 0], [0, 1]]), np.array([[0, 1], [1, 0]])]).find_all_mixed_nash_equilibria()
+    assert calls == []
+
+
+def test_counters_on_a_game_without_pure_equilibria():
+    # No pure equilibrium and a unique mixed one at x = (1/2, 1/2), y = (1/4, 3/4). Each of the 8
+    # supports other than the full one leaves some player an action strictly beaten on it, so only
+    # the full support is solved: one linear system, as both players mix. The start (uniform
+    # strategies) is off the root, so the Newton step is taken exactly once.
+    game = StrategicFormGame([np.array([[3, 0], [0, 1]]), np.array([[0, 1], [1, 0]])])
+    with instrument() as stats:
+        [equilibrium] = game.find_all_mixed_nash_equilibria()
+    assert np.allclose(equilibrium[0], [0.5, 0.5]) and np.allclose(equilibrium[1], [0.25, 0.75])
+    assert stats.counters['supports_tried'] == 9
+    assert stats.counters['supports_pruned'] == 8
+    assert stats.counters['linear_systems_solved'] == 1
+    assert stats.counters['duplicates_rejected'] == 0
+    assert stats.counters['profiles_scanned'] == 4
+    assert stats.phase_calls['mixed-nash'] == 1 and stats.phase_calls['support-search'] == 1
+
+
+def test_counters_on_prisoners_dilemma():
+    # Defecting strictly dominates, so only the pure support ((1,), (1,)) survives pruning; it has
+    # nothing to solve and finds the pure equilibrium again, which the store rejects
+    game = StrategicFormGame([np.array([[3, 0], [5, 1]]), np.array([[3, 5], [0, 1]])])
+    with instrument() as stats:
+        [equilibrium] = game.find_all_mixed_nash_equilibria()
+    assert np.array_equal(equilibrium[0], [0, 1]) and np.array_equal(equilibrium[1], [0, 1])
+    assert stats.counters['supports_tried'] == 9
+    assert stats.counters['supports_pruned'] == 8
+    assert stats.counters.get('linear_systems_solved', 0) == 0
+    assert stats.counters['duplicates_rejected'] == 1
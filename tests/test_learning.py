@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, fictitious_play, regret_matching, replicator_dynamics
+
+
+def zero_sum(shape, seed):
+    A = np.random.default_rng(seed).uniform(-1.0, 1.0, size=shape)
+    return [A, -A]
+
+
+@pytest.mark.parametrize('solver', [fictitious_play, regret_matching])
+@pytest.mark.parametrize('seed', range(3))
+def test_zero_sum_games_converge(solver, seed):
+    payoffs = zero_sum((4, 3), seed)
+    result = solver(payoffs, epsilon=1e-2)
+    assert result.converged and result.epsilon <= 1e-2
+    # The reported epsilon is the largest regret of the returned profile
+    assert np.isclose(StrategicFormGame(payoffs)._regrets(result.strategies).max(), result.epsilon)
+
+
+def test_replicator_reaches_a_strict_equilibrium():
+    # Coordination game: from an interior start leaning to action 0, both players settle on it
+    A = np.array([[2.0, 0.0], [0.0, 1.0]])
+    result = replicator_dynamics([A, A], epsilon=1e-4, initial=[np.array([0.6, 0.4])] * 2)
+    assert result.converged
+    assert all(strategy[0] > 0.99 for strategy in result.strategies)
+
+
+def test_budgets_and_callback_stop_early():
+    payoffs = zero_sum((5, 5), 0)
+    result = fictitious_play(payoffs, epsilon=0.0, max_iterations=50)
+    assert result.iterations == 50 and not result.converged
+    seen = []
+    result = fictitious_play(payoffs, epsilon=0.0, callback=lambda iteration, epsilon, strategies: seen.append(epsilon) or iteration == 7)
+    assert result.iterations == 7 and len(seen) == 7
+    # The best profile seen is returned, not the last one
+    assert result.epsilon == min(seen)
+    assert fictitious_play(payoffs, epsilon=0.0, time_budget=0.0).iterations == 1
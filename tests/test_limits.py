@@ -0,0 +1,91 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from dmmrs import (GraphicalGame, PolymatrixGame, SMTNashSolver, StrategicFormGame, SymmetricGame, instrument,
+                   iter_exact_equilibria, iter_mixed_nash, iter_pure_nash, iter_vertex_enumeration)
+
+# Coordination games: every search below has several results on them
+BIMATRIX = [np.eye(3), np.eye(3)]
+THREE_PLAYER = [np.zeros((2, 2, 2)) for _ in range(3)]
+for payoffs in THREE_PLAYER:
+    payoffs[0, 0, 0] = payoffs[1, 1, 1] = 1.0
+
+
+def graphical_game():
+    neighbours = [(1, 2), (0, 2), (0, 1)]
+    match = np.array([[[2, 1], [1, 0]], [[0, 1], [1, 2]]])
+    return GraphicalGame([2, 2, 2], neighbours, [match] * 3)
+
+
+def polymatrix_game():
+    return PolymatrixGame([2, 2], {(0, 1): np.eye(2), (1, 0): np.eye(2)})
+
+
+def symmetric_game():
+    return SymmetricGame.from_function(3, 2, lambda action, counts: float(counts[action]))
+
+
+# Every iter_* search, as a function of its stopping rules. The dense pure searches check them
+# between chunks of profiles, so the chunks are made small enough to separate the equilibria.
+SEARCHES = {
+    'game-pure': lambda **limits: StrategicFormGame(THREE_PLAYER).iter_pure_nash_equilibria(chunk_elements=2, **limits),
+    'game-mixed': lambda **limits: StrategicFormGame(THREE_PLAYER).iter_mixed_nash_equilibria(**limits),
+    'pure': lambda **limits: iter_pure_nash(THREE_PLAYER, chunk_elements=2, **limits),
+    'vertex-enumeration': lambda **limits: iter_vertex_enumeration(BIMATRIX, **limits),
+    'mixed-all': lambda **limits: iter_mixed_nash(BIMATRIX, method='all', **limits),
+    'mixed-one': lambda **limits: iter_mixed_nash(BIMATRIX, method='one', **limits),
+    'mixed-support': lambda **limits: iter_mixed_nash(BIMATRIX, method='support', **limits),
+    'graphical': lambda **limits: graphical_game().iter_pure_nash(**limits),
+    'polymatrix': lambda **limits: polymatrix_game().iter_pure_nash(**limits),
+    'symmetric-pure': lambda **limits: symmetric_game().iter_pure_nash(**limits),
+    'symmetric-mixed': lambda **limits: symmetric_game().iter_symmetric_equilibria(**limits),
+    'smt-block': lambda **limits: SMTNashSolver(BIMATRIX).iter_equilibria(mode='block', **limits),
+    'smt-support': lambda **limits: SMTNashSolver(BIMATRIX).iter_equilibria(mode='support', **limits),
+    'exact': lambda **limits: iter_exact_equilibria(BIMATRIX, **limits),
+}
+NEEDS = {'mixed-support': 'nashpy', 'smt-block': 'z3', 'smt-support': 'z3', 'mixed-one': 'scipy'}
+
+
+@pytest.fixture(params=sorted(SEARCHES))
+def search(request):
+    if request.param in NEEDS:
+        pytest.importorskip(NEEDS[request.param])
+    return SEARCHES[request.param]
+
+
+def test_unlimited_search_finds_results(search):
+    assert len(list(search(deadline=time.monotonic() + 600.0, cancel=threading.Event()))) >= 1
+
+
+def test_expired_deadline_stops_before_first_result(search):
+    assert list(search(deadline=time.monotonic())) == []
+
+
+def test_set_cancel_stops_before_first_result(search):
+    cancel = threading.Event()
+    cancel.set()
+    assert list(search(cancel=cancel)) == []
+
+
+def test_cancel_during_search_stops_it(search):
+    cancel = threading.Event()
+    results = []
+    for result in search(cancel=cancel):
+        results.append(result)
+        cancel.set()
+    assert len(results) == 1
+
+
+def test_limit(search):
+    assert len(list(search(limit=1))) == 1
+    assert list(search(limit=0)) == []
+
+
+def test_expired_deadline_does_no_work():
+    with instrument() as stats:
+        assert list(StrategicFormGame(THREE_PLAYER).iter_mixed_nash_equilibria(deadline=time.monotonic())) == []
+    assert stats.counters.get('supports_tried', 0) == 0
+    assert stats.counters.get('profiles_scanned', 0) == 0
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from dmmrs import MutableGame, StrategicFormGame
+
+
+def assert_matches_dense(mutable):
+    dense = StrategicFormGame([payoffs.copy() for payoffs in mutable.payoff_matrices])
+    analysis = dense.analysis()
+    assert mutable.find_pure_nash_equilibria() == sorted(dense.find_pure_nash_equilibria())
+    assert mutable.find_dominant_strategies('strong') == analysis.strong_dominant
+    assert mutable.find_dominant_strategies('weak') == analysis.weak_dominant
+    assert mutable.find_dominant_strategy_equilibria('strong') == analysis.strong_equilibria
+    assert mutable.find_dominant_strategy_equilibria('weak') == analysis.weak_equilibria
+    dominance = mutable.find_dominance()
+    for p in range(dense.n_players):
+        assert np.array_equal(dominance.strict_relations[p], analysis.dominance.strict_relations[p])
+        assert np.array_equal(dominance.weak_relations[p], analysis.dominance.weak_relations[p])
+    values, strategies = mutable.find_maxmin_values_and_strategies()
+    assert values == analysis.maxmin_values
+    assert strategies == analysis.maxmin_strategies
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 4), (2, 3, 2)])
+def test_patches_keep_analyses_equal_to_a_fresh_game(shape):
+    # Few distinct payoffs, so patches keep creating and breaking ties
+    rng = np.random.default_rng(len(shape))
+    mutable = MutableGame([rng.integers(0, 3, size=shape) for _ in shape])
+    assert_matches_dense(mutable)
+    for _ in range(150):
+        player = int(rng.integers(len(shape)))
+        profile = tuple(int(rng.integers(n)) for n in shape)
+        mutable.set_payoff(player, profile, float(rng.integers(0, 3)))
+        assert_matches_dense(mutable)
+
+
+def test_update_patches_several_entries():
+    rng = np.random.default_rng(0)
+    mutable = MutableGame([rng.integers(0, 5, size=(3, 3)) for _ in range(2)])
+    profiles = [(0, 0), (1, 2), (2, 1)]
+    mutable.update(1, profiles, [9.0, 9.0, 9.0])
+    for profile in profiles:
+        assert mutable.payoff_matrices[1][profile] == 9.0
+    assert_matches_dense(mutable)
+    assert_matches_dense(MutableGame.from_game(mutable.to_game()))
@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+
+from dmmrs import StrategicFormGame, instrument
+from dmmrs import parallel
+
+
+def integer_game(shape, seed):
+    rng = np.random.default_rng(seed)
+    return StrategicFormGame([rng.integers(-5, 6, size=shape).astype(float) for _ in shape])
+
+
+def test_pool_returns_the_serial_results(monkeypatch):
+    # 3x3x3 has 343 support profiles, enough for the pool; pretend there are cores to use
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    calls = []
+    search = parallel._parallel_support_search
+
+    def counted(*args, **options):
+        calls.append(args)
+        yield from search(*args, **options)
+
+    monkeypatch.setattr(parallel, '_parallel_support_search', counted)
+    game = integer_game((3, 3, 3), 0)
+    with instrument() as serial_stats:
+        serial = game.find_all_mixed_nash_equilibria(n_jobs=1)
+    with instrument() as pool_stats:
+        pooled = game.find_all_mixed_nash_equilibria(n_jobs=2, chunk_size=32)
+    assert len(calls) == 1
+    assert len(serial) > 1 and len(pooled) == len(serial)
+    for first, second in zip(serial, pooled):
+        assert all(np.array_equal(x, y) for x, y in zip(first, second))
+    assert pool_stats.counters == serial_stats.counters
+
+
+def test_small_or_single_core_searches_stay_serial(monkeypatch):
+    def no_pool(*args, **options):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(parallel, '_parallel_support_search', no_pool)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    # 2x2x2 has only 27 support profiles
+    integer_game((2, 2, 2), 0).find_all_mixed_nash_equilibria(n_jobs=4)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 1)
+    integer_game((3, 3, 3), 0).find_all_mixed_nash_equilibria(n_jobs=4)
@@ -0,0 +1,34 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, find_pure_nash, iter_pure_nash
+
+
+def brute_force_pure_nash(payoff_matrices):
+    shape = payoff_matrices[0].shape
+    equilibria = []
+    for profile in itertools.product(*(range(n) for n in shape)):
+        if all(payoffs[profile] == payoffs[profile[:p] + (slice(None),) + profile[p + 1:]].max()
+               for p, payoffs in enumerate(payoff_matrices)):
+            equilibria.append(profile)
+    return equilibria
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (2, 3, 4), (3, 2, 2, 3)])
+@pytest.mark.parametrize('chunk_elements', [1, 4, 7, 1 << 22])
+def test_chunked_search_matches_brute_force(shape, chunk_elements):
+    # Small integer payoffs give many ties and several equilibria per game
+    rng = np.random.default_rng(len(shape))
+    for _ in range(10):
+        payoffs = [rng.integers(0, 3, size=shape) for _ in shape]
+        expected = brute_force_pure_nash(payoffs)
+        assert sorted(find_pure_nash(payoffs, chunk_elements)) == expected
+        assert sorted(StrategicFormGame(payoffs).find_pure_nash_equilibria(chunk_elements)) == expected
+
+
+def test_limit_stops_after_the_first_equilibria():
+    payoffs = [np.ones((3, 3, 3)) for _ in range(3)]
+    assert len(find_pure_nash(payoffs)) == 27
+    assert len(list(iter_pure_nash(payoffs, chunk_elements=3, limit=5))) == 5
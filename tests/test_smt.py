@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+from dmmrs import StrategicFormGame, iter_exact_equilibria
+
+pytest.importorskip('z3')
+from dmmrs import SMTNashSolver  # noqa: E402
+from dmmrs.smt import _isolated_bound  # noqa: E402
+
+
+def integer_game(shape, seed):
+    rng = np.random.default_rng(seed)
+    return [rng.integers(-9, 10, size=shape) for _ in shape]
+
+
+def generic_game(shape, seed):
+    # Multiples of 1/64: generic like uniform floats, but cheap for Z3 with three players, where
+    # arbitrary floats become rationals with 53-bit denominators
+    rng = np.random.default_rng(seed)
+    return [rng.integers(-64, 65, size=shape) / 64 for _ in shape]
+
+
+def two_root_game():
+    # Each player's payoff gap between its actions is a product of two linear factors, so the
+    # fully mixed support carries exactly two equilibria, (1/4, 1/3, 1/2) and (2/3, 3/4, 1/5) in
+    # the probabilities of the first actions, as isolated roots
+    first, second = (1 / 4, 1 / 3, 1 / 2), (2 / 3, 3 / 4, 1 / 5)
+    gaps = [lambda x, y, z: (y - first[1]) * (z - second[2]),
+            lambda x, y, z: (z - first[2]) * (x - second[0]),
+            lambda x, y, z: (x - first[0]) * (y - second[1])]
+    payoffs = [np.zeros((2, 2, 2)) for _ in range(3)]
+    for profile in np.ndindex(2, 2, 2):
+        point = [1.0 - action for action in profile]
+        for p, gap in enumerate(gaps):
+            if profile[p] == 0:
+                payoffs[p][profile] = gap(*point)
+    return payoffs
+
+
+def key(strategies):
+    return tuple(tuple(np.round(np.asarray(strategy, dtype=float), 6)) for strategy in strategies)
+
+
+def supports(equilibria):
+    return {tuple(tuple(np.flatnonzero(np.asarray(strategy, dtype=float) > 1e-9).tolist()) for strategy in strategies)
+            for strategies in equilibria}
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 3), (2, 4), (2, 2, 2)])
+@pytest.mark.parametrize('seed', range(3))
+def test_backends_agree_on_generic_games(shape, seed):
+    game = StrategicFormGame(generic_game(shape, seed))
+    numeric = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria())
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='smt')) == numeric
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='exact')) == numeric
+
+
+@pytest.mark.parametrize('shape', [(3, 3), (4, 4), (2, 2, 2), (3, 2, 2)])
+@pytest.mark.parametrize('seed', range(4))
+def test_smt_finds_one_equilibrium_per_exact_support(shape, seed):
+    # Integer payoffs make degenerate games common; SMT reports one equilibrium per support
+    # profile that carries any, and the exact search (plus its irrational leftovers) covers them all
+    payoffs = integer_game(shape, seed)
+    game = StrategicFormGame(payoffs)
+    inexact = []
+    exact = list(iter_exact_equilibria(payoffs, inexact=inexact))
+    for mode in ('block', 'support'):
+        solver = SMTNashSolver(payoffs)
+        found = solver.find_all_equilibria(mode)
+        assert not solver.unknown
+        assert all(game._regrets(strategies).max() < 1e-9 for strategies in found)
+        assert supports(found) == supports(exact) | supports(inexact)
+
+
+@pytest.mark.parametrize('mode', ['block', 'support'])
+def test_every_root_on_a_support_is_found(mode):
+    payoffs = two_root_game()
+    game = StrategicFormGame(payoffs)
+    numeric = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria())
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='exact')) == numeric
+    solver = SMTNashSolver(payoffs)
+    found = solver.find_all_equilibria(mode)
+    assert not solver.unknown
+    assert sorted(key(strategies) for strategies in found) == numeric
+    fully_mixed = [strategies for strategies in found if all(strategy.min() > 0 for strategy in strategies)]
+    assert len(fully_mixed) == 2
+
+
+def test_float_game_with_two_fully_mixed_equilibria():
+    # Used to come out one short: the second equilibrium on the fully mixed support was dropped
+    rng = np.random.default_rng(11)
+    for _ in range(19):
+        payoffs = [rng.uniform(-1, 1, (2, 2, 2)) for _ in range(3)]
+    game = StrategicFormGame(payoffs)
+    numeric = sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria())
+    assert len(numeric) == 5
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='exact')) == numeric
+    assert sorted(key(strategies) for strategies in game.find_all_mixed_nash_equilibria(backend='smt')) == numeric
+
+
+def test_isolated_bound():
+    # McKelvey and McLennan's maxima of totally mixed equilibria
+    assert _isolated_bound(((0, 1), (0, 1))) == 1
+    assert _isolated_bound(((0, 1, 2), (0, 1))) == 0
+    assert _isolated_bound(((0, 1), (0, 1), (0, 1))) == 2
+    assert _isolated_bound(((0, 1, 2), (0, 1, 2), (0, 1, 2))) == 10
+    assert _isolated_bound(((0, 1),) * 4) == 9
+
+
+def test_continuum_on_a_support_terminates():
+    # Both players indifferent everywhere: every profile is an equilibrium
+    payoffs = [np.zeros((2, 2)), np.zeros((2, 2))]
+    for mode in ('block', 'support'):
+        solver = SMTNashSolver(payoffs)
+        found = solver.find_all_equilibria(mode)
+        assert len(supports(found)) == 9
+
+
+def test_limit_and_unknown_mode():
+    payoffs = [np.eye(3), np.eye(3)]
+    solver = SMTNashSolver(payoffs)
+    assert len(list(solver.iter_equilibria(limit=2))) == 2
+    with pytest.raises(ValueError):
+        list(solver.iter_equilibria(mode='unknown'))
+
+
+def test_undecided_queries_warn(monkeypatch):
+    # Pretend Z3 gave up once: the search still returns what it found, with a warning
+    original = SMTNashSolver.iter_equilibria
+
+    def giving_up(self, *args, **options):
+        yield from original(self, *args, **options)
+        self.unknown.append(None)
+
+    monkeypatch.setattr(SMTNashSolver, 'iter_equilibria', giving_up)
+    game = StrategicFormGame([np.array([[3, 0], [5, 1]]), np.array([[3, 5], [0, 1]])])
+    with pytest.warns(RuntimeWarning, match='incomplete'):
+        equilibria = game.find_all_mixed_nash_equilibria(backend='smt')
+    assert [key(strategies) for strategies in equilibria] == [((0.0, 1.0), (0.0, 1.0))]
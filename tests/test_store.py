@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from dmmrs import EquilibriumStore
+
+
+def naive_unique(candidates, tolerance):
+    # What the store replaces: a scan over everything kept so far
+    unique = []
+    for candidate in candidates:
+        vector = np.concatenate(candidate)
+        if not any(np.allclose(vector, np.concatenate(kept), atol=tolerance) for kept in unique):
+            unique.append(candidate)
+    return unique
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_store_matches_a_linear_scan(seed):
+    # Jittered copies of a few equilibria, some of them on the fractions the grid is shifted off
+    rng = np.random.default_rng(seed)
+    bases = [[np.array([0.5, 0.5]), np.array([1 / 3, 1 / 3, 1 / 3])],
+             [np.array([1.0, 0.0]), np.array([0.0, 0.5, 0.5])]]
+    bases += [[rng.dirichlet(np.ones(2)), rng.dirichlet(np.ones(3))] for _ in range(20)]
+    candidates = []
+    for _ in range(200):
+        base = bases[rng.integers(len(bases))]
+        candidates.append([strategy + rng.uniform(-1e-7, 1e-7, size=strategy.shape) for strategy in base])
+    store = EquilibriumStore(1e-6)
+    added = [store.add(candidate) for candidate in candidates]
+    expected = naive_unique(candidates, 1e-6)
+    assert len(store) == len(expected) == sum(added)
+    assert store.candidates == len(candidates) and store.duplicates == len(candidates) - len(store)
+    assert all(candidate in store for candidate in candidates)
+    assert [np.array([0.25, 0.75]), np.array([0.9, 0.05, 0.05])] not in store
+
+
+def test_bridging_candidates_link_components():
+    # Two stored points 1e-5 apart; a candidate halfway between matches both and links them
+    def point(shift):
+        return [np.array([0.5 + shift, 0.5 - shift]), np.array([1.0, 0.0])]
+
+    store = EquilibriumStore(1e-6)
+    assert store.add(point(0.0)) and store.add(point(1e-5))
+    assert len(store.components()) == 2
+    assert not store.add(point(5e-6))
+    assert len(store) == 2 and len(store.components()) == 1
+
+
+def test_merge_maps_equilibria():
+    first = EquilibriumStore(1e-6)
+    first.add([np.array([1.0, 0.0])])
+    other = EquilibriumStore(1e-6)
+    other.add([np.array([0.5, 0.5])])
+    other.add([np.array([0.0, 1.0])])
+    # e.g. reduced games map their strategies back by padding the dominated actions with zeros
+    first.merge(other, transform=lambda strategies: [np.append(strategy, 0.0) for strategy in strategies])
+    first.merge(other)
+    assert len(first) == 5
+    assert [np.array([0.5, 0.5, 0.0])] in first and [np.array([0.5, 0.5])] in first
@@ -0,0 +1,160 @@
+import json
+
+import numpy as np
+import pytest
+
+from dmmrs import iter_games, iter_solutions, solve_game
+from dmmrs.__main__ import main
+from dmmrs.stream import iter_nfg
+
+# Prisoner's dilemma, (C, C) = (3, 3), (D, C) = (5, 0), (C, D) = (0, 5), (D, D) = (1, 1)
+PD_ROW = np.array([[3.0, 0.0], [5.0, 1.0]])
+PD_COLUMN = PD_ROW.T
+
+PAYOFF_LIST = '''NFG 1 R "Prisoner's \\"dilemma\\"" { "Row" "Column" } { 2 2 }
+"A payoff list, first player's action changing fastest"
+
+3 3 5 0 0 5 1 1
+'''
+
+OUTCOME_TABLE = '''NFG 1 R "Outcomes" { "Row" "Column" }
+{ { "C" "D" } { "C" "D" } }
+""
+{
+{ "both cooperate" 3, 3 }
+{ "row defects" 5, 0 }
+{ "column defects" 0, 5 }
+}
+1 2 3 0
+'''
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_nfg_payoff_list_and_outcome_table(tmp_path):
+    path = write(tmp_path, 'games.nfg', PAYOFF_LIST + OUTCOME_TABLE)
+    (first_id, first), (second_id, second) = iter_games(path)
+    assert (first_id, second_id) == (f'{path}:0', f'{path}:1')
+    assert np.array_equal(first[0], PD_ROW) and np.array_equal(first[1], PD_COLUMN)
+    # Outcome 0 means zero payoffs: (D, D) pays nothing here
+    assert np.array_equal(second[0], [[3.0, 0.0], [5.0, 0.0]])
+    assert np.array_equal(second[1], [[3.0, 5.0], [0.0, 0.0]])
+
+
+def test_nfg_three_players_fill_first_player_fastest(tmp_path):
+    # Payoff of every player = index of the profile in the file
+    shape = (2, 3, 2)
+    values = ' '.join(f'{i} {i} {i}' for i in range(12))
+    path = write(tmp_path, 'three.nfg', f'NFG 1 R "" {{ "1" "2" "3" }} {{ 2 3 2 }}\n{values}\n')
+    (_, payoffs), = iter_games(path)
+    expected = np.arange(12.0).reshape(shape, order='F')
+    assert all(np.array_equal(matrix, expected) for matrix in payoffs)
+
+
+@pytest.mark.parametrize('read_chars', [1, 2, 3, 7, 16])
+def test_nfg_tokens_split_across_reads(tmp_path, read_chars):
+    # Small buffers cut strings (with escaped quotes), numbers and rationals at every position
+    text = PAYOFF_LIST.replace('3 3 5 0', '3/1 3 5.0 0') + OUTCOME_TABLE
+    path = write(tmp_path, 'split.nfg', text)
+    expected = list(iter_nfg(path))
+    games = list(iter_nfg(path, read_chars))
+    assert len(games) == len(expected) == 2
+    for (game_id, payoffs), (expected_id, expected_payoffs) in zip(games, expected):
+        assert game_id == expected_id
+        assert all(np.array_equal(x, y) for x, y in zip(payoffs, expected_payoffs))
+
+
+def test_npy_and_npz_readers(tmp_path):
+    rng = np.random.default_rng(0)
+    single = rng.integers(-5, 6, size=(2, 3, 2)).astype(float)
+    # Five three-player games: five is not the number of players, so the shape is unambiguous
+    stack = rng.uniform(size=(5, 3, 2, 2, 2))
+    np.save(tmp_path / 'single.npy', single)
+    np.save(tmp_path / 'stack.npy', stack)
+    np.save(tmp_path / 'fortran.npy', np.asfortranarray(stack))
+    np.savez_compressed(tmp_path / 'archive.npz', single=single, stack=stack)
+
+    (game_id, payoffs), = iter_games(str(tmp_path / 'single.npy'))
+    assert np.array_equal(np.stack(payoffs), single)
+    for name in ('stack.npy', 'fortran.npy'):
+        games = list(iter_games(str(tmp_path / name)))
+        assert [game_id for game_id, _ in games] == [f'{tmp_path / name}:{i}' for i in range(5)]
+        assert all(np.array_equal(np.stack(payoffs), stack[i]) for i, (_, payoffs) in enumerate(games))
+    games = list(iter_games(str(tmp_path / 'archive.npz')))
+    assert [game_id.rsplit('.npz:', 1)[1] for game_id, _ in games] == ['single'] + [f'stack:{i}' for i in range(5)]
+
+    np.save(tmp_path / 'bad.npy', np.zeros((3, 2, 2)))
+    with pytest.raises(ValueError):
+        list(iter_games(str(tmp_path / 'bad.npy')))
+
+
+def test_jsonl_reader(tmp_path, monkeypatch):
+    lines = [json.dumps({'id': 'pd', 'payoffs': [PD_ROW.tolist(), PD_COLUMN.tolist()]}), '',
+             json.dumps([np.eye(2).tolist(), np.eye(2).tolist()])]
+    path = write(tmp_path, 'games.jsonl', '\n'.join(lines) + '\n')
+    games = list(iter_games(path))
+    assert [game_id for game_id, _ in games] == ['pd', f'{path}:3']
+    assert np.array_equal(games[0][1][0], PD_ROW)
+    with open(path) as stream:
+        monkeypatch.setattr('sys.stdin', stream)
+        assert [game_id for game_id, _ in iter_games('-')] == ['pd', '-:3']
+    with pytest.raises(ValueError):
+        iter_games(path, 'csv')
+
+
+def games_file(tmp_path, n_games=8):
+    # Games of different sizes, so a pool finishes them out of order
+    rng = np.random.default_rng(0)
+    lines = []
+    for index in range(n_games):
+        shape = (3, 3, 3) if index % 3 == 0 else (2, 2)
+        lines.append(json.dumps({'id': f'g{index}', 'payoffs': [rng.uniform(-1, 1, shape).tolist() for _ in shape]}))
+    # A malformed game becomes an error record instead of stopping the stream
+    lines.append(json.dumps({'id': 'bad', 'payoffs': [np.zeros((2, 2)).tolist(), np.zeros((3, 2)).tolist()]}))
+    return write(tmp_path, 'games.jsonl', '\n'.join(lines) + '\n')
+
+
+def read_records(path):
+    with open(path) as stream:
+        return [json.loads(line) for line in stream]
+
+
+def test_cli_ordered_and_unordered_output_with_a_pool(tmp_path):
+    path = games_file(tmp_path)
+    serial = iter_solutions(iter_games(path), analyses=['pure', 'mixed'])
+    expected = {record['id']: record for record in serial}
+    ordered, unordered = str(tmp_path / 'ordered.jsonl'), str(tmp_path / 'unordered.jsonl')
+    main(['solve', path, '-a', 'pure,mixed', '-j', '2', '--window', '3', '--ordered', '-o', ordered])
+    main(['solve', path, '-a', 'pure,mixed', '-j', '2', '--window', '3', '-o', unordered])
+
+    records = read_records(ordered)
+    assert [record['id'] for record in records] == [f'g{index}' for index in range(8)] + ['bad']
+    assert records == [expected[record['id']] for record in records]
+    assert 'error' in records[-1]
+    records = read_records(unordered)
+    assert sorted(record['id'] for record in records) == sorted(expected)
+    assert all(record == expected[record['id']] for record in records)
+
+
+def test_cli_cache_hits_relabelled_duplicate(tmp_path, capsys):
+    rng = np.random.default_rng(1)
+    A, B = rng.uniform(-1, 1, (2, 3)), rng.uniform(-1, 1, (2, 3))
+    # The same game with the players swapped and the row player's actions reversed
+    swapped = [B.T[:, ::-1], A.T[:, ::-1]]
+    lines = [json.dumps({'id': 'game', 'payoffs': [A.tolist(), B.tolist()]}),
+             json.dumps({'id': 'copy', 'payoffs': [matrix.tolist() for matrix in swapped]})]
+    path = write(tmp_path, 'games.jsonl', '\n'.join(lines) + '\n')
+    output = str(tmp_path / 'out.jsonl')
+    main(['solve', path, '-a', 'pure,mixed', '--cache-size', '4', '-o', output])
+
+    stats = json.loads(capsys.readouterr().err.split('cache: ', 1)[1])
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    record = read_records(output)[1]
+    expected = solve_game(swapped, ['pure', 'mixed'])
+    assert sorted(map(tuple, record['pure_nash'])) == sorted(map(tuple, expected['pure_nash']))
+    flatten = lambda equilibria: sorted(np.round(np.concatenate(eq), 6).tolist() for eq in equilibria)
+    assert np.allclose(flatten(record['mixed_nash']), flatten(expected['mixed_nash']), atol=1e-6)
@@ -0,0 +1,85 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from dmmrs import batch_expected_payoff_table, batch_regrets, expected_payoff_table, iter_support_profiles
+
+SHAPES = [(2, 2), (3, 4), (1, 3), (2, 3, 2), (3, 1, 2), (2, 2, 2, 2), (1, 1, 3)]
+
+
+def expected_payoff(payoff_matrices, player, strategies):
+    # The original nested loop: the payoff of every action profile weighted by its probability
+    total = 0.0
+    for profile in itertools.product(*[range(len(strategy)) for strategy in strategies]):
+        probability = 1.0
+        for p, action in enumerate(profile):
+            probability *= strategies[p][action]
+        total += probability * payoff_matrices[player][profile]
+    return total
+
+
+def loop_table(payoff_matrices, strategies):
+    table = []
+    for player, strategy in enumerate(strategies):
+        row = []
+        for action in range(len(strategy)):
+            profile = list(strategies)
+            profile[player] = np.eye(len(strategy))[action]
+            row.append(expected_payoff(payoff_matrices, player, profile))
+        table.append(np.array(row))
+    return table
+
+
+def random_game(shape, rng):
+    payoffs = [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+    # Pure and partly pure strategies too, as equilibrium candidates often are
+    strategies = [rng.dirichlet(np.ones(n)) if rng.random() < 0.7 else np.eye(n)[rng.integers(n)] for n in shape]
+    return payoffs, strategies
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_expected_payoff_table_matches_nested_loops(shape):
+    rng = np.random.default_rng(len(shape) * 7 + shape[0])
+    for _ in range(20):
+        payoffs, strategies = random_game(shape, rng)
+        table = expected_payoff_table(payoffs, strategies)
+        for row, expected in zip(table, loop_table(payoffs, strategies)):
+            assert row.shape == expected.shape
+            assert np.allclose(row, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_batched_table_and_regrets_match_nested_loops(shape):
+    rng = np.random.default_rng(len(shape) * 11 + shape[-1])
+    payoffs = [rng.uniform(-1.0, 1.0, size=shape) for _ in shape]
+    profiles = [random_game(shape, rng)[1] for _ in range(12)]
+    batches = [np.stack([profile[p] for profile in profiles]) for p in range(len(shape))]
+
+    table = batch_expected_payoff_table(payoffs, batches)
+    regrets = batch_regrets(payoffs, batches)
+    assert [rows.shape for rows in table] == [(len(profiles), n) for n in shape]
+    assert regrets.shape == (len(profiles), len(shape))
+    for b, strategies in enumerate(profiles):
+        expected = loop_table(payoffs, strategies)
+        for player, row in enumerate(expected):
+            assert np.allclose(table[player][b], row, atol=1e-12)
+            value = expected_payoff(payoffs, player, strategies)
+            assert regrets[b, player] == pytest.approx(row.max() - value, abs=1e-12)
+            # A player with one action never regrets anything
+            if shape[player] == 1:
+                assert regrets[b, player] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_pure_equilibrium_has_no_regret():
+    payoffs = [np.array([[3.0, 0.0], [5.0, 1.0]]), np.array([[3.0, 5.0], [0.0, 1.0]])]
+    batches = [np.array([[0.0, 1.0], [1.0, 0.0]]), np.array([[0.0, 1.0], [1.0, 0.0]])]
+    assert np.allclose(batch_regrets(payoffs, batches), [[0.0, 0.0], [2.0, 2.0]])
+
+
+@pytest.mark.parametrize('player_actions', [[1], [2, 3], [3, 1, 2], [2, 2, 2]])
+def test_iter_support_profiles_lists_each_profile_once(player_actions):
+    profiles = list(iter_support_profiles(player_actions))
+    assert len(profiles) == len(set(profiles)) == np.prod([2 ** n - 1 for n in player_actions])
+    sizes = [sum(len(support) for support in profile) for profile in profiles]
+    assert sizes == sorted(sizes)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from dmmrs import SymmetricGame
+
+
+def random_symmetric(n_players, n_actions, seed):
+    rng = np.random.default_rng(seed)
+    table = {}
+
+    def payoff(action, counts):
+        if (action, counts) not in table:
+            table[action, counts] = float(rng.integers(-3, 4))
+        return table[action, counts]
+
+    return SymmetricGame.from_function(n_players, n_actions, payoff)
+
+
+@pytest.mark.parametrize('n_players, n_actions', [(2, 3), (3, 2), (3, 3), (4, 2)])
+@pytest.mark.parametrize('seed', range(5))
+def test_pure_equilibria_match_the_dense_game(n_players, n_actions, seed):
+    game = random_symmetric(n_players, n_actions, seed)
+    dense = game.to_strategic_form()
+    counts = {tuple(np.bincount(profile, minlength=n_actions).tolist()) for profile in dense.find_pure_nash_equilibria()}
+    assert set(game.find_pure_nash_equilibria()) == counts
+    assert SymmetricGame.from_strategic_form(dense.payoff_matrices).payoffs.tolist() == game.payoffs.tolist()
+
+
+@pytest.mark.parametrize('n_players, n_actions', [(2, 3), (3, 2), (3, 3)])
+@pytest.mark.parametrize('seed', range(5))
+def test_symmetric_equilibria_are_equilibria_of_the_dense_game(n_players, n_actions, seed):
+    game = random_symmetric(n_players, n_actions, seed)
+    dense = game.to_strategic_form()
+    for strategy in game.find_symmetric_equilibria():
+        assert np.isclose(strategy.sum(), 1.0) and strategy.min() >= 0.0
+        assert dense._regrets(game.expand(strategy)).max() < 1e-7
+
+
+@pytest.mark.parametrize('root', [0.3, 0.5, 0.71])
+def test_two_action_tangent_roots_are_found(root):
+    # Three players and two actions: the payoff gap of the first action is (t - root)^2, which
+    # touches zero at t = root without changing sign. Its Bernstein coefficients, by the number
+    # of the other two players on the first action:
+    coefficients = {2: (1 - root) ** 2, 1: -root * (1 - root), 0: root ** 2}
+    game = SymmetricGame.from_function(3, 2, lambda action, counts: coefficients[counts[0]] if action == 0 else 0.0)
+    equilibria = game.find_symmetric_equilibria()
+    assert any(np.allclose(strategy, [root, 1 - root], atol=1e-6) for strategy in equilibria)
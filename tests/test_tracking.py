@@ -0,0 +1,58 @@
+import threading
+import time
+
+import numpy as np
+
+from dmmrs import EquilibriumTracker, StrategicFormGame
+
+
+def test_drifting_game_is_tracked():
+    rng = np.random.default_rng(0)
+    payoffs = [rng.uniform(-1.0, 1.0, size=(4, 4)) for _ in range(2)]
+    drift = [rng.uniform(-1.0, 1.0, size=(4, 4)) for _ in range(2)]
+    tracker = EquilibriumTracker()
+    statuses = []
+    for tick in range(40):
+        current = [matrix + 0.02 * tick * step for matrix, step in zip(payoffs, drift)]
+        result = tracker.update(current)
+        statuses.append(result.status)
+        assert result.status != 'expired'
+        assert StrategicFormGame(current)._regrets(result.strategies).max() < 1e-7
+        assert np.isclose(result.regret, StrategicFormGame(current)._regrets(result.strategies).max(), atol=1e-9)
+    assert statuses[0] == 'resolved'
+    # Small steps keep the support most of the time
+    assert statuses.count('tracked') > len(statuses) // 2
+
+
+def test_support_change_is_found_locally():
+    # The first game's only equilibrium mixes every action. The second subtracts 10 from player 2's
+    # action 1, which makes it strictly dominated, so every equilibrium has player 2 on action 0.
+    # Given that, players 0 and 1 face a game without pure equilibria, so the only equilibrium
+    # keeps both of them mixing: one dropped action away from the previous support, and none on it
+    payoffs = [np.array([[[3, 0], [0, -3]], [[-2, -2], [3, 3]]], dtype=float),
+               np.array([[[-3, -1], [-1, 2]], [[2, 3], [-3, -2]]], dtype=float),
+               np.array([[[-3, -3], [-1, 0]], [[3, 1], [-2, -3]]], dtype=float)]
+    tracker = EquilibriumTracker()
+    first = tracker.update(payoffs)
+    assert first.status == 'resolved' and first.supports == ((0, 1), (0, 1), (0, 1))
+
+    payoffs[2][:, :, 1] -= 10.0
+    second = tracker.update(payoffs)
+    assert second.status == 'local' and second.supports == ((0, 1), (0, 1), (0,))
+    assert np.allclose(second.strategies[0], [5 / 7, 2 / 7]) and np.allclose(second.strategies[1], [3 / 8, 5 / 8])
+    assert second.regret < 1e-9
+
+
+def test_passed_deadline_or_cancel_expires():
+    tracker = EquilibriumTracker()
+    A = np.array([[3.0, 0.0], [0.0, 3.0]])
+    tracker.update([A, A])
+    supports = tracker.supports
+    # Nothing is searched once the deadline has passed; the previous equilibrium is kept
+    result = tracker.update([A, A], deadline=time.monotonic())
+    assert result.status == 'expired' and result.supports == supports
+    cancel = threading.Event()
+    cancel.set()
+    result = tracker.update([A, A], cancel=cancel)
+    assert result.status == 'expired' and result.supports == supports
+    assert tracker.update([A, A], deadline=time.monotonic() + 60.0).status == 'tracked'